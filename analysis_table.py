@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+MathWorld Analysis Table
+========================
+Columnar storage for GameAnalysis records of very large catalogs.
+
+Scores are float32 columns, categories and suggestion lists are interned,
+and ids and titles live in UTF-8 buffers, so a million analyses take about
+60 MB instead of about 460 MB of GameAnalysis objects.  Tables save to and
+load from a single binary file.
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import json
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple, Iterable, Iterator
+
+# AnalysisTable file: magic, version, row count, section count; then each
+# section as a byte length and its payload
+_TABLE_MAGIC = b'MWAT'
+_TABLE_VERSION = 1
+_TABLE_HEADER = struct.Struct('<4sHIH')
+_SECTION_HEADER = struct.Struct('<Q')
+
+_FLOAT32 = struct.Struct('<f')
+
+@lru_cache(maxsize=65536)
+def _widen(value: float) -> float:
+    """Shortest decimal that rounds to the same float32 as `value`.
+
+    Scores are short decimals (0.7, 0.85, ...); this gives them back exactly
+    instead of as 0.699999988...
+    """
+    packed = _FLOAT32.pack(value)
+    for digits in range(1, 10):
+        candidate = float(f"{value:.{digits}g}")
+        if _FLOAT32.pack(candidate) == packed:
+            return candidate
+    return value
+
+class _StringColumn:
+    """Strings stored as one UTF-8 buffer plus end offsets."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.ends = array('I')
+
+    def append(self, text: str):
+        self.data += text.encode('utf-8')
+        self.ends.append(len(self.data))
+
+    def __getitem__(self, index: int) -> str:
+        start = self.ends[index - 1] if index else 0
+        return self.data[start:self.ends[index]].decode('utf-8')
+
+    def nbytes(self) -> int:
+        return len(self.data) + self.ends.itemsize * len(self.ends)
+
+class AnalysisRow:
+    """Read-only view of one AnalysisTable row, with GameAnalysis' attributes."""
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: 'AnalysisTable', index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def game_id(self) -> str:
+        return self._table._ids[self._index]
+
+    @property
+    def title(self) -> str:
+        return self._table._titles[self._index]
+
+    @property
+    def category(self) -> str:
+        return self._table.categories[self._table._category_codes[self._index]]
+
+    @property
+    def complexity_score(self) -> float:
+        return _widen(self._table.complexity_score[self._index])
+
+    @property
+    def educational_value(self) -> float:
+        return _widen(self._table.educational_value[self._index])
+
+    @property
+    def user_engagement(self) -> float:
+        return _widen(self._table.user_engagement[self._index])
+
+    @property
+    def code_quality(self) -> float:
+        return _widen(self._table.code_quality[self._index])
+
+    @property
+    def suggestions(self) -> List[str]:
+        table = self._table
+        return [table.suggestions[i] for i in table.suggestion_sets[table._suggestion_codes[self._index]]]
+
+    def to_analysis(self) -> Any:
+        """Copy the row out as a game_analyzer.GameAnalysis."""
+        # Imported here because game_analyzer imports this module
+        from game_analyzer import GameAnalysis
+        return GameAnalysis(self.game_id, self.title, self.category, self.complexity_score,
+                            self.educational_value, self.user_engagement, self.code_quality,
+                            self.suggestions)
+
+    def __repr__(self) -> str:
+        return f"AnalysisRow({self._index}, game_id={self.game_id!r}, title={self.title!r})"
+
+class AnalysisTable:
+    """Columnar store of GameAnalysis records for very large catalogs.
+
+    Scores are float32 `array('f')` columns, categories are small-int codes
+    into `categories`, and each row's suggestions are one code into
+    `suggestion_sets` (tuples of indexes into the shared `suggestions`
+    strings).  Ids and titles live in UTF-8 buffers.  Indexing returns
+    AnalysisRow views, which the report and recommendation methods accept
+    in place of GameAnalysis.  Scores are rounded to float32 and read back
+    as the shortest decimal with that float32 value, so short decimals such
+    as 0.85 come back exactly and others differ after about 7 digits.
+    """
+
+    SCORE_COLUMNS = ('complexity_score', 'educational_value', 'user_engagement', 'code_quality')
+
+    def __init__(self):
+        self.complexity_score = array('f')
+        self.educational_value = array('f')
+        self.user_engagement = array('f')
+        self.code_quality = array('f')
+        self.categories: List[str] = []
+        self.suggestions: List[str] = []
+        self.suggestion_sets: List[Tuple[int, ...]] = []
+        self._ids = _StringColumn()
+        self._titles = _StringColumn()
+        self._category_codes = array('H')
+        self._suggestion_codes = array('I')
+        self._category_index: Dict[str, int] = {}
+        self._suggestion_index: Dict[str, int] = {}
+        self._suggestion_set_index: Dict[Tuple[int, ...], int] = {}
+
+    @classmethod
+    def from_analyses(cls, analyses: Iterable[Any]) -> 'AnalysisTable':
+        table = cls()
+        table.extend(analyses)
+        return table
+
+    def _intern(self, value: Any, index: Dict[Any, int], values: List[Any]) -> int:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(values)
+            values.append(value)
+        return code
+
+    def append(self, analysis: Any):
+        """Add a GameAnalysis (or anything with the same attributes)."""
+        suggestion_set = tuple(self._intern(text, self._suggestion_index, self.suggestions)
+                               for text in analysis.suggestions)
+        self._category_codes.append(self._intern(analysis.category, self._category_index, self.categories))
+        self._suggestion_codes.append(self._intern(suggestion_set, self._suggestion_set_index,
+                                                   self.suggestion_sets))
+        self._ids.append(analysis.game_id)
+        self._titles.append(analysis.title)
+        self.complexity_score.append(analysis.complexity_score)
+        self.educational_value.append(analysis.educational_value)
+        self.user_engagement.append(analysis.user_engagement)
+        self.code_quality.append(analysis.code_quality)
+
+    def extend(self, analyses: Iterable[Any]):
+        for analysis in analyses:
+            self.append(analysis)
+
+    def __len__(self) -> int:
+        return len(self._category_codes)
+
+    def __getitem__(self, index: int) -> AnalysisRow:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("AnalysisTable index out of range")
+        return AnalysisRow(self, index)
+
+    def __iter__(self) -> Iterator[AnalysisRow]:
+        return (AnalysisRow(self, i) for i in range(len(self)))
+
+    def nbytes(self) -> int:
+        """Bytes held by the columns (the shared tables are not counted)."""
+        columns = [getattr(self, name) for name in self.SCORE_COLUMNS]
+        columns += [self._category_codes, self._suggestion_codes]
+        return (sum(column.itemsize * len(column) for column in columns)
+                + self._ids.nbytes() + self._titles.nbytes())
+
+    def save(self, path: str):
+        """Write the table as one binary file (see load())."""
+        meta = json.dumps({
+            'categories': self.categories,
+            'suggestions': self.suggestions,
+            'suggestion_sets': [list(codes) for codes in self.suggestion_sets]
+        }, ensure_ascii=False).encode('utf-8')
+        sections = [getattr(self, name) for name in self.SCORE_COLUMNS] + [
+            self._category_codes, self._suggestion_codes,
+            self._ids.ends, self._ids.data, self._titles.ends, self._titles.data, meta
+        ]
+        with open(path, 'wb') as f:
+            f.write(_TABLE_HEADER.pack(_TABLE_MAGIC, _TABLE_VERSION, len(self), len(sections)))
+            for section in sections:
+                if isinstance(section, array):
+                    if sys.byteorder == 'big':
+                        section = array(section.typecode, section)
+                        section.byteswap()
+                    payload = section.tobytes()
+                else:
+                    payload = bytes(section)
+                f.write(_SECTION_HEADER.pack(len(payload)))
+                f.write(payload)
+
+    @classmethod
+    def load(cls, path: str) -> 'AnalysisTable':
+        """Read a table written by save()."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < _TABLE_HEADER.size:
+            raise ValueError(f"{path} is not an analysis table ({len(data)} bytes)")
+        magic, version, rows, count = _TABLE_HEADER.unpack_from(data)
+        if magic != _TABLE_MAGIC or version != _TABLE_VERSION:
+            raise ValueError(f"{path} is not an analysis table (version {_TABLE_VERSION})")
+        if count != len(cls.SCORE_COLUMNS) + 7:
+            raise ValueError(f"{path} has {count} sections, expected {len(cls.SCORE_COLUMNS) + 7}")
+        offset = _TABLE_HEADER.size
+        payloads = []
+        for section in range(count):
+            end = offset + _SECTION_HEADER.size
+            if end > len(data):
+                raise ValueError(f"{path} is truncated in the header of section {section}")
+            (size,) = _SECTION_HEADER.unpack_from(data, offset)
+            if end + size > len(data):
+                raise ValueError(f"{path} is truncated in section {section}: "
+                                 f"{len(data) - end} of {size} bytes")
+            payloads.append(data[end:end + size])
+            offset = end + size
+
+        table = cls()
+
+        def fill(column: array, payload: bytes):
+            column.frombytes(payload)
+            if sys.byteorder == 'big':
+                column.byteswap()
+
+        for name, payload in zip(cls.SCORE_COLUMNS, payloads):
+            fill(getattr(table, name), payload)
+        (category_codes, suggestion_codes, id_ends, id_data,
+         title_ends, title_data, meta) = payloads[len(cls.SCORE_COLUMNS):]
+        fill(table._category_codes, category_codes)
+        fill(table._suggestion_codes, suggestion_codes)
+        fill(table._ids.ends, id_ends)
+        table._ids.data = bytearray(id_data)
+        fill(table._titles.ends, title_ends)
+        table._titles.data = bytearray(title_data)
+
+        meta = json.loads(meta.decode('utf-8'))
+        table.categories = meta['categories']
+        table.suggestions = meta['suggestions']
+        table.suggestion_sets = [tuple(codes) for codes in meta['suggestion_sets']]
+        table._category_index = {name: i for i, name in enumerate(table.categories)}
+        table._suggestion_index = {text: i for i, text in enumerate(table.suggestions)}
+        table._suggestion_set_index = {codes: i for i, codes in enumerate(table.suggestion_sets)}
+        if len(table) != rows:
+            raise ValueError(f"{path} is truncated: {len(table)} of {rows} rows")
+        return table
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+MathWorld Benchmarks
+====================
+Offline benchmark suite for the hot paths of the Python tools, with JSON
+baselines and a regression gate.
+
+Every input is synthetic and generated from a fixed seed: game catalogs and
+problem sets of 10 to 1M records, and script.js files of 10 KB to 100 MB.
+A run is compared against a saved baseline and fails (exit code 1) when any
+case is slower than the baseline by more than the threshold.
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional, Sequence, Tuple
+
+import crossmath_solver
+import sudoku_engine
+from game_analyzer import GameAnalyzer, synthetic_games
+from mathworld_manager import MathWorldManager
+
+RESULTS_SCHEMA_VERSION = 1
+DEFAULT_BASELINE = "benchmark_baseline.json"
+DEFAULT_THRESHOLD = 0.25
+MIN_ROUND_SECONDS = 0.2
+
+# Input sizes per profile: record counts and script.js sizes in bytes
+PROFILES = {
+    'quick': {'records': [10, 1000, 100000], 'bytes': [10_000, 1_000_000]},
+    'full': {'records': [10, 1000, 100000, 1000000], 'bytes': [10_000, 1_000_000, 10_000_000, 100_000_000]}
+}
+
+TRANSLATION_KEYS = ['startGame', 'pause', 'reset', 'gameOver', 'finalScore', 'levelReached',
+                    'playAgain', 'ready', 'categories', 'loading']
+
+def synthetic_script(size: int, seed: int = 0) -> str:
+    """Build a script.js of about `size` bytes shaped like the real one.
+
+    Half of it is the games array, a tenth the translations object and the
+    rest ordinary functions, which the parser still has to tokenize.
+    """
+    rng = random.Random(seed)
+    games = synthetic_games(max(1, size // 2 // 180), seed)
+    parts = ["let currentGame = null;\nlet gameScore = 0;\n\nconst games = ["]
+    for game in games:
+        parts.append(f"""
+    {{
+        id: '{game['id']}',
+        title: '{game['title']}',
+        category: '{game['category']}',
+        description: '{game['description']}',
+        icon: '🎮'
+    }},""")
+    parts.append("\n];\n\nconst translations = {")
+    entries = max(1, size // 10 // 3 // 40)
+    for language in ('en', 'ar', 'fr'):
+        parts.append(f"\n    {language}: {{")
+        for i in range(entries):
+            key = TRANSLATION_KEYS[i % len(TRANSLATION_KEYS)]
+            parts.append(f"\n        '{key}{i}': '{language} text {rng.randint(0, 9999)}',")
+        parts.append("\n    },")
+    parts.append("\n};\n")
+
+    text = ''.join(parts)
+    functions = []
+    length = len(text.encode('utf-8'))
+    i = 0
+    while length < size:
+        body = (f"\nfunction update{i}(value) {{\n    const total = value * {rng.randint(2, 99)} + {i};\n"
+                f"    if (total > {rng.randint(100, 999)}) {{\n        return `Score: ${{total}}`;\n    }}\n"
+                f"    return [total, 'level-{i}'].join('-');\n}}\n")
+        functions.append(body)
+        length += len(body)
+        i += 1
+    return text + ''.join(functions)
+
+# -- Benchmark cases -----------------------------------------------------------
+# Each setup takes the input size and returns a zero-argument callable; only
+# the callable is timed.
+
+def _setup_extract_games(size: int) -> Callable[[], Any]:
+    # The directory is removed once the returned callable is dropped
+    directory = tempfile.TemporaryDirectory(prefix="mathworld-bench-")
+    (Path(directory.name) / "script.js").write_text(synthetic_script(size), encoding='utf-8')
+    # A new manager per call, so its parse cache never serves the result
+    return lambda: MathWorldManager(directory.name).extract_games_from_js()
+
+def _setup_score_game(count: int) -> Callable[[], Any]:
+    analyzer = GameAnalyzer()
+    games = synthetic_games(count)
+    return lambda: [analyzer.score_game(game) for game in games]
+
+def _setup_score_batch(count: int) -> Callable[[], Any]:
+    analyzer = GameAnalyzer()
+    games = synthetic_games(count)
+    return lambda: analyzer.score_batch(games)
+
+def _setup_analyze_game(count: int) -> Callable[[], Any]:
+    analyzer = GameAnalyzer()
+    games = synthetic_games(count)
+    return lambda: [analyzer.analyze_game(game) for game in games]
+
+def _setup_random_problems(count: int) -> Callable[[], Any]:
+    manager = MathWorldManager(tempfile.gettempdir())
+    return lambda: manager.generate_random_math_problems(count, seed=0)
+
+def _setup_sudoku_check(count: int) -> Callable[[], Any]:
+    pairs = [(puzzle, sudoku_engine.solve(puzzle)) for puzzle in sudoku_engine.BROWSER_PUZZLES.values()]
+    cases = [pairs[i % len(pairs)] for i in range(count)]
+    return lambda: [sudoku_engine.check_submission(puzzle, solution) for puzzle, solution in cases]
+
+def _setup_crossmath_solve(count: int) -> Callable[[], Any]:
+    rng = random.Random(0)
+    grids = [crossmath_solver.random_grid(rng, size=3) for _ in range(count)]
+    return lambda: [crossmath_solver.solve_grid(grid, limit=2, min_value=1, max_value=9) for grid in grids]
+
+def _setup_crossmath_solve_large(count: int) -> Callable[[], Any]:
+    # 15 x 15 numbers with their operators and results: 31 x 31 = 961 cells per grid
+    grids = [crossmath_solver.random_grid(random.Random(seed), size=15) for seed in range(1, count + 1)]
+    return lambda: [crossmath_solver.solve_grid(grid, limit=2, min_value=1, max_value=9) for grid in grids]
+
+# name -> (size kind, largest size to run or None, setup)
+BENCHMARKS: Dict[str, Tuple[str, Optional[int], Callable[[int], Callable[[], Any]]]] = {
+    'extract_games_from_js': ('bytes', None, _setup_extract_games),
+    'score_game': ('records', None, _setup_score_game),
+    'score_batch': ('records', None, _setup_score_batch),
+    'analyze_game': ('records', 100000, _setup_analyze_game),
+    'generate_random_math_problems': ('records', None, _setup_random_problems),
+    'sudoku_check_submission': ('records', 100000, _setup_sudoku_check),
+    'crossmath_solve_grid': ('records', 1000, _setup_crossmath_solve),
+    'crossmath_solve_grid_961': ('records', 10, _setup_crossmath_solve_large)
+}
+
+def time_callable(func: Callable[[], Any], repeat: int = 3) -> float:
+    """Best seconds per call over `repeat` rounds.
+
+    Fast calls are looped until a round lasts MIN_ROUND_SECONDS, as timeit's
+    autorange does, so tiny inputs are not lost in timer noise.  The
+    calibration rounds double as warm-up and are not counted.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_ROUND_SECONDS or loops >= 1 << 20:
+            break
+        loops *= 10 if elapsed < MIN_ROUND_SECONDS / 10 else 2
+    best = float('inf')
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+def run_benchmarks(profile: str = 'quick', only: Optional[Sequence[str]] = None,
+                   repeat: int = 3) -> Dict[str, Any]:
+    """Run the benchmark cases of a profile; returns results in the baseline schema."""
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile: {profile}")
+    names = list(only) if only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name in names:
+        kind, largest, setup = BENCHMARKS[name]
+        for size in PROFILES[profile][kind]:
+            if largest is not None and size > largest:
+                continue
+            func = setup(size)
+            # Results and progress prints of the code under test are not wanted here
+            with contextlib.redirect_stdout(io.StringIO()):
+                seconds = time_callable(func, repeat)
+            results.setdefault(name, {})[str(size)] = {
+                'unit': kind,
+                'size': size,
+                'seconds': seconds,
+                'per_second': size / seconds if seconds else 0.0
+            }
+            print(f"  {name:<30} {_format_size(size, kind):>10} {seconds * 1000:12.3f} ms "
+                  f"{size / seconds if seconds else 0:>14,.0f} {kind}/s")
+
+    return {
+        'schema_version': RESULTS_SCHEMA_VERSION,
+        'profile': profile,
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results
+    }
+
+def _format_size(size: int, kind: str) -> str:
+    if kind == 'bytes':
+        return f"{size / 1_000_000:g} MB" if size >= 1_000_000 else f"{size / 1000:g} KB"
+    return f"{size:,}"
+
+def compare_to_baseline(current: Dict[str, Any], baseline: Dict[str, Any],
+                        threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """Cases slower than the baseline by more than `threshold` (0.25 = 25%).
+
+    Cases missing from either side are ignored.
+    """
+    regressions = []
+    for name, sizes in current['results'].items():
+        for size, result in sizes.items():
+            base = baseline.get('results', {}).get(name, {}).get(size)
+            if not base or not base['seconds']:
+                continue
+            ratio = result['seconds'] / base['seconds']
+            if ratio > 1 + threshold:
+                regressions.append({'benchmark': name, 'size': size, 'baseline_seconds': base['seconds'],
+                                    'seconds': result['seconds'], 'ratio': ratio})
+    return regressions
+
+def main():
+    """Run the benchmarks and gate on the baseline."""
+    import argparse
+    parser = argparse.ArgumentParser(description="MathWorld benchmark suite")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='quick',
+                        help="input sizes: quick (up to 100k records, 1 MB) or full (1M records, 100 MB)")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help="run only these benchmarks")
+    parser.add_argument('--repeat', type=int, default=3, help="timed rounds per case (best is kept)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the new baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument('--output', default="benchmark_results.json")
+    args = parser.parse_args()
+
+    print("⏱️  MathWorld Benchmarks")
+    print("=" * 40)
+    print(f"Profile: {args.profile}\n")
+    current = run_benchmarks(args.profile, args.only, args.repeat)
+
+    with open(args.output, 'w') as f:
+        json.dump(current, f, indent=2)
+    print(f"\n💾 Results saved to '{args.output}'")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"📌 Baseline saved to '{args.baseline}'")
+        return
+
+    if not Path(args.baseline).exists():
+        print(f"⚠️  No baseline at '{args.baseline}'; run with --save-baseline to create one")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(current, baseline, args.threshold)
+    if not regressions:
+        print(f"✅ No regressions beyond {args.threshold:.0%} against '{args.baseline}'")
+        return
+    print(f"❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+    for item in regressions:
+        print(f"  - {item['benchmark']} @ {item['size']}: {item['baseline_seconds'] * 1000:.3f} ms -> "
+              f"{item['seconds'] * 1000:.3f} ms (x{item['ratio']:.2f})")
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
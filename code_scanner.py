@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+MathWorld Code Scanner
+======================
+One-pass quality scanner for script.js, index.html and generated bundles.
+
+The file is memory-mapped and a single regular expression walks its bytes
+once.  Each pattern alternative consumes only its first (literal) byte and
+checks the rest in a lookahead, so a hit never swallows another pattern's
+hit a few bytes further on.  Only one alternative can match at a given
+offset, so the scanner refuses patterns whose literal prefixes could meet
+at the same offset (one a prefix of the other); with that, each pattern is
+counted exactly as a separate findall() would count it.  Literal
+first bytes also let the regex engine skip non-candidate bytes quickly;
+one such pass is faster than one findall() per pattern.  Line numbers come from counting
+newlines in the slice between consecutive hits, so each byte is counted
+once.
+
+Patterns work on bytes: `\\w` means [A-Za-z0-9_], which covers the
+identifiers and translation keys of the platform.
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Sequence
+
+# Issues reported with their positions
+ISSUE_KINDS = {
+    'console_log': "Found console.log statements",
+    'alert': "Found alert() statements",
+    'todo': "Found TODO/FIXME comments"
+}
+
+# Pattern name -> alternatives; each alternative starts with one literal byte
+_TRANSLATION_REST = rb'[\w\s]+[\'"]:\s*[\'"][^\'"]+[\'"]'
+_GAMES_DECLARATION_REST = rb'\s+games\s*=\s*\['
+
+SCRIPT_PATTERNS = {
+    'function': [rb'function\s+\w+'],
+    'translation': [rb"'" + _TRANSLATION_REST, rb'"' + _TRANSLATION_REST],
+    'console_log': [rb'console\.log'],
+    'alert': [rb'alert\('],
+    'todo': [rb'TODO', rb'FIXME'],
+    'translations_ref': [rb'translations'],
+    # The games array: records are counted between its declaration and `];`
+    'games_declaration': [rb'const' + _GAMES_DECLARATION_REST, rb'let' + _GAMES_DECLARATION_REST,
+                          rb'var' + _GAMES_DECLARATION_REST],
+    'game_record': [rb'\{\s*id\s*:', rb',\s*id\s*:'],
+    'statement_end': [rb'\]\s*;']
+}
+
+HTML_PATTERNS = {
+    'games_ref': [rb'g(?i:ames)', rb'G(?i:ames)'],
+    'console_log': [rb'console\.log'],
+    'alert': [rb'alert\('],
+    'todo': [rb'TODO', rb'FIXME']
+}
+
+DEFAULT_MAX_POSITIONS = 1000
+
+@dataclass
+class Issue:
+    """One issue hit; line and column are 1-based, column in bytes."""
+    kind: str
+    line: int
+    column: int
+    offset: int
+
+@dataclass
+class ScanResult:
+    """Metrics of one scanned file."""
+    path: str
+    size: int = 0
+    lines: int = 0
+    counts: Dict[str, int] = field(default_factory=dict)
+    games_count: Optional[int] = None
+    issues: List[Issue] = field(default_factory=list)
+
+    def count(self, name: str) -> int:
+        return self.counts.get(name, 0)
+
+    @property
+    def issue_messages(self) -> List[str]:
+        """Issue summaries in analyze_code_quality()'s wording."""
+        return [message for kind, message in ISSUE_KINDS.items() if self.count(kind)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+def _literal_prefix(pattern: bytes) -> bytes:
+    """The bytes every match of `pattern` starts with (escapes resolved)."""
+    prefix = bytearray()
+    i = 0
+    while i < len(pattern):
+        byte = pattern[i:i + 1]
+        if byte == b'\\' and i + 1 < len(pattern) and not pattern[i + 1:i + 2].isalnum():
+            byte, size = pattern[i + 1:i + 2], 2
+        elif byte in b'.^$*+?{}[]|()\\':
+            break
+        else:
+            size = 1
+        if pattern[i + size:i + size + 1] in (b'*', b'?', b'{'):
+            break  # The byte is optional or repeated a variable number of times
+        prefix += byte
+        i += size
+    return bytes(prefix)
+
+def _is_word_byte(byte: int) -> bool:
+    return byte == 0x5F or 0x30 <= byte <= 0x39 or 0x41 <= byte <= 0x5A or 0x61 <= byte <= 0x7A
+
+class CodeScanner:
+    """Compiled one-pass scanner for a set of named byte patterns."""
+
+    def __init__(self, patterns: Dict[str, Sequence[bytes]] = SCRIPT_PATTERNS,
+                 max_positions: int = DEFAULT_MAX_POSITIONS):
+        self.names = list(patterns)
+        prefixes = [(name, _literal_prefix(pattern)) for name, alternatives in patterns.items()
+                    for pattern in alternatives]
+        for i, (name, prefix) in enumerate(prefixes):
+            if not prefix:
+                raise ValueError(f"Pattern {name!r} does not start with a literal byte")
+            for other, other_prefix in prefixes[:i]:
+                if other != name and (prefix.startswith(other_prefix) or other_prefix.startswith(prefix)):
+                    raise ValueError(f"Patterns {other!r} and {name!r} can match at the same offset")
+        # Group i of the regex belongs to alternative i - 1
+        self.group_names: List[str] = []
+        branches = []
+        for name, alternatives in patterns.items():
+            for pattern in alternatives:
+                size = 2 if pattern.startswith(b'\\') else 1
+                branches.append(pattern[:size] + b'(?=(' + pattern[size:] + b'))')
+                self.group_names.append(name)
+        self.regex = re.compile(b'|'.join(branches))
+        self.max_positions = max_positions
+
+    def scan_bytes(self, data, path: str = '') -> ScanResult:
+        """Scan bytes (or an mmap) and return the metrics."""
+        result = ScanResult(path=path, size=len(data))
+        counts = dict.fromkeys(self.names, 0)
+        ends = dict.fromkeys(self.names, -1)
+        positions: Dict[str, int] = dict.fromkeys(ISSUE_KINDS, 0)
+        games_state = 0  # 0: before the games array, 1: inside it, 2: after it
+        games = 0
+
+        line = 1
+        line_start = 0
+        last = 0
+        group_names = self.group_names
+        for match in self.regex.finditer(data):
+            group = match.lastindex
+            name = group_names[group - 1]
+            start = match.start()
+            # Each pattern keeps findall()'s non-overlapping semantics
+            if start < ends[name]:
+                continue
+            if name == 'games_declaration' and start and _is_word_byte(data[start - 1]):
+                continue
+            ends[name] = match.end(group)
+            counts[name] += 1
+
+            if name == 'games_declaration' and games_state == 0:
+                games_state = 1
+            elif name == 'game_record' and games_state == 1:
+                games += 1
+            elif name == 'statement_end' and games_state == 1:
+                games_state = 2
+            elif name in ISSUE_KINDS:
+                newlines = data[last:start].count(b'\n')
+                if newlines:
+                    line += newlines
+                    line_start = data.rfind(b'\n', last, start) + 1
+                last = start
+                if positions[name] < self.max_positions:
+                    positions[name] += 1
+                    result.issues.append(Issue(name, line, start - line_start + 1, start))
+
+        result.lines = line + data[last:].count(b'\n')
+        result.counts = counts
+        if 'games_declaration' in counts:
+            result.games_count = games if games_state else 0
+        return result
+
+    def scan(self, path: str) -> ScanResult:
+        """Memory-map a file and scan it."""
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return self.scan_bytes(b'', str(path))
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return self.scan_bytes(data, str(path))
+
+_SCANNERS: Dict[str, CodeScanner] = {}
+
+def scanner_for(path: str) -> CodeScanner:
+    """Shared scanner for a file type (HTML patterns for .html/.htm, else script)."""
+    kind = 'html' if Path(path).suffix.lower() in ('.html', '.htm') else 'script'
+    if kind not in _SCANNERS:
+        _SCANNERS[kind] = CodeScanner(HTML_PATTERNS if kind == 'html' else SCRIPT_PATTERNS)
+    return _SCANNERS[kind]
+
+def scan_file(path: str) -> ScanResult:
+    """Scan one file with the patterns for its type."""
+    return scanner_for(path).scan(path)
+
+def scan_tree(root: str, patterns: Sequence[str] = ('*.js', '*.html'), workers: int = 1) -> Iterator[ScanResult]:
+    """Scan every matching file under `root`, optionally in worker processes."""
+    paths = sorted({str(path) for pattern in patterns for path in Path(root).rglob(pattern) if path.is_file()})
+    if workers <= 1:
+        yield from map(scan_file, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(scan_file, paths, chunksize=4)
+
+def main():
+    """Scan files or trees and print metrics and issue positions."""
+    import argparse
+    import json
+    import sys
+    parser = argparse.ArgumentParser(description="MathWorld one-pass code scanner")
+    parser.add_argument('paths', nargs='+', help="files or directories")
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--fail-on', nargs='+', choices=sorted(ISSUE_KINDS), default=[],
+                        help="exit with code 1 if any of these issues is found")
+    parser.add_argument('--json', help="write all results to this file")
+    parser.add_argument('--show', type=int, default=5, help="issue positions to print per file")
+    args = parser.parse_args()
+
+    results = []
+    for path in args.paths:
+        if os.path.isdir(path):
+            results.extend(scan_tree(path, workers=args.workers))
+        else:
+            results.append(scan_file(path))
+
+    failed = False
+    for result in results:
+        games = f", {result.games_count} games" if result.games_count else ""
+        print(f"📄 {result.path}: {result.size:,} bytes, {result.lines:,} lines, "
+              f"{result.count('function')} functions, {result.count('translation')} translations{games}")
+        for issue in result.issues[:args.show]:
+            print(f"  ⚠️  {issue.kind} at {issue.line}:{issue.column}")
+        if len(result.issues) > args.show:
+            print(f"  ... {len(result.issues) - args.show} more")
+        failed = failed or any(result.count(kind) for kind in args.fail_on)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump([result.to_dict() for result in results], f, indent=2)
+        print(f"💾 Results saved to '{args.json}'")
+    if failed:
+        print("❌ Issues found: " + ", ".join(args.fail_on))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,714 @@
+#!/usr/bin/env python3
+"""
+MathWorld CrossMath Solver
+==========================
+Integer constraint solver for CrossMath grids and equation systems.
+
+Equations such as "A + B = 15" or "? * 3 - C = 12" are parsed with the usual
+operator precedence and split into ternary constraints (x + y = z and
+x * y = z; subtraction and division are rewritten as their inverses), with
+an auxiliary variable for every intermediate result.  An equation that
+repeats a variable (A + A = B) is also kept whole as a linear sum, pruned
+with bounds consistency.  Each domain is a bitset stored in a Python int,
+relative to the variable's own lower bound, so pruning an addition is a
+handful of shifts and ORs.  Propagation runs to a fixpoint before each
+branch, the search branches on the variable with the fewest values left,
+and it enumerates every solution or proves that there is none.
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import math
+import random
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple, Any, Sequence, Union
+
+OPERATOR_ALIASES = {'×': '*', '÷': '/', '−': '-', '+': '+', '-': '-', '*': '*', '/': '/'}
+BLANK_CELLS = {'', ' ', '#', None}
+# Additions whose domains all hold more values than this are pruned on bounds only
+DENSE_LIMIT = 32
+
+_TOKEN_RE = re.compile(r'\s*(?:(\d+)|([A-Za-z_][A-Za-z0-9_]*|\?)|([-+*/×÷−=()]))')
+
+Term = Union[int, str]
+
+@dataclass
+class CrossMathResult:
+    """Outcome of a solve: every solution (up to the limit) plus search stats."""
+    solutions: List[Dict[str, int]]
+    variables: List[str]
+    complete: bool
+    nodes: int
+    elapsed: float
+
+    @property
+    def status(self) -> str:
+        """'unsat', 'unique', 'multiple' or 'truncated'.
+
+        Two solutions are enough for 'multiple' even when the search stopped
+        at its limit; 'truncated' means it stopped after a single solution,
+        so uniqueness is unknown.
+        """
+        if not self.solutions:
+            return 'unsat'
+        if len(self.solutions) >= 2:
+            return 'multiple'
+        return 'unique' if self.complete else 'truncated'
+
+    @property
+    def solvable(self) -> bool:
+        return bool(self.solutions)
+
+    @property
+    def unique(self) -> bool:
+        return self.status == 'unique'
+
+def tokenize_equation(text: str) -> List[Term]:
+    """Split an equation into ints, variable names ('?' allowed) and operators."""
+    tokens: List[Term] = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match:
+            raise ValueError(f"Unexpected character {text[pos]!r} in equation {text!r}")
+        number, name, op = match.groups()
+        if number is not None:
+            tokens.append(int(number))
+        elif name is not None:
+            tokens.append(name)
+        else:
+            tokens.append(OPERATOR_ALIASES.get(op, op))
+        pos = match.end()
+    return tokens
+
+def equations_from_grid(grid: Sequence[Sequence[Any]]) -> List[List[Term]]:
+    """Read the equations of a CrossMath grid.
+
+    Cells hold numbers, variable names, operators, '=' or a blank ('', None
+    or '#').  Every horizontal or vertical run of two or more filled cells
+    is one equation.  A '?' cell is an unknown named after its position
+    ("r2c4").
+    """
+    rows = len(grid)
+    cols = max((len(row) for row in grid), default=0)
+
+    def cell(r: int, c: int) -> Optional[Term]:
+        value = grid[r][c] if c < len(grid[r]) else None
+        if isinstance(value, str):
+            value = value.strip()
+        if value in BLANK_CELLS:
+            return None
+        if isinstance(value, int):
+            return value
+        if value == '?':
+            return f"r{r}c{c}"
+        if value.lstrip('-').isdigit() and value not in ('-', ''):
+            return int(value)
+        return OPERATOR_ALIASES.get(value, value)
+
+    runs: List[List[Tuple[int, int]]] = []
+    for r in range(rows):
+        run = []
+        for c in range(cols + 1):
+            if c < cols and cell(r, c) is not None:
+                run.append((r, c))
+            else:
+                if len(run) >= 2:
+                    runs.append(run)
+                run = []
+    for c in range(cols):
+        run = []
+        for r in range(rows + 1):
+            if r < rows and cell(r, c) is not None:
+                run.append((r, c))
+            else:
+                if len(run) >= 2:
+                    runs.append(run)
+                run = []
+
+    equations = []
+    for run in runs:
+        tokens = [cell(r, c) for r, c in run]
+        if '=' not in tokens:
+            r, c = run[0]
+            raise ValueError(f"Run starting at row {r}, column {c} has no '='")
+        equations.append(tokens)
+    return equations
+
+def _bits(mask: int) -> List[int]:
+    """Indexes of the set bits of a domain bitset."""
+    indexes = []
+    while mask:
+        bit = mask & -mask
+        indexes.append(bit.bit_length() - 1)
+        mask ^= bit
+    return indexes
+
+def _shift(mask: int, amount: int) -> int:
+    return mask << amount if amount >= 0 else mask >> -amount
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:  # Python < 3.10
+    def _popcount(mask: int) -> int:
+        return bin(mask).count('1')
+
+def _span(mask: int) -> Tuple[int, int]:
+    """Lowest and highest set bit of a non-empty bitset."""
+    return (mask & -mask).bit_length() - 1, mask.bit_length() - 1
+
+def _interval(lo: int, hi: int) -> int:
+    """Bitset with bits lo..hi set (empty if hi < lo)."""
+    lo = max(lo, 0)
+    return ((1 << (hi + 1)) - (1 << lo)) if hi >= lo else 0
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+def _add_bounds(xr: Tuple[int, int], yr: Tuple[int, int],
+                zr: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """Interval pruning of x + y = z; returns the new (x, y, z) ranges."""
+    (xlo, xhi), (ylo, yhi), (zlo, zhi) = xr, yr, zr
+    return [(max(xlo, zlo - yhi), min(xhi, zhi - ylo)),
+            (max(ylo, zlo - xhi), min(yhi, zhi - xlo)),
+            (max(zlo, xlo + ylo), min(zhi, xhi + yhi))]
+
+def _mul_bounds(xr: Tuple[int, int], yr: Tuple[int, int],
+                zr: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """Interval pruning of x * y = z; returns the new (x, y, z) ranges."""
+    (xlo, xhi), (ylo, yhi), (zlo, zhi) = xr, yr, zr
+    products = (xlo * ylo, xlo * yhi, xhi * ylo, xhi * yhi)
+    result = [xr, yr, (max(zlo, min(products)), min(zhi, max(products)))]
+    for i, (alo, ahi), (blo, bhi) in ((0, xr, yr), (1, yr, xr)):
+        # a = z / b is only bounded when b cannot be zero
+        if blo > 0 or bhi < 0:
+            quotients = [Fraction(c, d) for c in (zlo, zhi) for d in (blo, bhi)]
+            result[i] = (max(alo, math.ceil(min(quotients))), min(ahi, math.floor(max(quotients))))
+    return result
+
+def _linear_bounds(coefs: Sequence[int], ranges: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Bounds consistency for sum(coef * v) = 0; an empty range has lo > hi."""
+    terms = [(c * lo, c * hi) if c > 0 else (c * hi, c * lo) for c, (lo, hi) in zip(coefs, ranges)]
+    low = sum(lo for lo, _ in terms)
+    high = sum(hi for _, hi in terms)
+    result = []
+    for c, (lo, hi), (tlo, thi) in zip(coefs, ranges, terms):
+        # c * v must cancel whatever the other terms can add up to
+        least, most = thi - high, tlo - low
+        if c < 0:
+            least, most = most, least
+        result.append((max(lo, _ceil_div(least, c)), min(hi, most // c)))
+    return result
+
+class CrossMathSolver:
+    """Finite-domain solver for a system of CrossMath equations.
+
+    Unknowns range over [min_value, max_value].  Intermediate results start
+    from the interval implied by their operands and are narrowed by bounds
+    propagation before the bitsets are built.  A variable that still spans
+    more than `max_span` values keeps an interval domain instead, a
+    (lo, hi) tuple pruned on bounds only, and is split in halves when the
+    search branches on it.
+
+    Constraints are ('add', x, y, z) for x + y = z, ('mul', x, y, z) for
+    x * y = z and ('sum', coefs, variables) for sum(coef * v) = 0.
+    """
+
+    def __init__(self, equations: Sequence[Union[str, Sequence[Term]]], min_value: int = 0,
+                 max_value: int = 99, max_span: int = 1 << 16):
+        self.min_value = min_value
+        self.max_value = max_value
+        self.max_span = max_span
+        self.variables: List[str] = []
+        self._var_ids: Dict[str, int] = {}
+        self._const_ids: Dict[int, int] = {}
+        self._bounds: List[Tuple[int, int]] = []
+        self._nonzero: List[int] = []
+        self.constraints: List[Tuple[Any, ...]] = []
+        self._equalities: List[Tuple[int, int]] = []
+        # Each equation's top-level additive terms as (sign, var), left minus right
+        self._sums: List[List[Tuple[int, int]]] = []
+
+        for equation in equations:
+            tokens = tokenize_equation(equation) if isinstance(equation, str) else list(equation)
+            self._add_equation(tokens)
+        self._build_domains()
+
+    # -- compilation -------------------------------------------------------
+
+    def _new_var(self, lo: int, hi: int) -> int:
+        self._bounds.append((lo, hi))
+        return len(self._bounds) - 1
+
+    def _term(self, term: Term) -> int:
+        if isinstance(term, int):
+            if term not in self._const_ids:
+                self._const_ids[term] = self._new_var(term, term)
+            return self._const_ids[term]
+        if term not in self._var_ids:
+            self._var_ids[term] = self._new_var(self.min_value, self.max_value)
+            self.variables.append(term)
+        return self._var_ids[term]
+
+    def _add_equation(self, tokens: List[Term]):
+        if tokens.count('=') != 1:
+            raise ValueError(f"Equation needs exactly one '=': {tokens}")
+        split = tokens.index('=')
+        left, left_terms = self._expression(tokens[:split])
+        right, right_terms = self._expression(tokens[split + 1:])
+        self._equalities.append((left, right))
+        self._sums.append(left_terms + [(-sign, var) for sign, var in right_terms])
+
+    def _expression(self, tokens: List[Term]) -> Tuple[int, List[Tuple[int, int]]]:
+        """Compile an expression with the usual precedence.
+
+        Returns its variable and its top-level additive terms as (sign, var).
+        """
+        pos = 0
+        terms: List[Tuple[int, int]] = []
+
+        def primary() -> int:
+            nonlocal pos
+            if pos >= len(tokens):
+                raise ValueError(f"Incomplete expression: {tokens}")
+            token = tokens[pos]
+            pos += 1
+            if token == '(':
+                var = additive(nested=True)
+                if pos >= len(tokens) or tokens[pos] != ')':
+                    raise ValueError(f"Unbalanced parentheses: {tokens}")
+                pos += 1
+                return var
+            if token in OPERATOR_ALIASES.values() or token in ('=', ')'):
+                raise ValueError(f"Expected a number or unknown, got {token!r}")
+            return self._term(token)
+
+        def multiplicative() -> int:
+            nonlocal pos
+            var = primary()
+            while pos < len(tokens) and tokens[pos] in ('*', '/'):
+                op = tokens[pos]
+                pos += 1
+                var = self._binary(op, var, primary())
+            return var
+
+        def additive(nested: bool = False) -> int:
+            nonlocal pos
+            var = multiplicative()
+            if not nested:
+                terms.append((1, var))
+            while pos < len(tokens) and tokens[pos] in ('+', '-'):
+                op = tokens[pos]
+                pos += 1
+                term = multiplicative()
+                if not nested:
+                    terms.append((1 if op == '+' else -1, term))
+                var = self._binary(op, var, term)
+            return var
+
+        var = additive()
+        if pos != len(tokens):
+            raise ValueError(f"Unexpected {tokens[pos]!r} in expression {tokens}")
+        return var, terms
+
+    def _binary(self, op: str, a: int, b: int) -> int:
+        (alo, ahi), (blo, bhi) = self._bounds[a], self._bounds[b]
+        if op == '+':
+            t = self._new_var(alo + blo, ahi + bhi)
+            self.constraints.append(('add', a, b, t))
+        elif op == '-':
+            t = self._new_var(alo - bhi, ahi - blo)
+            self.constraints.append(('add', t, b, a))
+        elif op == '*':
+            products = (alo * blo, alo * bhi, ahi * blo, ahi * bhi)
+            t = self._new_var(min(products), max(products))
+            self.constraints.append(('mul', a, b, t))
+        else:
+            # Exact division: a / b = t  <=>  t * b = a with b != 0
+            magnitude = max(abs(alo), abs(ahi))
+            lo = 0 if alo >= 0 and blo >= 0 else -magnitude
+            t = self._new_var(lo, magnitude)
+            self.constraints.append(('mul', t, b, a))
+            self._nonzero.append(b)
+        return t
+
+    def _build_domains(self):
+        # Merge the two sides of each '=' so they share one variable
+        parent = list(range(len(self._bounds)))
+
+        def find(v: int) -> int:
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            return v
+
+        for a, b in self._equalities:
+            parent[find(a)] = find(b)
+
+        # Number the merged variables densely and intersect their ranges
+        dense: Dict[int, int] = {}
+        self._root = [dense.setdefault(find(v), len(dense)) for v in range(len(self._bounds))]
+        bounds = [(float('-inf'), float('inf'))] * len(dense)
+        for v, (lo, hi) in enumerate(self._bounds):
+            rlo, rhi = bounds[self._root[v]]
+            bounds[self._root[v]] = (max(rlo, lo), min(rhi, hi))
+        self.constraints = [(kind, self._root[x], self._root[y], self._root[z])
+                            for kind, x, y, z in self.constraints]
+        for terms in self._sums:
+            coefs: Dict[int, int] = {}
+            for sign, v in terms:
+                coefs[self._root[v]] = coefs.get(self._root[v], 0) + sign
+            coefs = {v: coef for v, coef in coefs.items() if coef}
+            # With distinct terms the chain of add constraints is already as strong;
+            # a repeated variable (A + A = B) is only fully pruned by the whole sum
+            if coefs and len(coefs) < len(terms):
+                self.constraints.append(('sum', tuple(coefs.values()), tuple(coefs)))
+        self._scopes = [constraint[2] if constraint[0] == 'sum' else constraint[1:]
+                        for constraint in self.constraints]
+        self._watchers: Dict[int, List[int]] = {}
+        for index, scope in enumerate(self._scopes):
+            for v in set(scope):
+                self._watchers.setdefault(v, []).append(index)
+
+        feasible = self._tighten_bounds(bounds)
+        self._wide = [feasible and hi - lo + 1 > self.max_span for lo, hi in bounds]
+        self._nonzero_roots = {self._root[v] for v in self._nonzero}
+        # Bit i of a bitset domain stands for the value base + i
+        if feasible:
+            self._base = [lo for lo, _ in bounds]
+            domains = [(lo, hi) if wide else (1 << (hi - lo + 1)) - 1
+                       for (lo, hi), wide in zip(bounds, self._wide)]
+        else:
+            self._base = [0] * len(bounds)
+            domains = [0] * len(bounds)
+        for root in self._nonzero_roots:
+            if not domains[root]:
+                continue
+            if self._wide[root]:
+                if not self._restrict(domains, root, *domains[root]):
+                    domains[root] = 0
+            elif self._base[root] <= 0:
+                domains[root] &= ~(1 << -self._base[root])
+        self._domains = domains
+
+    def _tighten_bounds(self, bounds: List[Tuple[int, int]]) -> bool:
+        """Interval propagation to a fixpoint (or a revision budget); False if empty."""
+        if any(lo > hi for lo, hi in bounds):
+            return False
+        queue = deque(range(len(self.constraints)))
+        queued = set(queue)
+        budget = 100 * len(self.constraints) + 100
+        while queue and budget:
+            budget -= 1
+            index = queue.popleft()
+            queued.discard(index)
+            constraint = self.constraints[index]
+            if constraint[0] == 'sum':
+                _, coefs, variables = constraint
+                new = dict(zip(variables, _linear_bounds(coefs, [bounds[v] for v in variables])))
+            else:
+                kind, x, y, z = constraint
+                prune = _add_bounds if kind == 'add' else _mul_bounds
+                new = {}
+                # A variable repeated in the constraint keeps the tightest of its ranges
+                for v, (lo, hi) in zip((x, y, z), prune(bounds[x], bounds[y], bounds[z])):
+                    old_lo, old_hi = new.get(v, bounds[v])
+                    new[v] = (max(lo, old_lo), min(hi, old_hi))
+            for v, (lo, hi) in new.items():
+                if lo > hi:
+                    return False
+                if (lo, hi) != bounds[v]:
+                    bounds[v] = (lo, hi)
+                    for other in self._watchers[v]:
+                        if other not in queued:
+                            queue.append(other)
+                            queued.add(other)
+        return True
+
+    # -- propagation -------------------------------------------------------
+
+    def _range(self, domains: List[Any], v: int) -> Tuple[int, int]:
+        """Smallest and largest value left in a non-empty domain."""
+        if self._wide[v]:
+            return domains[v]
+        lo, hi = _span(domains[v])
+        return lo + self._base[v], hi + self._base[v]
+
+    def _restrict(self, domains: List[Any], v: int, lo: int, hi: int) -> bool:
+        """Intersect a domain with [lo, hi]; returns False if it empties."""
+        if not self._wide[v]:
+            domains[v] &= _interval(lo - self._base[v], hi - self._base[v])
+            return bool(domains[v])
+        old_lo, old_hi = domains[v]
+        lo, hi = max(lo, old_lo), min(hi, old_hi)
+        if v in self._nonzero_roots:
+            # Only an endpoint of an interval can be excluded
+            if lo == 0:
+                lo = 1
+            if hi == 0:
+                hi = -1
+        if lo > hi:
+            return False
+        domains[v] = (lo, hi)
+        return True
+
+    def _difference(self, dz: int, dy: int, delta: int) -> int:
+        """Bitset of {z - y}: bits k of z and j of y give bit k - j + delta.
+
+        Walks whichever of the two sets is smaller.
+        """
+        result = 0
+        if _popcount(dz) < _popcount(dy):
+            # Walk z against y mirrored around bit `width - 1` (bit j moves to width - 1 - j)
+            width = dy.bit_length()
+            mirrored = int(format(dy, f'0{width}b')[::-1], 2)
+            for k in _bits(dz):
+                result |= _shift(mirrored, k + delta - width + 1)
+        else:
+            for j in _bits(dy):
+                result |= _shift(dz, delta - j)
+        return result
+
+    def _revise_add(self, domains: List[Any], x: int, y: int, z: int) -> bool:
+        """Prune x + y = z; returns False if a domain empties."""
+        wide = self._wide
+        if wide[x] or wide[y] or wide[z]:
+            return self._revise_bounds(_add_bounds, domains, x, y, z)
+        dx, dy, dz = domains[x], domains[y], domains[z]
+        if min(_popcount(dx), _popcount(dy), _popcount(dz)) > DENSE_LIMIT:
+            return self._revise_bounds(_add_bounds, domains, x, y, z)
+        # Bits i of x and j of y give bit i + j - delta of z
+        delta = self._base[z] - self._base[x] - self._base[y]
+        small, other = (dx, dy) if _popcount(dx) <= _popcount(dy) else (dy, dx)
+        sums = 0
+        for i in _bits(small):
+            sums |= _shift(other, i - delta)
+        dz &= sums
+        if not dz:
+            return False
+        # x in z - y and y in z - x
+        dx &= self._difference(dz, dy, delta)
+        if not dx:
+            return False
+        dy &= self._difference(dz, dx, delta)
+        if not dy:
+            return False
+        domains[x], domains[y], domains[z] = dx, dy, dz
+        return True
+
+    def _revise_bounds(self, prune: Any, domains: List[Any], x: int, y: int, z: int) -> bool:
+        """Bounds-only pruning with _add_bounds or _mul_bounds.
+
+        Used for interval domains, and for additions while all three
+        domains are large.
+        """
+        ranges = [self._range(domains, v) for v in (x, y, z)]
+        for v, (lo, hi) in zip((x, y, z), prune(*ranges)):
+            if not self._restrict(domains, v, lo, hi):
+                return False
+        return True
+
+    def _revise_sum(self, domains: List[Any], coefs: Tuple[int, ...], variables: Tuple[int, ...]) -> bool:
+        """Bounds consistency on a whole equation, sum(coef * v) = 0."""
+        ranges = [self._range(domains, v) for v in variables]
+        for v, old, (lo, hi) in zip(variables, ranges, _linear_bounds(coefs, ranges)):
+            if (lo, hi) != old and not self._restrict(domains, v, lo, hi):
+                return False
+        return True
+
+    def _revise_mul(self, domains: List[Any], x: int, y: int, z: int) -> bool:
+        """Prune x * y = z by enumerating the cheapest pair of domains."""
+        if self._wide[x] or self._wide[y] or self._wide[z]:
+            return self._revise_bounds(_mul_bounds, domains, x, y, z)
+        bx, by, bz = self._base[x], self._base[y], self._base[z]
+        xs = [i + bx for i in _bits(domains[x])]
+        ys = [i + by for i in _bits(domains[y])]
+        zs = [i + bz for i in _bits(domains[z])]
+        nx = ny = nz = 0
+        if len(xs) * len(ys) <= min(len(xs), len(ys)) * len(zs):
+            zset = set(zs)
+            for a in xs:
+                for b in ys:
+                    if a * b in zset:
+                        nx |= 1 << (a - bx)
+                        ny |= 1 << (b - by)
+                        nz |= 1 << (a * b - bz)
+        else:
+            # Walk the smaller factor domain against z and derive the other factor
+            swap = len(ys) < len(xs)
+            first, second = (ys, xs) if swap else (xs, ys)
+            b_first, b_second = (by, bx) if swap else (bx, by)
+            second_set = set(second)
+            n_first = n_second = 0
+            for a in first:
+                for c in zs:
+                    if a == 0:
+                        if c == 0 and second:
+                            n_first |= 1 << -b_first
+                            nz |= 1 << -bz
+                            for b in second:
+                                n_second |= 1 << (b - b_second)
+                        continue
+                    if c % a == 0 and c // a in second_set:
+                        n_first |= 1 << (a - b_first)
+                        n_second |= 1 << (c // a - b_second)
+                        nz |= 1 << (c - bz)
+            nx, ny = (n_second, n_first) if swap else (n_first, n_second)
+        if not (nx and ny and nz):
+            return False
+        domains[x] &= nx
+        domains[y] &= ny
+        domains[z] &= nz
+        return True
+
+    def _propagate(self, domains: List[Any], queue: deque) -> bool:
+        queued = set(queue)
+        revisers = {'add': self._revise_add, 'mul': self._revise_mul, 'sum': self._revise_sum}
+        while queue:
+            index = queue.popleft()
+            queued.discard(index)
+            constraint = self.constraints[index]
+            scope = self._scopes[index]
+            before = [domains[v] for v in scope]
+            if not revisers[constraint[0]](domains, *constraint[1:]):
+                return False
+            for v, old in zip(scope, before):
+                if domains[v] != old:
+                    # A single revision is not a fixpoint (and variables can repeat
+                    # within a constraint), so the constraint itself is requeued too
+                    for other in self._watchers[v]:
+                        if other not in queued:
+                            queue.append(other)
+                            queued.add(other)
+        return True
+
+    # -- search ------------------------------------------------------------
+
+    def solve(self, limit: Optional[int] = None) -> CrossMathResult:
+        """Find all solutions (or the first `limit`) over the named unknowns."""
+        start = time.perf_counter()
+        solutions: List[Dict[str, int]] = []
+        nodes = 0
+        named = [self._root[self._var_ids[name]] for name in self.variables]
+        wide = self._wide
+        complete = True
+
+        domains = list(self._domains)
+        if all(domains) and self._propagate(domains, deque(range(len(self.constraints)))):
+            stack = [domains]
+            while stack:
+                domains = stack.pop()
+                nodes += 1
+                branch = -1
+                best = 0
+                for v, mask in enumerate(domains):
+                    if wide[v]:
+                        size = mask[1] - mask[0] + 1
+                    elif mask & (mask - 1):
+                        size = _popcount(mask)
+                    else:
+                        continue
+                    if size > 1 and (branch < 0 or size < best):
+                        branch, best = v, size
+                        if size == 2:
+                            break
+                if branch < 0:
+                    solutions.append({
+                        name: domains[v][0] if wide[v] else self._base[v] + domains[v].bit_length() - 1
+                        for name, v in zip(self.variables, named)
+                    })
+                    if limit is not None and len(solutions) >= limit:
+                        complete = not stack
+                        break
+                    continue
+                # Push in reverse so smaller values are explored first
+                if wide[branch]:
+                    lo, hi = domains[branch]
+                    middle = (lo + hi) // 2
+                    parts = [(middle + 1, hi), (lo, middle)]
+                else:
+                    parts = [(self._base[branch] + i,) * 2 for i in reversed(_bits(domains[branch]))]
+                for lo, hi in parts:
+                    child = list(domains)
+                    if (self._restrict(child, branch, lo, hi)
+                            and self._propagate(child, deque(self._watchers.get(branch, [])))):
+                        stack.append(child)
+
+        return CrossMathResult(
+            solutions=solutions,
+            variables=list(self.variables),
+            complete=complete,
+            nodes=nodes,
+            elapsed=time.perf_counter() - start
+        )
+
+def solve_equations(equations: Sequence[Union[str, Sequence[Term]]], limit: Optional[int] = None,
+                    min_value: int = 0, max_value: int = 99) -> CrossMathResult:
+    """Solve a list of equation strings such as ["A + B = 15", "A - B = 3"]."""
+    return CrossMathSolver(equations, min_value, max_value).solve(limit)
+
+def solve_grid(grid: Sequence[Sequence[Any]], limit: Optional[int] = None,
+               min_value: int = 0, max_value: int = 99) -> CrossMathResult:
+    """Solve every equation of a CrossMath grid (see equations_from_grid)."""
+    return CrossMathSolver(equations_from_grid(grid), min_value, max_value).solve(limit)
+
+def evaluate(tokens: Sequence[Term]) -> int:
+    """Evaluate a fully known expression with the usual precedence."""
+    terms: List[int] = []
+    ops: List[str] = []
+    value = tokens[0]
+    for op, operand in zip(tokens[1::2], tokens[2::2]):
+        if op == '*':
+            value *= operand
+        elif op == '/':
+            value //= operand
+        else:
+            terms.append(value)
+            ops.append(op)
+            value = operand
+    terms.append(value)
+    total = terms[0]
+    for op, term in zip(ops, terms[1:]):
+        total = total + term if op == '+' else total - term
+    return total
+
+def random_grid(rng: random.Random, size: int = 3, hidden: float = 0.5, max_value: int = 9,
+                operators: str = '+-*') -> List[List[str]]:
+    """Build a random CrossMath grid with `size` x `size` number cells.
+
+    Numbers sit on even rows and columns with operators between them; each
+    row and column ends in '=' and its result.  A `hidden` fraction of the
+    numbers is replaced by '?'.  Used for benchmarks and solver checks.
+    """
+    numbers = [[rng.randint(1, max_value) for _ in range(size)] for _ in range(size)]
+    row_ops = [[rng.choice(operators) for _ in range(size - 1)] for _ in range(size)]
+    col_ops = [[rng.choice(operators) for _ in range(size)] for _ in range(size - 1)]
+
+    width = 2 * size + 1
+    grid = [[''] * width for _ in range(width)]
+    for r in range(size):
+        for c in range(size):
+            grid[2 * r][2 * c] = '?' if rng.random() < hidden else str(numbers[r][c])
+            if c < size - 1:
+                grid[2 * r][2 * c + 1] = row_ops[r][c]
+            if r < size - 1:
+                grid[2 * r + 1][2 * c] = col_ops[r][c]
+        row_tokens = [numbers[r][0]]
+        for c in range(1, size):
+            row_tokens += [row_ops[r][c - 1], numbers[r][c]]
+        grid[2 * r][width - 2] = '='
+        grid[2 * r][width - 1] = str(evaluate(row_tokens))
+    for c in range(size):
+        col_tokens = [numbers[0][c]]
+        for r in range(1, size):
+            col_tokens += [col_ops[r - 1][c], numbers[r][c]]
+        grid[width - 2][2 * c] = '='
+        grid[width - 1][2 * c] = str(evaluate(col_tokens))
+    return grid
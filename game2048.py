@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+MathWorld 2048 Simulator
+========================
+Bitboard 2048 engine for measuring how hard the `2048-game` really is.
+
+The 4x4 board is one 64-bit integer: each cell is a 4-bit exponent (0 for
+empty, 1 for a 2 tile, 2 for a 4 ...), row r in bits 16r..16r+15 and column c
+in nibble c of its row.  Every possible 16-bit row is moved once up front,
+so a move is four table lookups (columns go through a bitboard transpose).
+Rules follow script.js: a new tile is a 2 with probability 0.9, otherwise a
+4, and each tile merges at most once per move.
+
+Random and greedy playouts run on NumPy arrays of boards, thousands of games
+per step; expectimax runs per board.  Playouts are sharded across processes
+and summarized as score, max-tile and game-length distributions.
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Any, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the batch playout engine needs it
+    np = None
+
+MOVES = ['up', 'down', 'left', 'right']
+POLICIES = ['random', 'greedy', 'expectimax']
+GOAL_TILE = 2048
+ROW_MASK = 0xFFFF
+
+# Row heuristic weights (empty cells, merges, monotonicity and tile sums)
+HEURISTIC_WEIGHTS = {
+    'lost_penalty': 200000.0,
+    'monotonicity_power': 4.0,
+    'monotonicity': 47.0,
+    'sum_power': 3.5,
+    'sum': 11.0,
+    'merges': 700.0,
+    'empty': 270.0
+}
+
+class _Tables:
+    """Move, score and heuristic lookup tables for all 65536 rows."""
+
+    def __init__(self):
+        size = 1 << 16
+        self.left = [0] * size
+        self.right = [0] * size
+        self.score = [0] * size
+        self.heuristic = [0.0] * size
+        w = HEURISTIC_WEIGHTS
+        for row in range(size):
+            line = [(row >> (4 * i)) & 0xF for i in range(4)]
+            moved, gained = _slide(line)
+            self.left[row] = _pack_row(moved)
+            self.score[row] = gained
+            self.right[row] = _pack_row(_slide(line[::-1])[0][::-1])
+
+            empty = line.count(0)
+            total = sum(rank ** w['sum_power'] for rank in line)
+            merges = 0
+            previous = 0
+            counter = 0
+            for rank in line:
+                if rank == 0:
+                    continue
+                if previous == rank:
+                    counter += 1
+                elif counter > 0:
+                    merges += 1 + counter
+                    counter = 0
+                previous = rank
+            if counter > 0:
+                merges += 1 + counter
+            mono_left = mono_right = 0.0
+            for a, b in zip(line, line[1:]):
+                if a > b:
+                    mono_left += a ** w['monotonicity_power'] - b ** w['monotonicity_power']
+                else:
+                    mono_right += b ** w['monotonicity_power'] - a ** w['monotonicity_power']
+            self.heuristic[row] = (w['lost_penalty'] + w['empty'] * empty + w['merges'] * merges
+                                   - w['monotonicity'] * min(mono_left, mono_right) - w['sum'] * total)
+
+def _slide(line: List[int]) -> Tuple[List[int], int]:
+    """Slide one row towards index 0; returns (new row, score gained)."""
+    tiles = [rank for rank in line if rank]
+    result = []
+    gained = 0
+    i = 0
+    while i < len(tiles):
+        if i + 1 < len(tiles) and tiles[i] == tiles[i + 1] and tiles[i] < 15:
+            merged = tiles[i] + 1
+            result.append(merged)
+            gained += 1 << merged
+            i += 2
+        else:
+            result.append(tiles[i])
+            i += 1
+    return result + [0] * (4 - len(result)), gained
+
+def _pack_row(line: List[int]) -> int:
+    return line[0] | (line[1] << 4) | (line[2] << 8) | (line[3] << 12)
+
+@lru_cache(maxsize=None)
+def tables() -> _Tables:
+    """Build the row tables once per process (about a second)."""
+    return _Tables()
+
+# -- Scalar engine -------------------------------------------------------------
+
+def transpose(board: int) -> int:
+    """Swap rows and columns of a bitboard."""
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+def _move_rows(board: int, table: List[int], score: List[int]) -> Tuple[int, int]:
+    r0 = board & ROW_MASK
+    r1 = (board >> 16) & ROW_MASK
+    r2 = (board >> 32) & ROW_MASK
+    r3 = board >> 48
+    return (table[r0] | (table[r1] << 16) | (table[r2] << 32) | (table[r3] << 48),
+            score[r0] + score[r1] + score[r2] + score[r3])
+
+def move(board: int, direction: str) -> Tuple[int, int]:
+    """Apply a move; returns (new board, score gained).  Unchanged board = illegal move."""
+    t = tables()
+    if direction == 'left':
+        return _move_rows(board, t.left, t.score)
+    if direction == 'right':
+        return _move_rows(board, t.right, t.score)
+    moved, gained = _move_rows(transpose(board), t.left if direction == 'up' else t.right, t.score)
+    return transpose(moved), gained
+
+def empty_cells(board: int) -> List[int]:
+    """Nibble indexes (4 * row + col) of the empty cells."""
+    return [i for i in range(16) if not (board >> (4 * i)) & 0xF]
+
+def spawn_tile(board: int, rng: random.Random) -> int:
+    """Put a 2 (p=0.9) or a 4 on a random empty cell, as script.js addRandomTile does."""
+    empty = empty_cells(board)
+    if not empty:
+        return board
+    position = rng.choice(empty)
+    return board | ((1 if rng.random() < 0.9 else 2) << (4 * position))
+
+def max_tile(board: int) -> int:
+    rank = max((board >> (4 * i)) & 0xF for i in range(16))
+    return 1 << rank if rank else 0
+
+def to_grid(board: int) -> List[List[int]]:
+    """Bitboard to the browser's grid of tile values."""
+    grid = []
+    for r in range(4):
+        row = []
+        for c in range(4):
+            rank = (board >> (16 * r + 4 * c)) & 0xF
+            row.append(1 << rank if rank else 0)
+        grid.append(row)
+    return grid
+
+def from_grid(grid: Sequence[Sequence[int]]) -> int:
+    """The browser's grid of tile values to a bitboard."""
+    board = 0
+    for r in range(4):
+        for c in range(4):
+            value = grid[r][c]
+            if value:
+                board |= (value.bit_length() - 1) << (16 * r + 4 * c)
+    return board
+
+def heuristic(board: int) -> float:
+    h = tables().heuristic
+    cols = transpose(board)
+    return (h[board & ROW_MASK] + h[(board >> 16) & ROW_MASK] + h[(board >> 32) & ROW_MASK] + h[board >> 48]
+            + h[cols & ROW_MASK] + h[(cols >> 16) & ROW_MASK] + h[(cols >> 32) & ROW_MASK] + h[cols >> 48])
+
+def _chance_value(board: int, depth: int, cache: Dict[Tuple[int, int], float]) -> float:
+    if depth <= 1:
+        return heuristic(board)
+    key = (board, depth)
+    if key in cache:
+        return cache[key]
+    empty = empty_cells(board)
+    if not empty:
+        return heuristic(board)
+    total = 0.0
+    for position in empty:
+        shift = 4 * position
+        total += 0.9 * _max_value(board | (1 << shift), depth - 1, cache)
+        total += 0.1 * _max_value(board | (2 << shift), depth - 1, cache)
+    value = total / len(empty)
+    cache[key] = value
+    return value
+
+def _max_value(board: int, depth: int, cache: Dict[Tuple[int, int], float]) -> float:
+    best = 0.0
+    for direction in MOVES:
+        moved, _ = move(board, direction)
+        if moved != board:
+            best = max(best, _chance_value(moved, depth, cache))
+    return best
+
+def expectimax_move(board: int, depth: int = 2) -> Optional[str]:
+    """Best move by expectimax over tile spawns, `depth` player moves deep."""
+    best_move = None
+    best_value = -math.inf
+    cache: Dict[Tuple[int, int], float] = {}
+    for direction in MOVES:
+        moved, _ = move(board, direction)
+        if moved == board:
+            continue
+        value = _chance_value(moved, depth, cache)
+        if value > best_value:
+            best_move, best_value = direction, value
+    return best_move
+
+def play_game(rng: random.Random, policy: str = 'random', depth: int = 2) -> Tuple[int, int, int]:
+    """Play one game to the end; returns (score, max tile, moves)."""
+    board = spawn_tile(spawn_tile(0, rng), rng)
+    score = moves = 0
+    while True:
+        if policy == 'expectimax':
+            direction = expectimax_move(board, depth)
+            if direction is None:
+                break
+            board, gained = move(board, direction)
+        else:
+            options = [(direction,) + move(board, direction) for direction in MOVES]
+            options = [option for option in options if option[1] != board]
+            if not options:
+                break
+            if policy == 'greedy':
+                best = max(heuristic(option[1]) for option in options)
+                options = [option for option in options if heuristic(option[1]) == best]
+            _, board, gained = rng.choice(options)
+        score += gained
+        moves += 1
+        board = spawn_tile(board, rng)
+    return score, max_tile(board), moves
+
+# -- NumPy batch engine --------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _numpy_tables():
+    t = tables()
+    return (np.array(t.left, dtype=np.uint64), np.array(t.right, dtype=np.uint64),
+            np.array(t.score, dtype=np.int64), np.array(t.heuristic, dtype=np.float64))
+
+def _transpose_batch(boards):
+    u = np.uint64
+    a = ((boards & u(0xF0F00F0FF0F00F0F)) | ((boards & u(0x0000F0F00000F0F0)) << u(12))
+         | ((boards & u(0x0F0F00000F0F0000)) >> u(12)))
+    return ((a & u(0xFF00FF0000FF00FF)) | ((a & u(0x00FF00FF00000000)) >> u(24))
+            | ((a & u(0x00000000FF00FF00)) << u(24)))
+
+def _rows_batch(boards):
+    u = np.uint64
+    return [((boards >> u(16 * r)) & u(ROW_MASK)).astype(np.intp) for r in range(4)]
+
+def _move_batch(boards, table, scores):
+    rows = _rows_batch(boards)
+    moved = table[rows[0]] | (table[rows[1]] << np.uint64(16)) | (table[rows[2]] << np.uint64(32)) \
+        | (table[rows[3]] << np.uint64(48))
+    return moved, scores[rows[0]] + scores[rows[1]] + scores[rows[2]] + scores[rows[3]]
+
+def _heuristic_batch(boards, heur):
+    rows = _rows_batch(boards) + _rows_batch(_transpose_batch(boards))
+    return sum(heur[row] for row in rows)
+
+def _spawn_batch(boards, gen):
+    shifts = np.arange(0, 64, 4, dtype=np.uint64)
+    empty = ((boards[:, None] >> shifts) & np.uint64(0xF)) == 0
+    counts = empty.sum(axis=1)
+    has_room = counts > 0
+    pick = np.floor(gen.random(len(boards)) * np.maximum(counts, 1)).astype(np.int64)
+    position = np.argmax(np.cumsum(empty, axis=1) > pick[:, None], axis=1).astype(np.uint64)
+    tile = np.where(gen.random(len(boards)) < 0.9, 1, 2).astype(np.uint64)
+    return np.where(has_room, boards | (tile << (np.uint64(4) * position)), boards)
+
+def play_batch(count: int, policy: str = 'random', seed: Any = 0) -> Dict[str, Any]:
+    """Play `count` games at once with the random or greedy policy (NumPy).
+
+    Returns int64 arrays `scores`, `max_tiles` and `moves`.
+    """
+    if np is None:
+        raise ImportError("play_batch requires NumPy: pip install numpy")
+    if policy not in ('random', 'greedy'):
+        raise ValueError(f"Batch playouts support 'random' and 'greedy', not {policy!r}")
+    left, right, score_table, heur = _numpy_tables()
+    gen = np.random.default_rng(seed)
+
+    boards = _spawn_batch(_spawn_batch(np.zeros(count, dtype=np.uint64), gen), gen)
+    index = np.arange(count)
+    scores = np.zeros(count, dtype=np.int64)
+    moves = np.zeros(count, dtype=np.int64)
+    final_boards = np.zeros(count, dtype=np.uint64)
+
+    while len(boards):
+        transposed = _transpose_batch(boards)
+        up, up_score = _move_batch(transposed, left, score_table)
+        down, down_score = _move_batch(transposed, right, score_table)
+        results = np.stack([_transpose_batch(up), _transpose_batch(down),
+                            *(_move_batch(boards, table, score_table)[0] for table in (left, right))])
+        gained = np.stack([up_score, down_score,
+                           *(_move_batch(boards, table, score_table)[1] for table in (left, right))])
+        legal = results != boards
+
+        alive = legal.any(axis=0)
+        if not alive.all():
+            finished = ~alive
+            final_boards[index[finished]] = boards[finished]
+            boards, index, results, gained, legal = (boards[alive], index[alive], results[:, alive],
+                                                     gained[:, alive], legal[:, alive])
+            if not len(boards):
+                break
+
+        # Random tie-breaking keys; greedy adds them below the heuristic's resolution
+        keys = gen.random(legal.shape)
+        if policy == 'greedy':
+            keys = np.stack([_heuristic_batch(result, heur) for result in results]) + keys * 1e-3
+        keys[~legal] = -np.inf
+        choice = np.argmax(keys, axis=0)
+        columns = np.arange(len(boards))
+        boards = _spawn_batch(results[choice, columns], gen)
+        scores[index] += gained[choice, columns]
+        moves[index] += 1
+
+    ranks = ((final_boards[:, None] >> np.arange(0, 64, 4, dtype=np.uint64)) & np.uint64(0xF)).max(axis=1)
+    return {
+        'scores': scores,
+        'max_tiles': np.left_shift(1, ranks.astype(np.int64)),
+        'moves': moves
+    }
+
+# -- Parallel playouts and statistics ----------------------------------------
+
+def _playout_shard(policy: str, count: int, seed: int, shard: int, depth: int) -> Dict[str, List[int]]:
+    if np is not None and policy in ('random', 'greedy'):
+        result = play_batch(count, policy, seed=[seed, shard])
+        return {key: values.tolist() for key, values in result.items()}
+    rng = random.Random(f"{seed}:{shard}")
+    games = [play_game(rng, policy, depth) for _ in range(count)]
+    return {
+        'scores': [game[0] for game in games],
+        'max_tiles': [game[1] for game in games],
+        'moves': [game[2] for game in games]
+    }
+
+def run_playouts(games: int, policy: str = 'random', workers: int = 1, seed: int = 0,
+                 shard_size: Optional[int] = None, depth: int = 2) -> Dict[str, Any]:
+    """Play `games` games split into seeded shards over `workers` processes.
+
+    Results depend only on the seed and shard size, not on the worker count.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    if shard_size is None:
+        shard_size = 20000 if policy != 'expectimax' else 4
+    shards = [(i, min(shard_size, games - start)) for i, start in enumerate(range(0, games, shard_size))]
+
+    start_time = time.perf_counter()
+    if workers <= 1:
+        parts = [_playout_shard(policy, count, seed, i, depth) for i, count in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_playout_shard, policy, count, seed, i, depth) for i, count in shards]
+            parts = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start_time
+
+    merged = {key: [value for part in parts for value in part[key]] for key in ('scores', 'max_tiles', 'moves')}
+    merged.update({'policy': policy, 'games': games, 'seconds': elapsed})
+    return merged
+
+def _percentiles(values: List[int]) -> Dict[str, float]:
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+
+    def pick(fraction: float) -> int:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    return {
+        'min': ordered[0], 'p10': pick(0.1), 'p50': pick(0.5), 'p90': pick(0.9), 'max': ordered[-1],
+        'mean': sum(ordered) / len(ordered)
+    }
+
+def playout_stats(playouts: Dict[str, Any], goal: int = GOAL_TILE) -> Dict[str, Any]:
+    """Summarize run_playouts() output into distributions."""
+    games = len(playouts['scores'])
+    tile_counts: Dict[int, int] = {}
+    for tile in playouts['max_tiles']:
+        tile_counts[tile] = tile_counts.get(tile, 0) + 1
+    seconds = playouts.get('seconds') or 0.0
+    return {
+        'policy': playouts.get('policy'),
+        'games': games,
+        'score': _percentiles(playouts['scores']),
+        'moves': _percentiles(playouts['moves']),
+        'max_tile': {tile: count / games for tile, count in sorted(tile_counts.items())},
+        'goal_rate': sum(count for tile, count in tile_counts.items() if tile >= goal) / games if games else 0.0,
+        'games_per_minute': games / seconds * 60 if seconds else 0.0,
+        'moves_per_second': sum(playouts['moves']) / seconds if seconds else 0.0
+    }
+
+def measured_complexity(stats: Dict[str, Any], goal: int = GOAL_TILE) -> float:
+    """Complexity on GameAnalyzer's 0-1 scale from a max-tile distribution.
+
+    It is the share of the road from the starting 4 tile to the goal tile
+    (in doublings) that the simulated player does not cover on average.
+    """
+    start = 2.0
+    span = math.log2(goal) - start
+    progress = sum(share * (min(math.log2(tile), math.log2(goal)) - start)
+                   for tile, share in stats['max_tile'].items() if tile)
+    return round(min(1.0, max(0.0, 1.0 - progress / span)), 4)
+
+def measure_2048_complexity(games: int = 20000, policy: str = 'greedy', workers: int = 1,
+                            seed: int = 0) -> float:
+    """Run playouts and return the measured complexity for the 2048 game."""
+    return measured_complexity(playout_stats(run_playouts(games, policy, workers, seed)))
+
+def main():
+    """Run 2048 playouts from the command line and print the distributions."""
+    import argparse
+    parser = argparse.ArgumentParser(description="MathWorld 2048 simulator")
+    parser.add_argument('--games', type=int, default=20000)
+    parser.add_argument('--policy', choices=POLICIES, default='random')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--depth', type=int, default=2, help="expectimax search depth")
+    args = parser.parse_args()
+
+    print("🎯 MathWorld 2048 Simulator")
+    print("=" * 40)
+    print(f"Playing {args.games} games ({args.policy}) on {args.workers} workers...")
+    stats = playout_stats(run_playouts(args.games, args.policy, args.workers, args.seed, depth=args.depth))
+
+    print(f"\n⏱️  {stats['games_per_minute']:,.0f} games/min, {stats['moves_per_second']:,.0f} moves/s")
+    score = stats['score']
+    print(f"📊 Score: mean {score['mean']:.0f}, p10 {score['p10']}, median {score['p50']}, "
+          f"p90 {score['p90']}, max {score['max']}")
+    print(f"📏 Moves: mean {stats['moves']['mean']:.0f}, median {stats['moves']['p50']}")
+    print("🧱 Max tile:")
+    for tile, share in stats['max_tile'].items():
+        print(f"  {tile:>6}: {share * 100:5.1f}%")
+    print(f"🏆 Reached {GOAL_TILE}: {stats['goal_rate'] * 100:.2f}%")
+    print(f"🧮 Measured complexity: {measured_complexity(stats):.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -9,13 +9,29 @@ Version: 1.0
 Date: 2025
 """
 
+import heapq
+import io
 import json
+import os
 import re
 import random
-from typing import Dict, List, Any, Tuple
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, List, Any, Tuple, Sequence, Set, Optional, Iterable, Iterator, TextIO
 from dataclasses import dataclass
 from pathlib import Path
 
+import instrumentation
+from analysis_table import AnalysisTable
+from game_catalog import GameCatalog
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the batch scoring engine needs it
+    np = None
+
 @dataclass
 class GameAnalysis:
     """Analysis results for a game."""
@@ -28,10 +44,122 @@ class GameAnalysis:
     code_quality: float
     suggestions: List[str]
 
+class KeywordMatcher:
+    """Aho-Corasick automaton that finds many keywords in one pass over a text.
+    
+    Keywords are numbered in the order they are given ("entries"); the same
+    keyword may appear several times and each occurrence keeps its own entry,
+    so callers can reproduce per-list counting exactly.  Matching is plain
+    substring matching, like the `in` operator.
+    """
+    
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords = list(keywords)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[Tuple[int, Tuple[int, ...]], ...]] = [()]
+        self._always: Tuple[int, ...] = tuple(i for i, kw in enumerate(self.keywords) if not kw)
+        
+        # Build the trie; each terminal state remembers (length, entries)
+        terminal: Dict[int, List[int]] = {}
+        for entry, keyword in enumerate(self.keywords):
+            if not keyword:
+                continue
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = nxt
+            terminal.setdefault(state, []).append(entry)
+        
+        # Breadth-first failure links; outputs inherit those of their fail state
+        depth = {0: 0}
+        queue = list(self._goto[0].values())
+        for state in queue:
+            depth[state] = 1
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = candidate if candidate != nxt else 0
+                depth[nxt] = depth[state] + 1
+                queue.append(nxt)
+        for state in [0] + queue:
+            own = ((depth[state], tuple(terminal[state])),) if state in terminal else ()
+            self._output[state] = own + self._output[self._fail[state]] if state else own
+        
+        self._alphabet = frozenset(ch for keyword in self.keywords for ch in keyword)
+        # Lazily completed transition table (goto plus resolved failure moves)
+        self._delta: List[Dict[str, int]] = [dict(edges) for edges in self._goto]
+    
+    def _step(self, state: int, ch: str) -> int:
+        origin = state
+        while state and ch not in self._goto[state]:
+            state = self._fail[state]
+        nxt = self._goto[state].get(ch, 0)
+        self._delta[origin][ch] = nxt
+        return nxt
+    
+    def scan(self, text: str, split: int = 0) -> Tuple[Set[int], Set[int]]:
+        """Return (entries found in text, entries found in text[split:])."""
+        found = set(self._always)
+        tail = set(self._always)
+        alphabet = self._alphabet
+        delta = self._delta
+        output = self._output
+        state = 0
+        for i, ch in enumerate(text):
+            if ch not in alphabet:
+                state = 0
+                continue
+            nxt = delta[state].get(ch)
+            state = self._step(state, ch) if nxt is None else nxt
+            if output[state]:
+                for length, entries in output[state]:
+                    found.update(entries)
+                    if i - length + 1 >= split:
+                        tail.update(entries)
+        return found, tail
+
+def load_keyword_config(path: str) -> Dict[str, Any]:
+    """Load custom keyword lists from a JSON config file.
+    
+    Recognized keys: `difficulty_keywords` (level -> list), `difficulty_weights`
+    (level -> score), `educational_keywords` and `engaging_keywords` (lists).
+    Keywords are lower-cased because they are matched against lower-cased text.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    
+    keywords: Dict[str, Any] = {}
+    if 'difficulty_keywords' in config:
+        keywords['difficulty_keywords'] = {
+            level: [kw.lower() for kw in words]
+            for level, words in config['difficulty_keywords'].items()
+        }
+    if 'difficulty_weights' in config:
+        keywords['difficulty_weights'] = {
+            level: float(weight) for level, weight in config['difficulty_weights'].items()
+        }
+    for key in ('educational_keywords', 'engaging_keywords'):
+        if key in config:
+            keywords[key] = [kw.lower() for kw in config[key]]
+    return keywords
+
 class GameAnalyzer:
     """Advanced game analysis and recommendation system."""
     
-    def __init__(self):
+    def __init__(self, keyword_config: Optional[str] = None):
         self.categories = {
             'arithmetic': ['addition', 'subtraction', 'multiplication', 'division'],
             'puzzle': ['sudoku', 'kenken', 'kakuro', 'magic-square', 'number-search', '2048-game', 'crossmath'],
@@ -46,13 +174,23 @@ class GameAnalyzer:
             'medium': ['intermediate', 'moderate', 'standard'],
             'hard': ['advanced', 'expert', 'challenging', 'complex']
         }
-    
-    def analyze_game_complexity(self, game_data: Dict[str, Any]) -> float:
-        """Analyze the complexity of a game based on its features."""
-        complexity_score = 0.0
+        
+        # Complexity added per matched difficulty keyword
+        self.difficulty_weights = {'easy': 0.1, 'medium': 0.3, 'hard': 0.5}
+        
+        self.educational_keywords = [
+            'math', 'mathematics', 'calculate', 'solve', 'problem',
+            'equation', 'formula', 'geometry', 'algebra', 'fraction',
+            'percentage', 'statistics', 'probability', 'logic', 'reasoning'
+        ]
+        
+        self.engaging_keywords = [
+            'game', 'challenge', 'puzzle', 'match', 'find', 'solve',
+            'interactive', 'fun', 'exciting', 'adventure', 'quest'
+        ]
         
         # Base complexity by category
-        category_complexity = {
+        self.category_complexity = {
             'arithmetic': 0.3,
             'puzzle': 0.7,
             'memory': 0.4,
@@ -61,29 +199,8 @@ class GameAnalyzer:
             'advanced': 0.9
         }
         
-        category = game_data.get('category', 'unknown')
-        complexity_score += category_complexity.get(category, 0.5)
-        
-        # Analyze description for complexity indicators
-        description = game_data.get('description', '').lower()
-        for difficulty, keywords in self.difficulty_keywords.items():
-            for keyword in keywords:
-                if keyword in description:
-                    if difficulty == 'easy':
-                        complexity_score += 0.1
-                    elif difficulty == 'medium':
-                        complexity_score += 0.3
-                    elif difficulty == 'hard':
-                        complexity_score += 0.5
-        
-        return min(complexity_score, 1.0)
-    
-    def calculate_educational_value(self, game_data: Dict[str, Any]) -> float:
-        """Calculate the educational value of a game."""
-        educational_score = 0.0
-        
         # Category-based educational value
-        category_value = {
+        self.category_value = {
             'arithmetic': 0.9,  # Fundamental math skills
             'puzzle': 0.8,      # Problem-solving
             'memory': 0.6,      # Cognitive skills
@@ -92,29 +209,8 @@ class GameAnalyzer:
             'advanced': 0.7     # Advanced concepts
         }
         
-        category = game_data.get('category', 'unknown')
-        educational_score += category_value.get(category, 0.5)
-        
-        # Analyze title and description for educational keywords
-        text = f"{game_data.get('title', '')} {game_data.get('description', '')}".lower()
-        
-        educational_keywords = [
-            'math', 'mathematics', 'calculate', 'solve', 'problem',
-            'equation', 'formula', 'geometry', 'algebra', 'fraction',
-            'percentage', 'statistics', 'probability', 'logic', 'reasoning'
-        ]
-        
-        keyword_count = sum(1 for keyword in educational_keywords if keyword in text)
-        educational_score += min(keyword_count * 0.1, 0.3)
-        
-        return min(educational_score, 1.0)
-    
-    def estimate_user_engagement(self, game_data: Dict[str, Any]) -> float:
-        """Estimate user engagement potential."""
-        engagement_score = 0.5  # Base score
-        
         # Category-based engagement
-        category_engagement = {
+        self.category_engagement = {
             'puzzle': 0.9,      # Highly engaging
             'memory': 0.8,      # Interactive
             'arithmetic': 0.6,  # Educational but potentially repetitive
@@ -123,22 +219,169 @@ class GameAnalyzer:
             'advanced': 0.5     # May be too complex for some users
         }
         
-        category = game_data.get('category', 'unknown')
-        engagement_score += category_engagement.get(category, 0.0)
+        # Complexity measured by simulation (game id -> 0-1), used instead of
+        # the keyword guess; see set_measured_complexity()
+        self.measured_complexity: Dict[str, float] = {}
         
-        # Analyze for engaging keywords
-        text = f"{game_data.get('title', '')} {game_data.get('description', '')}".lower()
+        if keyword_config:
+            for name, value in load_keyword_config(keyword_config).items():
+                setattr(self, name, value)
         
-        engaging_keywords = [
-            'game', 'challenge', 'puzzle', 'match', 'find', 'solve',
-            'interactive', 'fun', 'exciting', 'adventure', 'quest'
-        ]
+        self.compile_keywords()
+    
+    def compile_keywords(self):
+        """Build the keyword matcher; call again after editing the keyword lists."""
+        keywords = []
+        self._keyword_weights: List[float] = []
+        self._keyword_groups: List[str] = []
+        for difficulty, words in self.difficulty_keywords.items():
+            weight = self.difficulty_weights.get(difficulty, 0.0)
+            for keyword in words:
+                keywords.append(keyword)
+                self._keyword_weights.append(weight)
+                self._keyword_groups.append('difficulty')
+        for group, words in (('educational', self.educational_keywords),
+                             ('engaging', self.engaging_keywords)):
+            for keyword in words:
+                keywords.append(keyword)
+                self._keyword_weights.append(0.0)
+                self._keyword_groups.append(group)
+        self.keyword_matcher = KeywordMatcher(keywords)
+    
+    def set_measured_complexity(self, game_id: str, complexity: float):
+        """Use a simulated complexity (0-1) for a game instead of the keyword guess."""
+        self.measured_complexity[game_id] = min(max(float(complexity), 0.0), 1.0)
+    
+    def _keyword_hits(self, game_data: Dict[str, Any]) -> Tuple[Set[int], Set[int]]:
+        """Scan title and description once; return (text hits, description hits)."""
+        title = game_data.get('title', '').lower()
+        description = game_data.get('description', '').lower()
+        return self.keyword_matcher.scan(f"{title} {description}", len(title) + 1)
+    
+    def _complexity_from_hits(self, category: str, description_hits: Set[int],
+                              game_id: Optional[str] = None) -> float:
+        if game_id in self.measured_complexity:
+            return self.measured_complexity[game_id]
+        
+        complexity_score = 0.0
+        complexity_score += self.category_complexity.get(category, 0.5)
+        
+        # Weights are added in keyword order, as a keyword-by-keyword scan would
+        groups = self._keyword_groups
+        for entry in sorted(description_hits):
+            if groups[entry] == 'difficulty':
+                complexity_score += self._keyword_weights[entry]
         
-        keyword_count = sum(1 for keyword in engaging_keywords if keyword in text)
+        return min(complexity_score, 1.0)
+    
+    def _educational_from_hits(self, category: str, text_hits: Set[int]) -> float:
+        educational_score = 0.0
+        educational_score += self.category_value.get(category, 0.5)
+        
+        groups = self._keyword_groups
+        keyword_count = sum(1 for entry in text_hits if groups[entry] == 'educational')
+        educational_score += min(keyword_count * 0.1, 0.3)
+        
+        return min(educational_score, 1.0)
+    
+    def _engagement_from_hits(self, category: str, text_hits: Set[int]) -> float:
+        engagement_score = 0.5  # Base score
+        engagement_score += self.category_engagement.get(category, 0.0)
+        
+        groups = self._keyword_groups
+        keyword_count = sum(1 for entry in text_hits if groups[entry] == 'engaging')
         engagement_score += min(keyword_count * 0.05, 0.2)
         
         return min(engagement_score, 1.0)
     
+    @instrumentation.instrumented('score.game')
+    def score_game(self, game_data: Dict[str, Any]) -> Tuple[float, float, float]:
+        """Return (complexity, educational value, engagement) from a single keyword scan."""
+        category = game_data.get('category', 'unknown')
+        text_hits, description_hits = self._keyword_hits(game_data)
+        return (
+            self._complexity_from_hits(category, description_hits, game_data.get('id')),
+            self._educational_from_hits(category, text_hits),
+            self._engagement_from_hits(category, text_hits)
+        )
+    
+    def analyze_game_complexity(self, game_data: Dict[str, Any]) -> float:
+        """Analyze the complexity of a game based on its features."""
+        # Difficulty keywords are only looked for in the description
+        _, description_hits = self._keyword_hits(game_data)
+        return self._complexity_from_hits(game_data.get('category', 'unknown'), description_hits,
+                                          game_data.get('id'))
+    
+    def calculate_educational_value(self, game_data: Dict[str, Any]) -> float:
+        """Calculate the educational value of a game."""
+        # Educational keywords are looked for in the title and description
+        text_hits, _ = self._keyword_hits(game_data)
+        return self._educational_from_hits(game_data.get('category', 'unknown'), text_hits)
+    
+    def estimate_user_engagement(self, game_data: Dict[str, Any]) -> float:
+        """Estimate user engagement potential."""
+        text_hits, _ = self._keyword_hits(game_data)
+        return self._engagement_from_hits(game_data.get('category', 'unknown'), text_hits)
+    
+    @instrumentation.instrumented('score.batch')
+    def score_batch(self, games_data: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """Score a whole catalog with NumPy array operations.
+        
+        Keywords are found with one matcher pass per record; the scores are
+        then built column-wise.  Returns float64 arrays `complexity_score`,
+        `educational_value` and `user_engagement`, element-for-element
+        identical to the scalar methods (weights are added in keyword order).
+        """
+        if np is None:
+            raise ImportError("score_batch requires NumPy: pip install numpy")
+        
+        count = len(games_data)
+        categories = [game.get('category', 'unknown') for game in games_data]
+        names, codes = np.unique(np.array(categories, dtype=str), return_inverse=True)
+        codes = codes.reshape(-1)
+        
+        def category_column(table: Dict[str, float], default: float):
+            lookup = np.array([table.get(name, default) for name in names], dtype=np.float64)
+            return lookup[codes]
+        
+        # One matcher pass per record, collected as keyword entry -> rows
+        text_rows: Dict[int, List[int]] = {}
+        description_rows: Dict[int, List[int]] = {}
+        for row, game_data in enumerate(games_data):
+            text_hits, description_hits = self._keyword_hits(game_data)
+            for entry in text_hits:
+                text_rows.setdefault(entry, []).append(row)
+            for entry in description_hits:
+                description_rows.setdefault(entry, []).append(row)
+        
+        groups = self._keyword_groups
+        complexity = category_column(self.category_complexity, 0.5)
+        for entry in sorted(description_rows):
+            if groups[entry] == 'difficulty':
+                complexity[description_rows[entry]] += self._keyword_weights[entry]
+        complexity = np.minimum(complexity, 1.0)
+        for row, game_data in enumerate(games_data):
+            measured = self.measured_complexity.get(game_data.get('id'))
+            if measured is not None:
+                complexity[row] = measured
+        
+        educational_count = np.zeros(count, dtype=np.int64)
+        engaging_count = np.zeros(count, dtype=np.int64)
+        for entry, rows in text_rows.items():
+            if groups[entry] == 'educational':
+                educational_count[rows] += 1
+            elif groups[entry] == 'engaging':
+                engaging_count[rows] += 1
+        
+        educational = category_column(self.category_value, 0.5) + np.minimum(educational_count * 0.1, 0.3)
+        engagement = (0.5 + category_column(self.category_engagement, 0.0)) + np.minimum(engaging_count * 0.05, 0.2)
+        
+        return {
+            'complexity_score': complexity,
+            'educational_value': np.minimum(educational, 1.0),
+            'user_engagement': np.minimum(engagement, 1.0)
+        }
+    
     def generate_improvement_suggestions(self, game_data: Dict[str, Any]) -> List[str]:
         """Generate suggestions for improving a game."""
         suggestions = []
@@ -185,22 +428,92 @@ class GameAnalyzer:
         
         return suggestions[:4]  # Return top 4 suggestions
     
-    def analyze_all_games(self, games_data: List[Dict[str, Any]]) -> List[GameAnalysis]:
-        """Analyze all games and return comprehensive analysis."""
-        analyses = []
+    def analyze_game(self, game_data: Dict[str, Any]) -> GameAnalysis:
+        """Analyze a single game."""
+        complexity, educational, engagement = self.score_game(game_data)
+        return GameAnalysis(
+            game_id=game_data.get('id', 'unknown'),
+            title=game_data.get('title', 'Unknown'),
+            category=game_data.get('category', 'unknown'),
+            complexity_score=complexity,
+            educational_value=educational,
+            user_engagement=engagement,
+            code_quality=0.8,  # Placeholder - would need code analysis
+            suggestions=self.generate_improvement_suggestions(game_data)
+        )
+    
+    @instrumentation.instrumented('score.analyze_all')
+    def analyze_all_games(self, games_data: Iterable[Dict[str, Any]], workers: int = 1,
+                          chunk_size: int = 1000) -> List[GameAnalysis]:
+        """Analyze all games and return comprehensive analysis.
+        
+        With `workers` > 1 the games are scored in a process pool; see
+        iter_analyses() to consume the results as a stream instead of a list.
+        """
+        return list(self.iter_analyses(games_data, workers=workers, chunk_size=chunk_size))
+    
+    def analyze_catalog(self, catalog: GameCatalog, category: Optional[str] = None,
+                        workers: int = 1) -> List[GameAnalysis]:
+        """Analyze the games of a compiled catalog, or of one of its categories."""
+        games = catalog.games_in_category(category) if category else catalog.iter_games()
+        return self.analyze_all_games((game.to_dict() for game in games), workers=workers)
+    
+    def iter_analyses(self, games_data: Iterable[Dict[str, Any]], workers: int = 1,
+                      chunk_size: int = 1000) -> Iterator[GameAnalysis]:
+        """Yield analyses in input order, optionally spread over worker processes.
+        
+        The input is read lazily in chunks of `chunk_size` games and at most two
+        chunks per worker are in flight, so memory use depends on the chunk
+        size rather than on the size of the catalog.
+        """
+        if workers <= 1:
+            for game_data in games_data:
+                yield self.analyze_game(game_data)
+            return
+        
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_analysis_worker,
+                                   initargs=(self,))
+        try:
+            pending = deque()
+            for chunk in _chunked(games_data, chunk_size):
+                pending.append(pool.submit(_analyze_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+    
+    @instrumentation.instrumented('score.analyze_to_table')
+    def analyze_to_table(self, games_data: Iterable[Dict[str, Any]], workers: int = 1,
+                         chunk_size: int = 1000) -> AnalysisTable:
+        """Analyze all games straight into an AnalysisTable (see iter_analyses())."""
+        return AnalysisTable.from_analyses(self.iter_analyses(games_data, workers=workers, chunk_size=chunk_size))
+    
+    @instrumentation.instrumented('score.analyze_all_batch')
+    def analyze_all_games_batch(self, games_data: Sequence[Dict[str, Any]]) -> List[GameAnalysis]:
+        """Same as analyze_all_games, but scored with the NumPy batch engine."""
+        scores = self.score_batch(games_data)
+        complexity = scores['complexity_score'].tolist()
+        educational = scores['educational_value'].tolist()
+        engagement = scores['user_engagement'].tolist()
+        suggestions_by_category: Dict[str, List[str]] = {}
         
-        for game_data in games_data:
-            analysis = GameAnalysis(
+        analyses = []
+        for i, game_data in enumerate(games_data):
+            category = game_data.get('category', 'unknown')
+            if category not in suggestions_by_category:
+                suggestions_by_category[category] = self.generate_improvement_suggestions(game_data)
+            analyses.append(GameAnalysis(
                 game_id=game_data.get('id', 'unknown'),
                 title=game_data.get('title', 'Unknown'),
-                category=game_data.get('category', 'unknown'),
-                complexity_score=self.analyze_game_complexity(game_data),
-                educational_value=self.calculate_educational_value(game_data),
-                user_engagement=self.estimate_user_engagement(game_data),
+                category=category,
+                complexity_score=complexity[i],
+                educational_value=educational[i],
+                user_engagement=engagement[i],
                 code_quality=0.8,  # Placeholder - would need code analysis
-                suggestions=self.generate_improvement_suggestions(game_data)
-            )
-            analyses.append(analysis)
+                suggestions=list(suggestions_by_category[category])
+            ))
         
         return analyses
     
@@ -215,12 +528,7 @@ class GameAnalyzer:
         
         # Sort games by overall score
         for analysis in analyses:
-            overall_score = (
-                analysis.educational_value * 0.4 +
-                analysis.user_engagement * 0.3 +
-                analysis.complexity_score * 0.2 +
-                analysis.code_quality * 0.1
-            )
+            overall_score = self.calculate_overall_score(analysis)
             
             if overall_score > 0.7:
                 recommendations['top_performing_games'].append({
@@ -253,54 +561,217 @@ class GameAnalyzer:
         
         return recommendations
     
-    def create_game_report(self, analyses: List[GameAnalysis]) -> str:
-        """Create a comprehensive game analysis report."""
-        report = []
-        report.append("🎮 MathWorld Game Analysis Report")
-        report.append("=" * 50)
-        report.append("")
-        
-        # Overall statistics
-        total_games = len(analyses)
-        avg_complexity = sum(a.complexity_score for a in analyses) / total_games
-        avg_educational = sum(a.educational_value for a in analyses) / total_games
-        avg_engagement = sum(a.user_engagement for a in analyses) / total_games
-        
-        report.append(f"📊 Overall Statistics:")
-        report.append(f"  Total Games: {total_games}")
-        report.append(f"  Average Complexity: {avg_complexity:.2f}")
-        report.append(f"  Average Educational Value: {avg_educational:.2f}")
-        report.append(f"  Average Engagement: {avg_engagement:.2f}")
-        report.append("")
-        
-        # Individual game analysis
-        report.append("🎯 Individual Game Analysis:")
-        report.append("-" * 30)
-        
-        for analysis in sorted(analyses, key=lambda x: x.complexity_score, reverse=True):
-            overall_score = (
-                analysis.educational_value * 0.4 +
-                analysis.user_engagement * 0.3 +
-                analysis.complexity_score * 0.2 +
-                analysis.code_quality * 0.1
-            )
+    def calculate_overall_score(self, analysis: GameAnalysis) -> float:
+        """Weighted overall score used for rankings and reports."""
+        return (
+            analysis.educational_value * 0.4 +
+            analysis.user_engagement * 0.3 +
+            analysis.complexity_score * 0.2 +
+            analysis.code_quality * 0.1
+        )
+    
+    def _format_game_entry(self, analysis: GameAnalysis, overall_score: float) -> List[str]:
+        """Report lines for one game."""
+        lines = [
+            f"\n🎮 {analysis.title}",
+            f"   Category: {analysis.category}",
+            f"   Complexity: {analysis.complexity_score:.2f}",
+            f"   Educational Value: {analysis.educational_value:.2f}",
+            f"   Engagement: {analysis.user_engagement:.2f}",
+            f"   Overall Score: {overall_score:.2f}"
+        ]
+        
+        if analysis.suggestions:
+            lines.append("   💡 Suggestions:")
+            for suggestion in analysis.suggestions[:2]:
+                lines.append(f"      - {suggestion}")
+        
+        return lines
+    
+    def write_game_report(self, analyses: Iterable[GameAnalysis], out: TextIO,
+                          top_k: Optional[int] = None, bottom_k: Optional[int] = None) -> int:
+        """Stream a game analysis report to a file-like object.
+        
+        `out` is anything with a `write(str)` method (an open file, a
+        `socket.makefile('w')`, ...).  Each game's overall score is computed
+        once.  Without `top_k`/`bottom_k` every game is written as soon as it
+        is read, in input order; with them only bounded heaps of the best and
+        worst games (by overall score) are kept.  Averages are only known at
+        the end, so the statistics section closes the report.  Memory stays
+        flat whatever the catalog size.  Returns the number of games read.
+        """
+        with instrumentation.stage('report.write') as span:
+            return self._write_game_report(analyses, span.wrap_writer(out), top_k, bottom_k)
+    
+    def _write_game_report(self, analyses: Iterable[GameAnalysis], out: TextIO,
+                           top_k: Optional[int], bottom_k: Optional[int]) -> int:
+        out.write("🎮 MathWorld Game Analysis Report\n")
+        out.write("=" * 50 + "\n")
+        
+        ranked = top_k is not None or bottom_k is not None
+        if not ranked:
+            out.write("\n🎯 Individual Game Analysis:\n")
+            out.write("-" * 30 + "\n")
+        
+        top: List[Tuple[float, int, GameAnalysis]] = []
+        bottom: List[Tuple[float, int, GameAnalysis]] = []
+        total_games = 0
+        total_complexity = total_educational = total_engagement = total_overall = 0.0
+        
+        for analysis in analyses:
+            overall_score = self.calculate_overall_score(analysis)
+            total_games += 1
+            total_complexity += analysis.complexity_score
+            total_educational += analysis.educational_value
+            total_engagement += analysis.user_engagement
+            total_overall += overall_score
             
-            report.append(f"\n🎮 {analysis.title}")
-            report.append(f"   Category: {analysis.category}")
-            report.append(f"   Complexity: {analysis.complexity_score:.2f}")
-            report.append(f"   Educational Value: {analysis.educational_value:.2f}")
-            report.append(f"   Engagement: {analysis.user_engagement:.2f}")
-            report.append(f"   Overall Score: {overall_score:.2f}")
+            if not ranked:
+                out.write("\n".join(self._format_game_entry(analysis, overall_score)) + "\n")
+                continue
             
-            if analysis.suggestions:
-                report.append("   💡 Suggestions:")
-                for suggestion in analysis.suggestions[:2]:
-                    report.append(f"      - {suggestion}")
-        
-        return "\n".join(report)
+            # Ties keep the earlier game
+            if top_k:
+                entry = (overall_score, -total_games, analysis)
+                if len(top) < top_k:
+                    heapq.heappush(top, entry)
+                elif entry[:2] > top[0][:2]:
+                    heapq.heapreplace(top, entry)
+            if bottom_k:
+                entry = (-overall_score, -total_games, analysis)
+                if len(bottom) < bottom_k:
+                    heapq.heappush(bottom, entry)
+                elif entry[:2] > bottom[0][:2]:
+                    heapq.heapreplace(bottom, entry)
+        
+        sections = []
+        if top_k:
+            sections.append((f"🏆 Top {top_k} Games:",
+                             [(score, analysis) for score, _, analysis in
+                              sorted(top, key=lambda e: (-e[0], -e[1]))]))
+        if bottom_k:
+            sections.append((f"⚠️  Bottom {bottom_k} Games:",
+                             [(-score, analysis) for score, _, analysis in
+                              sorted(bottom, key=lambda e: (-e[0], -e[1]))]))
+        for heading, entries in sections:
+            out.write(f"\n{heading}\n")
+            out.write("-" * 30 + "\n")
+            for overall_score, analysis in entries:
+                out.write("\n".join(self._format_game_entry(analysis, overall_score)) + "\n")
+        
+        divisor = total_games or 1
+        out.write("\n📊 Overall Statistics:\n")
+        out.write(f"  Total Games: {total_games}\n")
+        out.write(f"  Average Complexity: {total_complexity / divisor:.2f}\n")
+        out.write(f"  Average Educational Value: {total_educational / divisor:.2f}\n")
+        out.write(f"  Average Engagement: {total_engagement / divisor:.2f}\n")
+        out.write(f"  Average Overall Score: {total_overall / divisor:.2f}\n")
+        
+        return total_games
+    
+    @instrumentation.instrumented('report.create')
+    def create_game_report(self, analyses: List[GameAnalysis]) -> str:
+        """Create a comprehensive game analysis report as a string."""
+        buffer = io.StringIO()
+        self.write_game_report(analyses, buffer)
+        return buffer.getvalue()
+
+# Per-process analyzer used by iter_analyses() workers
+_worker_analyzer: Optional[GameAnalyzer] = None
+
+def _init_analysis_worker(analyzer: GameAnalyzer):
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+def _analyze_chunk(chunk: List[Dict[str, Any]]) -> List[GameAnalysis]:
+    return [_worker_analyzer.analyze_game(game_data) for game_data in chunk]
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, max(1, size)))
+        if not chunk:
+            return
+        yield chunk
+
+def synthetic_games(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Build a reproducible catalog of fake games for benchmarking."""
+    rng = random.Random(seed)
+    analyzer = GameAnalyzer()
+    categories = list(analyzer.category_complexity) + ['unknown']
+    vocabulary = (
+        [kw for words in analyzer.difficulty_keywords.values() for kw in words]
+        + analyzer.educational_keywords + analyzer.engaging_keywords
+        + ['numbers', 'practice', 'players', 'levels', 'quick', 'grid', 'cards', 'time']
+    )
+    return [
+        {
+            'id': f'game-{i}',
+            'title': ' '.join(rng.choices(vocabulary, k=2)).title(),
+            'category': rng.choice(categories),
+            'description': ' '.join(rng.choices(vocabulary, k=rng.randint(3, 10)))
+        }
+        for i in range(count)
+    ]
+
+def benchmark_worker_scaling(games_data: Sequence[Dict[str, Any]], max_workers: Optional[int] = None,
+                             chunk_size: int = 1000) -> List[Dict[str, Any]]:
+    """Time analyze_all_games at 1, 2, 4, ... up to `max_workers` processes."""
+    max_workers = max_workers or os.cpu_count() or 1
+    worker_counts = []
+    workers = 1
+    while workers < max_workers:
+        worker_counts.append(workers)
+        workers *= 2
+    worker_counts.append(max_workers)
+    
+    analyzer = GameAnalyzer()
+    results = []
+    for workers in worker_counts:
+        start = time.perf_counter()
+        for _ in analyzer.iter_analyses(games_data, workers=workers, chunk_size=chunk_size):
+            pass
+        elapsed = time.perf_counter() - start
+        results.append({
+            'workers': workers,
+            'seconds': elapsed,
+            'games_per_second': len(games_data) / elapsed if elapsed else 0.0,
+            'speedup': results[0]['seconds'] / elapsed if results and elapsed else 1.0
+        })
+    return results
+
+def run_worker_benchmark(max_workers: Optional[int], game_count: int, chunk_size: int):
+    """Print the worker scaling benchmark as a table."""
+    print(f"⏱️  Scoring {game_count} synthetic games (chunk size {chunk_size})")
+    games = synthetic_games(game_count)
+    for row in benchmark_worker_scaling(games, max_workers, chunk_size):
+        print(f"  {row['workers']:>3} workers: {row['seconds']:7.2f}s "
+              f"{row['games_per_second']:>10,.0f} games/s  x{row['speedup']:.2f}")
 
 def main():
     """Main function to demonstrate the Game Analyzer."""
+    import argparse
+    parser = argparse.ArgumentParser(description="MathWorld Game Analyzer")
+    parser.add_argument('--benchmark-workers', type=int, metavar='N',
+                        help="benchmark analysis throughput from 1 to N worker processes")
+    parser.add_argument('--benchmark-games', type=int, default=200000,
+                        help="synthetic catalog size for the benchmark")
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--measure-2048', type=int, metavar='GAMES',
+                        help="simulate GAMES games of 2048 and use the measured complexity")
+    parser.add_argument('--instrument', nargs='?', const=instrumentation.DEFAULT_OUTPUT_PREFIX, metavar='PREFIX',
+                        help="time the score/report stages; writes PREFIX_trace.json and PREFIX_metrics.prom")
+    parser.add_argument('--catalog', metavar='PATH',
+                        help="analyze the games of a compiled catalog (see game_catalog.py) instead of the samples")
+    parser.add_argument('--category', help="with --catalog, analyze only this category")
+    args = parser.parse_args()
+    if args.instrument:
+        instrumentation.enable()
+    
+    if args.benchmark_workers:
+        run_worker_benchmark(args.benchmark_workers, args.benchmark_games, args.chunk_size)
+        return
+    
     print("🔍 MathWorld Game Analyzer")
     print("=" * 40)
     
@@ -329,14 +800,32 @@ def main():
             'title': 'CrossMath',
             'category': 'puzzle',
             'description': 'Mathematical crossword puzzle'
+        },
+        {
+            'id': '2048-game',
+            'title': '2048',
+            'category': 'puzzle',
+            'description': 'Slide and merge number tiles to reach 2048'
         }
     ]
     
     analyzer = GameAnalyzer()
     
+    if args.measure_2048:
+        import game2048
+        print(f"\n🎲 Simulating {args.measure_2048} games of 2048...")
+        complexity = game2048.measure_2048_complexity(args.measure_2048, workers=os.cpu_count() or 1)
+        analyzer.set_measured_complexity('2048-game', complexity)
+        print(f"  Measured complexity: {complexity:.3f}")
+    
     # Analyze games
     print("\n🔍 Analyzing games...")
-    analyses = analyzer.analyze_all_games(sample_games)
+    if args.catalog:
+        with GameCatalog.open(args.catalog) as catalog:
+            analyses = analyzer.analyze_catalog(catalog, args.category)
+        print(f"  {len(analyses)} games from {args.catalog}")
+    else:
+        analyses = analyzer.analyze_all_games(sample_games)
     
     # Generate recommendations
     print("\n💡 Generating recommendations...")
@@ -357,12 +846,16 @@ def main():
     
     # Create and save report
     print("\n📝 Creating analysis report...")
-    report = analyzer.create_game_report(analyses)
-    
     with open('game_analysis_report.txt', 'w', encoding='utf-8') as f:
-        f.write(report)
+        analyzer.write_game_report(analyses, f)
     
     print("✅ Analysis report saved to 'game_analysis_report.txt'")
+    
+    if args.instrument:
+        print()
+        instrumentation.print_summary()
+        trace_path, metrics_path = instrumentation.write_outputs(args.instrument)
+        print(f"📁 Trace: {trace_path}, metrics: {metrics_path}")
     print("\n🎉 Game analysis completed successfully!")
 
 if __name__ == "__main__":
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+MathWorld Game Catalog
+======================
+Compiled, memory-mappable catalog of games, categories and translations.
+
+A catalog is built once from the parsed script.js and opened with mmap, so
+a cold start reads a header instead of parsing JavaScript.  Lookups read
+only the bytes they need:
+
+- game by id:        CRC32 hash index, O(1)
+- ids in order:      sorted id index
+- games by category: sorted category table over a list of game indices
+- translations:      per-language (key, value) pairs sorted by key
+
+Layout (little-endian; every table is an array of uint32):
+
+    header          magic, version, source stat and SHA-256, counts
+    section table   (offset, length) of each section, 8-byte aligned
+    strings         end offsets + UTF-8 data; every distinct string once
+    games           id, title, category, description, icon, difficulty, languages
+    id order        game indices sorted by id
+    id hash         open-addressing slots holding game index + 1 (0 = empty)
+    categories      name, first posting, count; sorted by name
+    postings        game indices per category, in catalog order
+    languages       code, first entry, count; in source order
+    entries         key, value string pairs; sorted by key per language
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+from js_parser import Game, ParsedScript
+
+CATALOG_MAGIC = b'MWGC'
+CATALOG_VERSION = 1
+
+# magic, version, source size, source mtime_ns, source sha256, games, categories, languages, strings
+_HEADER = struct.Struct('<4sHxxQq32sIIII')
+_SECTION = struct.Struct('<QQ')
+_SECTIONS = ('string_ends', 'string_data', 'games', 'id_order', 'id_hash',
+             'categories', 'postings', 'languages', 'entries')
+_GAME_FIELDS = ('id', 'title', 'category', 'description', 'icon', 'difficulty', 'languages')
+_ALIGN = 8
+
+class _StringTable:
+    """Interns strings for the builder."""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.encoded: List[bytes] = []
+
+    def add(self, text: str) -> int:
+        code = self.index.get(text)
+        if code is None:
+            code = self.index[text] = len(self.encoded)
+            self.encoded.append(text.encode('utf-8'))
+        return code
+
+def _u32(values) -> bytes:
+    column = array('I', values)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column.tobytes()
+
+def build_catalog(parsed: ParsedScript, source_size: int = 0, source_mtime_ns: int = 0,
+                  source_sha256: bytes = b'') -> bytes:
+    """Compile parsed games and translations into catalog bytes."""
+    strings = _StringTable()
+    games = parsed.games
+    game_ids = [game.id for game in games]
+    if len(set(game_ids)) != len(game_ids):
+        duplicates = sorted(game_id for game_id, count in Counter(game_ids).items() if count > 1)
+        raise ValueError(f"Duplicate game ids: {', '.join(duplicates)}")
+
+    game_rows: List[int] = []
+    for game in games:
+        languages = ','.join(game.languages or [])
+        game_rows.extend(strings.add(value) for value in (
+            game.id, game.title, game.category, game.description, game.icon, game.difficulty, languages))
+
+    id_bytes = [game_id.encode('utf-8') for game_id in game_ids]
+    id_order = sorted(range(len(games)), key=id_bytes.__getitem__)
+
+    slots = 1
+    while slots < 2 * len(games):
+        slots *= 2
+    id_hash = [0] * slots
+    for index, key in enumerate(id_bytes):
+        slot = zlib.crc32(key) & (slots - 1)
+        while id_hash[slot]:
+            slot = (slot + 1) & (slots - 1)
+        id_hash[slot] = index + 1
+
+    members: Dict[str, List[int]] = {}
+    for index, game in enumerate(games):
+        members.setdefault(game.category, []).append(index)
+    category_rows: List[int] = []
+    postings: List[int] = []
+    for category in sorted(members, key=lambda name: name.encode('utf-8')):
+        category_rows.extend((strings.add(category), len(postings), len(members[category])))
+        postings.extend(members[category])
+
+    language_rows: List[int] = []
+    entries: List[int] = []
+    for language, table in parsed.translations.items():
+        if not isinstance(table, dict):
+            raise ValueError(f"Translations for {language!r} are not an object")
+        pairs = []
+        for key, value in table.items():
+            if not isinstance(value, str):
+                raise ValueError(f"Translation {language}.{key} is not a string")
+            pairs.append((key.encode('utf-8'), strings.add(key), strings.add(value)))
+        pairs.sort()
+        language_rows.extend((strings.add(language), len(entries) // 2, len(pairs)))
+        for _, key_code, value_code in pairs:
+            entries.extend((key_code, value_code))
+
+    ends, end = [], 0
+    for encoded in strings.encoded:
+        end += len(encoded)
+        ends.append(end)
+    payloads = [_u32(ends), b''.join(strings.encoded), _u32(game_rows), _u32(id_order), _u32(id_hash),
+                _u32(category_rows), _u32(postings), _u32(language_rows), _u32(entries)]
+
+    header = _HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, source_size, source_mtime_ns,
+                          source_sha256.ljust(32, b'\0'), len(games), len(members),
+                          len(parsed.translations), len(strings.encoded))
+    offset = len(header) + _SECTION.size * len(payloads)
+    table, body = [], []
+    for payload in payloads:
+        padding = -offset % _ALIGN
+        body.append(b'\0' * padding)
+        offset += padding
+        table.append(_SECTION.pack(offset, len(payload)))
+        body.append(payload)
+        offset += len(payload)
+    return header + b''.join(table) + b''.join(body)
+
+def write_catalog(parsed: ParsedScript, path: str, source_size: int = 0, source_mtime_ns: int = 0,
+                  source_sha256: bytes = b'') -> int:
+    """Build a catalog and write it atomically; returns its size in bytes."""
+    data = build_catalog(parsed, source_size, source_mtime_ns, source_sha256)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return len(data)
+
+class GameCatalog:
+    """Read-only view of a compiled catalog; nothing is decoded until asked for."""
+
+    def __init__(self, buffer: Any, path: Optional[str] = None):
+        self.path = path
+        self._buffer = buffer
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ValueError(f"{path or 'buffer'} is not a game catalog")
+        (magic, version, self.source_size, self.source_mtime_ns, sha256,
+         self.game_count, self.category_count, self.language_count,
+         self.string_count) = _HEADER.unpack_from(view)
+        if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+            raise ValueError(f"{path or 'buffer'} is not a game catalog (version {CATALOG_VERSION})")
+        self.source_sha256 = sha256.hex() if sha256.strip(b'\0') else ''
+
+        sections = {}
+        for i, name in enumerate(_SECTIONS):
+            offset, length = _SECTION.unpack_from(view, _HEADER.size + i * _SECTION.size)
+            if offset + length > len(view):
+                raise ValueError(f"{path or 'buffer'} is truncated")
+            sections[name] = view[offset:offset + length]
+        self._data = sections['string_data']
+        self._ends = self._uint32(sections['string_ends'])
+        self._games = self._uint32(sections['games'])
+        self._id_order = self._uint32(sections['id_order'])
+        self._id_hash = self._uint32(sections['id_hash'])
+        self._categories = self._uint32(sections['categories'])
+        self._postings = self._uint32(sections['postings'])
+        self._languages = self._uint32(sections['languages'])
+        self._entries = self._uint32(sections['entries'])
+        self._hash_mask = len(self._id_hash) - 1
+
+    @staticmethod
+    def _uint32(section: memoryview) -> Any:
+        if sys.byteorder == 'little':
+            return section.cast('I')
+        column = array('I', section.tobytes())
+        column.byteswap()
+        return column
+
+    @classmethod
+    def open(cls, path: str) -> 'GameCatalog':
+        """Memory-map a catalog file."""
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, str(path))
+
+    def close(self):
+        """Release the mapping; the catalog cannot be used afterwards."""
+        for name in ('_data', '_ends', '_games', '_id_order', '_id_hash',
+                     '_categories', '_postings', '_languages', '_entries'):
+            value = getattr(self, name)
+            if isinstance(value, memoryview):
+                value.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> 'GameCatalog':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _bytes(self, code: int) -> bytes:
+        start = self._ends[code - 1] if code else 0
+        return self._data[start:self._ends[code]].tobytes()
+
+    def string(self, code: int) -> str:
+        return self._bytes(code).decode('utf-8')
+
+    def __len__(self) -> int:
+        return self.game_count
+
+    def _find(self, game_id: str) -> int:
+        """Game index for an id, or -1."""
+        key = game_id.encode('utf-8')
+        slot = zlib.crc32(key) & self._hash_mask
+        while True:
+            entry = self._id_hash[slot]
+            if not entry:
+                return -1
+            if self._bytes(self._games[(entry - 1) * 7]) == key:
+                return entry - 1
+            slot = (slot + 1) & self._hash_mask
+
+    def __contains__(self, game_id: str) -> bool:
+        return self._find(game_id) >= 0
+
+    def game_at(self, index: int) -> Game:
+        """Game at a catalog position (source order)."""
+        if not 0 <= index < self.game_count:
+            raise IndexError(index)
+        values = [self.string(code) for code in self._games[index * 7:index * 7 + 7]]
+        fields = dict(zip(_GAME_FIELDS, values))
+        fields['languages'] = fields['languages'].split(',') if fields['languages'] else []
+        return Game(**fields)
+
+    def get(self, game_id: str) -> Optional[Game]:
+        """Game with this id, or None."""
+        index = self._find(game_id)
+        return self.game_at(index) if index >= 0 else None
+
+    def iter_games(self) -> Iterator[Game]:
+        """Games in source order."""
+        for index in range(self.game_count):
+            yield self.game_at(index)
+
+    def ids(self) -> List[str]:
+        """Game ids in sorted order."""
+        return [self.string(self._games[index * 7]) for index in self._id_order]
+
+    def _category_row(self, category: str) -> Optional[Tuple[int, int]]:
+        key = category.encode('utf-8')
+        low, high = 0, self.category_count
+        while low < high:
+            middle = (low + high) // 2
+            name = self._bytes(self._categories[middle * 3])
+            if name < key:
+                low = middle + 1
+            elif name > key:
+                high = middle
+            else:
+                return self._categories[middle * 3 + 1], self._categories[middle * 3 + 2]
+        return None
+
+    def categories(self) -> Dict[str, int]:
+        """Game count per category, sorted by name."""
+        return {self.string(self._categories[i * 3]): self._categories[i * 3 + 2]
+                for i in range(self.category_count)}
+
+    def games_in_category(self, category: str) -> List[Game]:
+        """Games of one category in source order."""
+        row = self._category_row(category)
+        if row is None:
+            return []
+        start, count = row
+        return [self.game_at(index) for index in self._postings[start:start + count]]
+
+    def languages(self) -> List[str]:
+        return [self.string(self._languages[i * 3]) for i in range(self.language_count)]
+
+    def _language_row(self, language: str) -> Optional[Tuple[int, int]]:
+        for i in range(self.language_count):
+            if self.string(self._languages[i * 3]) == language:
+                return self._languages[i * 3 + 1], self._languages[i * 3 + 2]
+        return None
+
+    def translation(self, language: str, key: str) -> Optional[str]:
+        """One translated string, found by binary search over the language's keys."""
+        row = self._language_row(language)
+        if row is None:
+            return None
+        start, count = row
+        target = key.encode('utf-8')
+        low, high = start, start + count
+        while low < high:
+            middle = (low + high) // 2
+            name = self._bytes(self._entries[middle * 2])
+            if name < target:
+                low = middle + 1
+            elif name > target:
+                high = middle
+            else:
+                return self.string(self._entries[middle * 2 + 1])
+        return None
+
+    def translations(self, language: str) -> Dict[str, str]:
+        """All strings of one language, by key."""
+        row = self._language_row(language)
+        if row is None:
+            return {}
+        start, count = row
+        return {self.string(self._entries[i * 2]): self.string(self._entries[i * 2 + 1])
+                for i in range(start, start + count)}
+
+    def to_parsed(self) -> ParsedScript:
+        """Everything in the catalog as a ParsedScript."""
+        return ParsedScript(games=list(self.iter_games()),
+                            translations={language: self.translations(language) for language in self.languages()})
+
+def main():
+    """Compile script.js into a catalog or query a catalog."""
+    import argparse
+    import hashlib
+    import time
+    from js_parser import parse_script
+    parser = argparse.ArgumentParser(description="MathWorld game catalog")
+    parser.add_argument('catalog', help="catalog file")
+    parser.add_argument('--build', metavar='SCRIPT', help="compile this script.js into the catalog first")
+    parser.add_argument('--id', help="show one game")
+    parser.add_argument('--category', help="list the games of a category")
+    parser.add_argument('--translate', nargs=2, metavar=('LANGUAGE', 'KEY'), help="show one translation")
+    args = parser.parse_args()
+
+    if args.build:
+        with open(args.build, 'rb') as f:
+            data = f.read()
+        st = os.stat(args.build)
+        size = write_catalog(parse_script(data.decode('utf-8')), args.catalog, st.st_size,
+                             st.st_mtime_ns, hashlib.sha256(data).digest())
+        print(f"🗂️  Compiled {args.build} into {args.catalog} ({size:,} bytes)")
+
+    start = time.perf_counter()
+    with GameCatalog.open(args.catalog) as catalog:
+        opened = time.perf_counter() - start
+        print(f"📖 {args.catalog}: {len(catalog)} games, {catalog.category_count} categories, "
+              f"{catalog.language_count} languages (opened in {opened * 1e6:.0f} µs)")
+        if args.id:
+            game = catalog.get(args.id)
+            print(f"  {game}" if game else f"  ❌ No game with id {args.id!r}")
+        if args.category:
+            for game in catalog.games_in_category(args.category):
+                print(f"  - {game.id}: {game.title}")
+        if args.translate:
+            print(f"  {catalog.translation(*args.translate)!r}")
+        if not (args.id or args.category or args.translate):
+            for category, count in catalog.categories().items():
+                print(f"  - {category}: {count} games")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+MathWorld Game Export
+=====================
+Streaming writers for the game catalog: NDJSON and compact JSON.
+
+Records are serialized one at a time and written in chunks, so memory use
+does not grow with the catalog.  Outputs can be gzip or zstd compressed
+(zstd needs the optional `zstandard` package) and carry a schema version:
+
+- ndjson: the first line is the header object, then one game per line
+- json:   {"schema_version": ..., <header>, "games": [...], <trailer>}
+
+Files are written to a temporary name and renamed when complete, so a
+reader never sees a partial export.
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import gzip
+import io
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Any, BinaryIO, Callable, Iterable, Iterator, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstd compression is optional
+    zstandard = None
+
+EXPORT_SCHEMA_VERSION = 1
+EXPORT_KIND = "mathworld.games"
+FORMATS = ('ndjson', 'json')
+COMPRESSIONS = ('none', 'gzip', 'zstd')
+DEFAULT_CHUNK_SIZE = 1000
+
+_SUFFIXES = {'.gz': 'gzip', '.zst': 'zstd'}
+_GZIP_MAGIC = b'\x1f\x8b'
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+@dataclass
+class ExportResult:
+    """What an export wrote."""
+    path: str
+    format: str
+    compression: str
+    records: int
+    raw_bytes: int
+    bytes: int
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+def compression_for(path: str) -> str:
+    """Compression implied by a file name (.gz, .zst, else none)."""
+    return _SUFFIXES.get(Path(path).suffix.lower(), 'none')
+
+def _require_zstd():
+    if zstandard is None:
+        raise ImportError("zstd compression requires the zstandard package: pip install zstandard")
+
+def _open_compressed(path: str, compression: str) -> BinaryIO:
+    if compression == 'gzip':
+        return gzip.open(path, 'wb', compresslevel=6)
+    if compression == 'zstd':
+        _require_zstd()
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, 'wb'))
+    if compression == 'none':
+        return open(path, 'wb')
+    raise ValueError(f"Unknown compression: {compression}")
+
+def open_input(path: str) -> BinaryIO:
+    """Open an export for reading, decompressing by its magic bytes."""
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, 'rb')
+    if magic.startswith(_ZSTD_MAGIC):
+        _require_zstd()
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb')))
+    return open(path, 'rb')
+
+class _ChunkWriter:
+    """Collects encoded pieces and writes them every `chunk_size` records."""
+
+    def __init__(self, out: BinaryIO, chunk_size: int):
+        self.out = out
+        self.chunk_size = max(1, chunk_size)
+        self.pieces: List[str] = []
+        self.pending = 0
+        self.records = 0
+        self.raw_bytes = 0
+
+    def add(self, text: str, record: bool = False):
+        self.pieces.append(text)
+        if record:
+            self.records += 1
+            self.pending += 1
+            if self.pending >= self.chunk_size:
+                self.flush()
+
+    def flush(self):
+        if self.pieces:
+            data = ''.join(self.pieces).encode('utf-8')
+            self.out.write(data)
+            self.raw_bytes += len(data)
+            self.pieces = []
+            self.pending = 0
+
+def write_ndjson(records: Iterable[Dict[str, Any]], out: BinaryIO, header: Dict[str, Any],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> _ChunkWriter:
+    """Header line, then one record per line."""
+    writer = _ChunkWriter(out, chunk_size)
+    writer.add(_dumps(header) + '\n')
+    for record in records:
+        writer.add(_dumps(record) + '\n', record=True)
+    writer.flush()
+    return writer
+
+def write_json_stream(records: Iterable[Dict[str, Any]], out: BinaryIO, header: Dict[str, Any],
+                      trailer: Optional[Callable[[], Dict[str, Any]]] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> _ChunkWriter:
+    """One JSON object: the header keys, a "games" array and the trailer keys.
+
+    `trailer` is called after the last record, so it can report values
+    gathered while the records streamed past.
+    """
+    writer = _ChunkWriter(out, chunk_size)
+    # The header object is left open so the games array and trailer join it
+    head = _dumps(header)
+    writer.add(head[:-1] + (',' if header else '') + '"games":[')
+    separator = '\n'
+    for record in records:
+        writer.add(separator + _dumps(record), record=True)
+        separator = ',\n'
+    writer.add('\n]')
+    for key, value in (trailer() if trailer else {}).items():
+        writer.add(f",{_dumps(key)}:{_dumps(value)}")
+    writer.add('}\n')
+    writer.flush()
+    return writer
+
+def export_records(records: Iterable[Dict[str, Any]], path: str, format: str = 'ndjson',
+                   compression: Optional[str] = None, header: Optional[Dict[str, Any]] = None,
+                   trailer: Optional[Callable[[], Dict[str, Any]]] = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> ExportResult:
+    """Stream records to `path` in an export format.
+
+    `compression=None` picks it from the file name.  The schema version and
+    kind are always the first header keys.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format: {format}")
+    compression = compression or compression_for(path)
+    if compression == 'zstd':
+        _require_zstd()
+    if format == 'ndjson' and trailer:
+        raise ValueError("NDJSON exports have no trailer")
+    header = dict({'schema_version': EXPORT_SCHEMA_VERSION, 'kind': EXPORT_KIND}, **(header or {}))
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with _open_compressed(tmp, compression) as out:
+            if format == 'ndjson':
+                writer = write_ndjson(records, out, header, chunk_size)
+            else:
+                writer = write_json_stream(records, out, header, trailer, chunk_size)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+    return ExportResult(path=str(path), format=format, compression=compression,
+                        records=writer.records, raw_bytes=writer.raw_bytes, bytes=os.path.getsize(path))
+
+def read_ndjson(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the records of an NDJSON export, checking its header first."""
+    with open_input(path) as raw:
+        lines = iter(raw)
+        header = json.loads(next(lines, b'{}'))
+        version = header.get('schema_version')
+        if not isinstance(version, int) or version > EXPORT_SCHEMA_VERSION:
+            raise ValueError(f"Unsupported export schema version: {version!r}")
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+
+def read_header(path: str) -> Dict[str, Any]:
+    """Header of an NDJSON export (its first line)."""
+    with open_input(path) as raw:
+        return json.loads(raw.readline() or b'{}')
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+MathWorld Instrumentation
+=========================
+Opt-in timers, call counts and byte counts for the hot stages of the Python
+tools (parse, score, report, export, backup).
+
+Instrumentation is off unless the MATHWORLD_INSTRUMENT environment variable
+is set to 1/true/yes/on, or a tool is run with --instrument.  While off,
+stage() returns a shared no-op span and @instrumented adds one flag check
+per call.  While on, every stage gets a call count, total and maximum time,
+a byte count and a latency histogram, and each call is kept as a Chrome
+trace event (up to MAX_TRACE_EVENTS).
+
+Results are written as a Chrome trace (open in chrome://tracing or
+Perfetto) and as a Prometheus text-format file.  Worker processes keep
+their own recorders; only the process that runs the tool writes files.
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import atexit
+import functools
+import json
+import multiprocessing
+import os
+import threading
+import time
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+ENV_VAR = "MATHWORLD_INSTRUMENT"
+OUTPUT_ENV_VAR = "MATHWORLD_INSTRUMENT_OUTPUT"
+DEFAULT_OUTPUT_PREFIX = "mathworld"
+METRIC_PREFIX = "mathworld_stage"
+MAX_TRACE_EVENTS = 200000
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+
+class StageStats:
+    """Aggregated measurements of one stage."""
+
+    __slots__ = ('count', 'seconds', 'max_seconds', 'bytes', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # last one is +Inf
+
+    def add(self, seconds: float, size: int):
+        self.count += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.bytes += size
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+class _NullSpan:
+    """Span handed out while instrumentation is off; does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add_bytes(self, size: int):
+        pass
+
+    def wrap_writer(self, out):
+        return out
+
+_NULL_SPAN = _NullSpan()
+
+class Span:
+    """One timed run of a stage; use as a context manager."""
+
+    __slots__ = ('recorder', 'name', 'args', 'bytes', 'start')
+
+    def __init__(self, recorder: 'Recorder', name: str, args: Dict[str, Any]):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+        self.bytes = 0
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.recorder.record(self.name, self.start, time.perf_counter(), self.bytes, self.args)
+        return False
+
+    def add_bytes(self, size: int):
+        self.bytes += size
+
+    def wrap_writer(self, out):
+        """Wrap a text stream so everything written to it is counted (UTF-8 bytes)."""
+        return _CountingWriter(out, self)
+
+class _CountingWriter:
+    def __init__(self, out, span: Span):
+        self._out = out
+        self._span = span
+
+    def write(self, text: str) -> Any:
+        self._span.bytes += len(text.encode('utf-8'))
+        return self._out.write(text)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._out, name)
+
+class Recorder:
+    """Collects stage statistics and trace events for one process."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop everything recorded so far."""
+        with self._lock:
+            self.stages: Dict[str, StageStats] = {}
+            self.events: List[Dict[str, Any]] = []
+            self.dropped_events = 0
+            self.origin = time.perf_counter()
+
+    def record(self, name: str, start: float, end: float, size: int = 0,
+               args: Optional[Dict[str, Any]] = None):
+        """Record one finished stage run (perf_counter start and end)."""
+        seconds = end - start
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats()
+            stats.add(seconds, size)
+            if len(self.events) >= MAX_TRACE_EVENTS:
+                self.dropped_events += 1
+                return
+            event_args = dict(args) if args else {}
+            if size:
+                event_args['bytes'] = size
+            self.events.append({
+                'name': name, 'cat': name.split('.')[0], 'ph': 'X',
+                'ts': (start - self.origin) * 1e6, 'dur': seconds * 1e6,
+                'pid': os.getpid(), 'tid': threading.get_ident(), 'args': event_args
+            })
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage count, total/mean/max seconds and bytes."""
+        with self._lock:
+            return {
+                name: {
+                    'count': stats.count,
+                    'seconds': stats.seconds,
+                    'mean_seconds': stats.seconds / stats.count if stats.count else 0.0,
+                    'max_seconds': stats.max_seconds,
+                    'bytes': stats.bytes
+                }
+                for name, stats in sorted(self.stages.items())
+            }
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Trace in the Chrome trace event format."""
+        with self._lock:
+            return {
+                'traceEvents': list(self.events),
+                'displayTimeUnit': 'ms',
+                'otherData': {'dropped_events': self.dropped_events}
+            }
+
+    def prometheus_text(self) -> str:
+        """Stage metrics in the Prometheus text exposition format."""
+        with self._lock:
+            stages = sorted(self.stages.items())
+            lines = [
+                f"# HELP {METRIC_PREFIX}_seconds Time spent per stage run.",
+                f"# TYPE {METRIC_PREFIX}_seconds histogram"
+            ]
+            for name, stats in stages:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + (float('inf'),), stats.buckets):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{METRIC_PREFIX}_seconds_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+                lines.append(f'{METRIC_PREFIX}_seconds_sum{{stage="{name}"}} {stats.seconds!r}')
+                lines.append(f'{METRIC_PREFIX}_seconds_count{{stage="{name}"}} {stats.count}')
+            lines.append(f"# HELP {METRIC_PREFIX}_bytes_total Bytes read or written per stage.")
+            lines.append(f"# TYPE {METRIC_PREFIX}_bytes_total counter")
+            for name, stats in stages:
+                lines.append(f'{METRIC_PREFIX}_bytes_total{{stage="{name}"}} {stats.bytes}')
+            return "\n".join(lines) + "\n"
+
+def _env_enabled() -> bool:
+    return os.environ.get(ENV_VAR, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+# The process-wide recorder used by stage() and @instrumented
+recorder = Recorder()
+
+def is_enabled() -> bool:
+    return recorder.enabled
+
+def enable():
+    """Start recording in this process."""
+    recorder.enabled = True
+
+def disable():
+    """Stop recording; what was recorded is kept until reset()."""
+    recorder.enabled = False
+
+def stage(name: str, **args: Any):
+    """Context manager timing one run of a stage.
+
+    Use `span.add_bytes(n)` inside the block to count bytes processed.
+    """
+    if not recorder.enabled:
+        return _NULL_SPAN
+    return Span(recorder, name, args)
+
+def instrumented(name: str) -> Callable[[Callable], Callable]:
+    """Decorator recording every call of a function as a run of stage `name`."""
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not recorder.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder.record(name, start, time.perf_counter())
+        return wrapper
+    return decorate
+
+def write_outputs(prefix: Optional[str] = None) -> Tuple[str, str]:
+    """Write `<prefix>_trace.json` and `<prefix>_metrics.prom`; returns both paths."""
+    prefix = prefix or os.environ.get(OUTPUT_ENV_VAR) or DEFAULT_OUTPUT_PREFIX
+    trace_path = f"{prefix}_trace.json"
+    metrics_path = f"{prefix}_metrics.prom"
+    with open(trace_path, 'w', encoding='utf-8') as f:
+        json.dump(recorder.chrome_trace(), f)
+    with open(metrics_path, 'w', encoding='utf-8') as f:
+        f.write(recorder.prometheus_text())
+    return trace_path, metrics_path
+
+def print_summary():
+    """Print the per-stage table."""
+    summary = recorder.summary()
+    if not summary:
+        print("📏 Instrumentation: no stages recorded")
+        return
+    print("📏 Instrumentation:")
+    print(f"  {'stage':<24} {'calls':>9} {'total ms':>11} {'mean ms':>10} {'max ms':>10} {'bytes':>13}")
+    for name, stats in summary.items():
+        print(f"  {name:<24} {stats['count']:>9} {stats['seconds'] * 1000:>11.2f} "
+              f"{stats['mean_seconds'] * 1000:>10.3f} {stats['max_seconds'] * 1000:>10.3f} {stats['bytes']:>13,}")
+
+def _write_at_exit():
+    # Only the main process writes: spawned pool workers run atexit too
+    if recorder.enabled and recorder.stages and multiprocessing.parent_process() is None:
+        write_outputs()
+
+if _env_enabled():
+    enable()
+    atexit.register(_write_at_exit)
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+MathWorld Script Parser
+=======================
+Single-pass tokenizer and object-literal parser for the MathWorld script.js bundle.
+
+The parser walks the JavaScript source once, left to right, and only builds
+values for the top-level declarations it was asked for (``games`` and
+``translations``).  Everything else is tokenized and skipped, so strings,
+comments, template literals and regular expressions never confuse it.
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Tuple
+
+@dataclass
+class Game:
+    """Represents a game in the MathWorld platform."""
+    id: str
+    title: str
+    category: str
+    description: str
+    icon: str
+    difficulty: str = "medium"
+    languages: List[str] = None
+
+    def __post_init__(self):
+        if self.languages is None:
+            self.languages = ["en", "ar", "fr"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the game as the plain dict shape used by the tools."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "category": self.category,
+            "description": self.description,
+            "icon": self.icon
+        }
+
+@dataclass
+class ParsedScript:
+    """Values extracted from script.js."""
+    games: List[Game] = field(default_factory=list)
+    translations: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+class ScriptParseError(ValueError):
+    """Raised when script.js cannot be tokenized or parsed."""
+
+    def __init__(self, message: str, line: int, column: int):
+        super().__init__(f"{message} (line {line}, column {column})")
+        self.message = message
+        self.line = line
+        self.column = column
+
+# Token kinds
+IDENT = 'ident'
+STRING = 'string'
+NUMBER = 'number'
+PUNCT = 'punct'
+TEMPLATE = 'template'
+REGEX = 'regex'
+
+_WS_RE = re.compile(r'[ \t\r\n\f\v\u00a0\u2028\u2029\ufeff]+')
+_STRING_RES = {
+    "'": re.compile(r"'(?:[^'\\\n]|\\.)*'", re.S),
+    '"': re.compile(r'"(?:[^"\\\n]|\\.)*"', re.S),
+}
+_TEMPLATE_CHUNK_RE = re.compile(r'(?:[^`\\$]|\\.|\$(?!\{))*', re.S)
+_IDENT_RE = re.compile(r'(?:[^\W\d]|\$)[\w$]*')
+_NUMBER_RE = re.compile(
+    r'(?:0[xX][0-9a-fA-F_]+|0[oO][0-7_]+|0[bB][01_]+'
+    r'|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?)n?'
+)
+_REGEX_RE = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+_PUNCT_RE = re.compile(
+    r'>>>=?|\.\.\.|===|!==|\*\*=?|<<=?|>>=?|&&=?|\|\|=?|\?\?=?|\?\.(?!\d)'
+    r'|=>|[-+*/%&|^<>!=]=|\+\+|--|[{}()\[\];,:.?~<>+\-*/%&|^!=@#]'
+)
+_ESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|[\s\S])')
+
+_SIMPLE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+    '\n': '', '\r\n': '', '\r': '', '\u2028': '', '\u2029': ''
+}
+
+# Identifiers after which a '/' starts a regular expression rather than a division
+_REGEX_KEYWORDS = frozenset([
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await'
+])
+_DIVISION_PUNCT = frozenset([')', ']', '}'])
+_DECLARATION_KEYWORDS = frozenset(['const', 'let', 'var'])
+_OPENING = frozenset(['{', '(', '['])
+_CLOSING = frozenset(['}', ')', ']'])
+_LITERAL_IDENTS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+def _line_col(text: str, pos: int) -> Tuple[int, int]:
+    """Convert an offset into a 1-based (line, column) pair."""
+    line = text.count('\n', 0, pos) + 1
+    column = pos - text.rfind('\n', 0, pos)
+    return line, column
+
+def _unescape(match: 're.Match[str]') -> str:
+    esc = match.group(1)
+    if esc[0] == 'u':
+        return chr(int(esc[2:-1] if esc[1] == '{' else esc[1:], 16))
+    if esc[0] == 'x':
+        return chr(int(esc[1:], 16))
+    return _SIMPLE_ESCAPES.get(esc, esc)
+
+def decode_js_string(raw: str) -> str:
+    """Decode a quoted JavaScript string or template token to its value."""
+    body = raw[1:-1]
+    if '\\' not in body:
+        return body
+    decoded = _ESCAPE_RE.sub(_unescape, body)
+    # \uD83C\uDFAE style escapes leave lone surrogates behind; join them.
+    return decoded.encode('utf-16', 'surrogatepass').decode('utf-16')
+
+def tokenize(text: str) -> Iterator[Tuple[str, str, int]]:
+    """Yield (kind, value, offset) tokens for JavaScript source.
+
+    Whitespace and comments are dropped.  Template literals are yielded as a
+    single TEMPLATE token when they have no substitutions; otherwise each
+    literal chunk is yielded and the substitution tokens come in between.
+    """
+    pos = 0
+    end = len(text)
+    prev_kind = None
+    prev_value = None
+    template_depths: List[int] = []
+
+    def error(message: str, at: int) -> ScriptParseError:
+        line, column = _line_col(text, at)
+        return ScriptParseError(message, line, column)
+
+    def scan_template(start: int) -> Tuple[str, int, bool]:
+        """Scan a template chunk starting after '`' or '}'; return (raw, next_pos, closed)."""
+        chunk_end = _TEMPLATE_CHUNK_RE.match(text, start).end()
+        if chunk_end >= end:
+            raise error("Unterminated template literal", start - 1)
+        if text[chunk_end] == '`':
+            return text[start - 1:chunk_end + 1], chunk_end + 1, True
+        # '${' starts a substitution
+        template_depths.append(0)
+        return text[start - 1:chunk_end], chunk_end + 2, False
+
+    while pos < end:
+        ch = text[pos]
+
+        if ch in ' \t\r\n' or ch in '\f\v\u00a0\u2028\u2029\ufeff':
+            pos = _WS_RE.match(text, pos).end()
+            continue
+
+        if ch == '/':
+            nxt = text[pos + 1:pos + 2]
+            if nxt == '/':
+                newline = text.find('\n', pos)
+                pos = end if newline < 0 else newline
+                continue
+            if nxt == '*':
+                close = text.find('*/', pos + 2)
+                if close < 0:
+                    raise error("Unterminated block comment", pos)
+                pos = close + 2
+                continue
+            regex_allowed = (
+                prev_kind is None
+                or (prev_kind == PUNCT and prev_value not in _DIVISION_PUNCT)
+                or (prev_kind == IDENT and prev_value in _REGEX_KEYWORDS)
+            )
+            if regex_allowed:
+                match = _REGEX_RE.match(text, pos)
+                if not match:
+                    raise error("Unterminated regular expression", pos)
+                prev_kind, prev_value = REGEX, match.group()
+                yield REGEX, prev_value, pos
+                pos = match.end()
+                continue
+
+        if ch == "'" or ch == '"':
+            match = _STRING_RES[ch].match(text, pos)
+            if not match:
+                raise error("Unterminated string literal", pos)
+            prev_kind, prev_value = STRING, match.group()
+            yield STRING, prev_value, pos
+            pos = match.end()
+            continue
+
+        if ch == '`':
+            raw, next_pos, _ = scan_template(pos + 1)
+            prev_kind, prev_value = TEMPLATE, raw
+            yield TEMPLATE, raw, pos
+            pos = next_pos
+            continue
+
+        if ch == '}' and template_depths and template_depths[-1] == 0:
+            template_depths.pop()
+            raw, next_pos, _ = scan_template(pos + 1)
+            prev_kind, prev_value = TEMPLATE, raw
+            yield TEMPLATE, raw, pos
+            pos = next_pos
+            continue
+
+        if ch.isdigit() or (ch == '.' and text[pos + 1:pos + 2].isdigit()):
+            match = _NUMBER_RE.match(text, pos)
+            prev_kind, prev_value = NUMBER, match.group()
+            yield NUMBER, prev_value, pos
+            pos = match.end()
+            continue
+
+        match = _IDENT_RE.match(text, pos)
+        if match:
+            prev_kind, prev_value = IDENT, match.group()
+            yield IDENT, prev_value, pos
+            pos = match.end()
+            continue
+
+        match = _PUNCT_RE.match(text, pos)
+        if not match:
+            raise error(f"Unexpected character {ch!r}", pos)
+        value = match.group()
+        if template_depths:
+            if value == '{':
+                template_depths[-1] += 1
+            elif value == '}':
+                template_depths[-1] -= 1
+        prev_kind, prev_value = PUNCT, value
+        yield PUNCT, value, pos
+        pos = match.end()
+
+    if template_depths:
+        raise error("Unterminated template substitution", end)
+
+class ScriptParser:
+    """Extract object-literal declarations from JavaScript source in one pass."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def _error(self, message: str, pos: int) -> ScriptParseError:
+        line, column = _line_col(self.text, pos)
+        return ScriptParseError(message, line, column)
+
+    def _declarations(self, names: Tuple[str, ...]) -> Iterator[Tuple[str, Iterator, int]]:
+        """Yield (name, token_stream, offset) at each top-level `const name =` of interest.
+
+        The caller must consume the value from the token stream before asking
+        for the next declaration.
+        """
+        tokens = tokenize(self.text)
+        depth = 0
+        keyword_seen = False
+        name = None
+        for kind, value, pos in tokens:
+            if name is not None and value == '=':
+                yield name, tokens, pos
+                name = None
+                continue
+            if keyword_seen and kind == IDENT and value in names:
+                keyword_seen = False
+                name = value
+                continue
+            keyword_seen = False
+            name = None
+            if kind == PUNCT:
+                if value in _OPENING:
+                    depth += 1
+                elif value in _CLOSING:
+                    depth -= 1
+            elif kind == IDENT and not depth and value in _DECLARATION_KEYWORDS:
+                keyword_seen = True
+
+    def _expect_value(self, tokens: Iterator, after: int) -> Tuple[str, str, int]:
+        token = next(tokens, None)
+        if token is None:
+            raise self._error("Unexpected end of input", after)
+        return token
+
+    def _parse_value(self, tokens: Iterator, token: Tuple[str, str, int]) -> Any:
+        kind, value, pos = token
+        if kind == STRING:
+            return decode_js_string(value)
+        if kind == TEMPLATE:
+            if len(value) < 2 or value[0] != '`' or value[-1] != '`':
+                raise self._error("Template substitutions are not supported in data literals", pos)
+            return decode_js_string(value)
+        if kind == NUMBER:
+            return self._parse_number(value, pos)
+        if kind == IDENT and value in _LITERAL_IDENTS:
+            return _LITERAL_IDENTS[value]
+        if kind == PUNCT:
+            if value == '{':
+                return self._parse_object(tokens, pos)
+            if value == '[':
+                return list(self._iter_array(tokens, pos))
+            if value == '-':
+                kind, number, num_pos = self._expect_value(tokens, pos)
+                if kind != NUMBER:
+                    raise self._error("Expected a number after '-'", num_pos)
+                return -self._parse_number(number, num_pos)
+        raise self._error(f"Unsupported value {value!r} in data literal", pos)
+
+    def _parse_number(self, value: str, pos: int) -> Any:
+        literal = value.replace('_', '').rstrip('n')
+        try:
+            if literal[:2].lower() in ('0x', '0o', '0b'):
+                return int(literal, 0)
+            if literal.isdigit():
+                return int(literal)
+            return float(literal)
+        except ValueError:
+            raise self._error(f"Invalid number {value!r}", pos)
+
+    def _parse_object(self, tokens: Iterator, start: int) -> Dict[str, Any]:
+        obj: Dict[str, Any] = {}
+        while True:
+            kind, value, pos = self._expect_value(tokens, start)
+            if kind == PUNCT and value == '}':
+                return obj
+            if kind == IDENT:
+                key = value
+            elif kind == STRING:
+                key = decode_js_string(value)
+            elif kind == NUMBER:
+                key = str(self._parse_number(value, pos))
+            else:
+                raise self._error(f"Expected a property name, found {value!r}", pos)
+
+            kind, value, colon_pos = self._expect_value(tokens, pos)
+            if value != ':':
+                raise self._error(f"Expected ':' after property {key!r}", colon_pos)
+            obj[key] = self._parse_value(tokens, self._expect_value(tokens, colon_pos))
+
+            kind, value, sep_pos = self._expect_value(tokens, colon_pos)
+            if value == '}':
+                return obj
+            if value != ',':
+                raise self._error(f"Expected ',' or '}}' after property {key!r}", sep_pos)
+            start = sep_pos
+
+    def _iter_array(self, tokens: Iterator, start: int) -> Iterator[Any]:
+        """Yield elements of an array literal as they are parsed."""
+        while True:
+            token = self._expect_value(tokens, start)
+            if token[0] == PUNCT and token[1] == ']':
+                return
+            yield self._parse_value(tokens, token)
+            kind, value, sep_pos = self._expect_value(tokens, token[2])
+            if value == ']':
+                return
+            if value != ',':
+                raise self._error("Expected ',' or ']' in array literal", sep_pos)
+            start = sep_pos
+
+    def _iter_game_records(self, tokens: Iterator, start: int) -> Iterator[Game]:
+        token = self._expect_value(tokens, start)
+        if token[:2] != (PUNCT, '['):
+            raise self._error("Expected '[' to start the games array", token[2])
+        while True:
+            token = self._expect_value(tokens, token[2])
+            if token[:2] == (PUNCT, ']'):
+                return
+            if token[:2] != (PUNCT, '{'):
+                raise self._error("Expected a game object", token[2])
+            yield self._make_game(self._parse_object(tokens, token[2]), token[2])
+            token = self._expect_value(tokens, token[2])
+            if token[1] == ']':
+                return
+            if token[1] != ',':
+                raise self._error("Expected ',' or ']' in games array", token[2])
+
+    def _make_game(self, props: Dict[str, Any], pos: int) -> Game:
+        for prop in ('id', 'title', 'category', 'description', 'icon'):
+            if not isinstance(props.get(prop, ''), str):
+                raise self._error(f"Game property {prop!r} must be a string", pos)
+        if not props.get('id'):
+            raise self._error("Game object is missing an 'id'", pos)
+        return Game(
+            id=props['id'],
+            title=props.get('title', ''),
+            category=props.get('category', ''),
+            description=props.get('description', ''),
+            icon=props.get('icon', ''),
+            difficulty=props.get('difficulty', 'medium'),
+            languages=props.get('languages')
+        )
+
+    def iter_games(self) -> Iterator[Game]:
+        """Yield Game records from the `games` array as soon as each is parsed."""
+        for _, tokens, pos in self._declarations(('games',)):
+            yield from self._iter_game_records(tokens, pos)
+            return
+
+    def parse(self) -> ParsedScript:
+        """Parse the `games` array and `translations` object, stopping once both are read."""
+        result = ParsedScript()
+        pending = {'games', 'translations'}
+        for name, tokens, pos in self._declarations(('games', 'translations')):
+            if name not in pending:
+                continue
+            if name == 'games':
+                result.games = list(self._iter_game_records(tokens, pos))
+            else:
+                token = self._expect_value(tokens, pos)
+                if token[:2] != (PUNCT, '{'):
+                    raise self._error("Expected '{' to start the translations object", token[2])
+                result.translations = self._parse_object(tokens, token[2])
+            pending.discard(name)
+            if not pending:
+                break
+        return result
+
+def parse_script(text: str) -> ParsedScript:
+    """Parse games and translations from script.js source text."""
+    return ScriptParser(text).parse()
+
+def parse_script_file(path) -> ParsedScript:
+    """Parse games and translations from a script.js file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_script(f.read())
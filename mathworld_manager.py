@@ -9,93 +9,747 @@ Version: 1.0
 Date: 2025
 """
 
+import hashlib
 import json
 import os
-import re
 import random
-from typing import Dict, List, Tuple, Any
-from dataclasses import dataclass
+import time
+from array import array
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Tuple, Any, Optional, Iterator, Sequence
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the batch problem engine needs it
+    np = None
+
+import instrumentation
+from backup_store import BackupStore, RACY_WINDOW_NS
+from code_scanner import ScanResult, scan_file
+from game_catalog import GameCatalog, write_catalog
+from game_export import ExportResult, export_records
+from js_parser import Game, ParsedScript, ScriptParseError, ScriptParser, parse_script
+from translations import TranslationIndex
+
+CACHE_DIR_NAME = ".mathworld_cache"
+CATALOG_FILE_NAME = "catalog.bin"
+PARSE_CACHE_VERSION = 1
+
+# Arithmetic problem rules shared by every generator:
+#   '+' and '*': both operands drawn from the range
+#   '-': first operand from the range, second from 1..first (non-negative result)
+#   '/': answer and divisor from the range, dividend = answer * divisor (exact)
+# so the ranges of '-' and '/' must start at 1 or more (no b > a, no 0 / 0)
+OPERATIONS = ['+', '-', '*', '/']
+PROBLEM_RANGES = {'+': (1, 50), '-': (10, 50), '*': (2, 12), '/': (2, 12)}
+DIFFICULTY_LEVELS = ("easy", "medium", "hard")
+
+PLATFORM_INFO = {
+    "name": "MathWorld",
+    "version": "1.0",
+    "author": "A.Cherifi",
+    "year": "2025"
+}
+
+def problem_difficulty(answer: int) -> str:
+    """Difficulty band of a problem, judged by its answer."""
+    return "easy" if answer < 20 else "medium" if answer < 100 else "hard"
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+def _mix64(z: int) -> int:
+    """SplitMix64 output function (a bijective 64-bit mixer)."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+class ProblemStream:
+    """Deterministic, resumable stream of arithmetic problems.
+    
+    Problem N depends only on (seed, N): every random draw is SplitMix64
+    evaluated at counter 4*N + lane, so the stream can jump to any position
+    in O(1).  Workers can generate disjoint slices of one huge problem set
+    with `slice(start, stop)` without coordinating, and any single problem
+    can be regenerated on demand with `problem_at(n)`.  No global RNG state
+    is touched, so streams are safe to use from several threads.
+    """
+    
+    def __init__(self, seed: int, offset: int = 0, operations: Sequence[str] = OPERATIONS,
+                 ranges: Optional[Dict[str, Tuple[int, int]]] = None):
+        self.seed = seed
+        self.cursor = offset
+        self.operations = list(operations)
+        self.ranges = dict(PROBLEM_RANGES, **(ranges or {}))
+        for operation in self.operations:
+            if operation not in self.ranges:
+                raise ValueError(f"Unknown operation: {operation!r}")
+            low, high = self.ranges[operation]
+            if low > high:
+                raise ValueError(f"Empty range for {operation!r}: ({low}, {high})")
+            if operation in ('-', '/') and low < 1:
+                raise ValueError(f"Range for {operation!r} must start at 1 or more, got ({low}, {high})")
+        self._key = _mix64(seed & _MASK64)
+    
+    def _draw(self, index: int, lane: int, low: int, high: int) -> int:
+        """Uniform integer in [low, high] for the given problem and lane."""
+        counter = (index << 2) | lane
+        value = _mix64((self._key + (counter + 1) * _GOLDEN_GAMMA) & _MASK64)
+        return low + ((value * (high - low + 1)) >> 64)
+    
+    def operands_at(self, index: int) -> Tuple[str, int, int, int]:
+        """Return (operation, a, b, answer) of problem `index`."""
+        if index < 0:
+            raise IndexError("problem index must be non-negative")
+        operation = self.operations[self._draw(index, 0, 0, len(self.operations) - 1)]
+        low, high = self.ranges[operation]
+        if operation == '+':
+            a = self._draw(index, 1, low, high)
+            b = self._draw(index, 2, low, high)
+            return operation, a, b, a + b
+        if operation == '-':
+            a = self._draw(index, 1, low, high)
+            b = self._draw(index, 2, 1, a)
+            return operation, a, b, a - b
+        if operation == '*':
+            a = self._draw(index, 1, low, high)
+            b = self._draw(index, 2, low, high)
+            return operation, a, b, a * b
+        if operation == '/':
+            answer = self._draw(index, 1, low, high)
+            b = self._draw(index, 2, low, high)
+            return operation, answer * b, b, answer
+        raise ValueError(f"Unknown operation: {operation!r}")
+    
+    def problem_at(self, index: int) -> Dict[str, Any]:
+        """Regenerate problem `index` without touching the cursor."""
+        operation, a, b, answer = self.operands_at(index)
+        return {
+            "question": f"{a} {operation} {b} = ?",
+            "answer": answer,
+            "operation": operation,
+            "difficulty": problem_difficulty(answer)
+        }
+    
+    def __iter__(self) -> 'ProblemStream':
+        return self
+    
+    def __next__(self) -> Dict[str, Any]:
+        problem = self.problem_at(self.cursor)
+        self.cursor += 1
+        return problem
+    
+    def seek(self, offset: int):
+        """Move the cursor to problem `offset`."""
+        self.cursor = offset
+    
+    def take(self, count: int) -> List[Dict[str, Any]]:
+        """Return the next `count` problems and advance the cursor."""
+        return [next(self) for _ in range(count)]
+    
+    def slice(self, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        """Yield problems start..stop-1 without touching the cursor."""
+        for index in range(start, stop):
+            yield self.problem_at(index)
+    
+    def state(self) -> Dict[str, Any]:
+        """Everything needed to resume the stream later."""
+        return {"seed": self.seed, "cursor": self.cursor,
+                "operations": self.operations, "ranges": self.ranges}
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'ProblemStream':
+        """Resume a stream saved with state()."""
+        ranges = {op: tuple(bounds) for op, bounds in state.get("ranges", {}).items()}
+        return cls(state["seed"], state.get("cursor", 0),
+                   state.get("operations", OPERATIONS), ranges)
+
+class ProblemBatch:
+    """Columnar batch of arithmetic problems backed by NumPy arrays.
+    
+    `operations` holds indexes into OPERATIONS and `difficulty` indexes into
+    DIFFICULTY_LEVELS.  Question strings are only built on request.
+    """
+    
+    def __init__(self, operations, a, b, answers):
+        self.operations = operations
+        self.a = a
+        self.b = b
+        self.answers = answers
+        self.difficulty = np.where(answers < 20, 0, np.where(answers < 100, 1, 2)).astype(np.uint8)
+    
+    def __len__(self) -> int:
+        return len(self.answers)
+    
+    def question(self, index: int) -> str:
+        """Format one problem as a question string."""
+        operation = OPERATIONS[self.operations[index]]
+        return f"{self.a[index]} {operation} {self.b[index]} = ?"
+    
+    def questions(self) -> Iterator[str]:
+        """Lazily format every problem as a question string."""
+        for a, op, b in zip(self.a.tolist(), self.operations.tolist(), self.b.tolist()):
+            yield f"{a} {OPERATIONS[op]} {b} = ?"
+    
+    def to_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Lazily yield problems in the generate_random_math_problems() format."""
+        columns = zip(self.a.tolist(), self.operations.tolist(), self.b.tolist(),
+                      self.answers.tolist(), self.difficulty.tolist())
+        for a, op, b, answer, level in columns:
+            yield {
+                "question": f"{a} {OPERATIONS[op]} {b} = ?",
+                "answer": answer,
+                "operation": OPERATIONS[op],
+                "difficulty": DIFFICULTY_LEVELS[level]
+            }
+    
+    def save(self, path: str):
+        """Save the batch columns as a compressed .npz file."""
+        np.savez_compressed(path, operations=self.operations, a=self.a, b=self.b, answers=self.answers)
+    
+    @classmethod
+    def load(cls, path: str) -> 'ProblemBatch':
+        """Load a batch written by save()."""
+        with np.load(path) as data:
+            return cls(data['operations'], data['a'], data['b'], data['answers'])
+
+class DistractorGenerator:
+    """Plausible wrong answer options, generated in bounded time.
+    
+    Follows script.js `generateOptions`: wrong options lie within
+    [-spread, spread) of the correct answer and are never negative.  Instead
+    of rejection sampling, options are drawn without replacement from a
+    precomputed candidate window (extended upwards when a small answer leaves
+    too few candidates) and shuffled with Fisher-Yates (`random.shuffle`),
+    so every call finishes in O(spread + count) steps.
+    """
+    
+    def __init__(self, spread: int = 5, seed: Optional[int] = None):
+        self.spread = spread
+        self.rng = random.Random(seed)
+        self._offsets = [offset for offset in range(-spread, spread) if offset]
+    
+    def candidates(self, correct: int, needed: int) -> List[int]:
+        """Candidate wrong answers around `correct`, at least `needed` of them."""
+        window = [correct + offset for offset in self._offsets if correct + offset >= 0]
+        extra = correct + self.spread
+        while len(window) < needed:
+            window.append(extra)
+            extra += 1
+        return window
+    
+    def options_for(self, correct: int, count: int = 4) -> List[int]:
+        """Return `count` shuffled options, one of which is `correct`."""
+        options = [correct] + self.rng.sample(self.candidates(correct, count - 1), count - 1)
+        self.rng.shuffle(options)
+        return options
+    
+    def add_options(self, problems: Sequence[Dict[str, Any]], count: int = 4) -> List[Dict[str, Any]]:
+        """Return copies of problem dicts with an `options` list added."""
+        return [dict(problem, options=self.options_for(problem["answer"], count))
+                for problem in problems]
+    
+    def batch_options(self, answers, count: int = 4, seed: Optional[int] = None):
+        """Vectorized options for a whole pack: an (N, count) int64 array.
+        
+        Same rules as options_for(): each row is the correct answer plus
+        `count - 1` distinct in-window candidates (extension values only when
+        the window is short), in a uniformly random order.
+        """
+        if np is None:
+            raise ImportError("batch_options requires NumPy: pip install numpy")
+        
+        rng = np.random.default_rng(seed)
+        answers = np.asarray(answers, dtype=np.int64).reshape(-1, 1)
+        width = len(self._offsets)
+        offsets = np.array(self._offsets + list(range(self.spread, self.spread + count)), dtype=np.int64)
+        candidates = answers + offsets
+        
+        # In-window candidates get random keys in [0, 1); extension values
+        # get fixed keys >= 2 so they are only taken, in order, when needed.
+        keys = rng.random(candidates.shape)
+        keys[:, width:] = 2.0 + np.arange(count)
+        keys[candidates < 0] = np.inf
+        picks = np.argsort(keys, axis=1)[:, :count - 1]
+        options = np.concatenate([answers, np.take_along_axis(candidates, picks, axis=1)], axis=1)
+        
+        order = np.argsort(rng.random(options.shape), axis=1)
+        return np.take_along_axis(options, order, axis=1)
+
+# Answer ranges of the difficulty bands, inclusive (see problem_difficulty)
+_BAND_BOUNDS = {"easy": (None, 19), "medium": (20, 99), "hard": (100, None)}
+_COMMUTATIVE = frozenset(['+', '*'])
+_KEY_OPERAND_BITS = 30
+
+def problem_key(operation: str, a: int, b: int) -> int:
+    """Pack a problem into a non-zero 64-bit key.
+    
+    Commutative operations are canonicalized, so `6 * 7` and `7 * 6` share
+    a key.  Operands must be below 2**30.
+    """
+    if operation in _COMMUTATIVE and a > b:
+        a, b = b, a
+    if not (0 <= a < 1 << _KEY_OPERAND_BITS and 0 <= b < 1 << _KEY_OPERAND_BITS):
+        raise ValueError(f"operands out of key range: {a}, {b}")
+    return ((OPERATIONS.index(operation) + 1) << (2 * _KEY_OPERAND_BITS)) | (a << _KEY_OPERAND_BITS) | b
+
+def _count_in_band(low: int, high: int, band: str) -> int:
+    """How many integers in [low, high] fall in a difficulty band."""
+    band_low, band_high = _BAND_BOUNDS[band]
+    if band_low is not None:
+        low = max(low, band_low)
+    if band_high is not None:
+        high = min(high, band_high)
+    return max(0, high - low + 1)
+
+def problem_space(operation: str, low: int, high: int) -> Dict[str, int]:
+    """Count the distinct (canonical) problems of an operation per difficulty band."""
+    counts = dict.fromkeys(DIFFICULTY_LEVELS, 0)
+    for band in DIFFICULTY_LEVELS:
+        if operation == '+':
+            # unordered pairs a <= b, answer a + b
+            counts[band] = sum(_count_in_band(2 * a, a + high, band) for a in range(low, high + 1))
+        elif operation == '-':
+            # a in range, b in 1..a, answer a - b in 0..a-1
+            counts[band] = sum(_count_in_band(0, a - 1, band) for a in range(low, high + 1))
+        elif operation == '*':
+            # unordered pairs a <= b; count b in [a, high] with a * b in the band
+            band_low, band_high = _BAND_BOUNDS[band]
+            total = 0
+            for a in range(low, high + 1):
+                b_low = a if band_low is None else max(a, -(-band_low // a))
+                b_high = high if band_high is None else min(high, band_high // a)
+                total += max(0, b_high - b_low + 1)
+            counts[band] = total
+        elif operation == '/':
+            # answer and divisor both free; the band depends on the answer only
+            counts[band] = _count_in_band(low, high, band) * (high - low + 1)
+        else:
+            raise ValueError(f"Unknown operation: {operation!r}")
+    return counts
+
+class ProblemKeyIndex:
+    """Compact hash set of 64-bit problem keys.
+    
+    Keys live in one open-addressing table (`array('Q')`, linear probing,
+    load factor at most 0.75) with no per-key Python objects: 8 bytes per
+    slot, so 10M keys fit in a 2**24-slot table of 128 MiB.
+    """
+    
+    _MAX_LOAD = 0.75
+    
+    def __init__(self, capacity: int = 1024):
+        bits = max(4, (int(capacity / self._MAX_LOAD) - 1).bit_length())
+        self._allocate(bits)
+        self._count = 0
+    
+    def _allocate(self, bits: int):
+        self._bits = bits
+        self._shift = 64 - bits
+        self._mask = (1 << bits) - 1
+        self._slots = array('Q', bytes(8 << bits))
+        self._limit = int((1 << bits) * self._MAX_LOAD)
+    
+    def _slot(self, key: int) -> int:
+        index = ((key * _GOLDEN_GAMMA) & _MASK64) >> self._shift
+        slots = self._slots
+        while True:
+            current = slots[index]
+            if current == key or current == 0:
+                return index
+            index = (index + 1) & self._mask
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __contains__(self, key: int) -> bool:
+        return self._slots[self._slot(key)] == key
+    
+    def add(self, key: int) -> bool:
+        """Insert a key; return False if it was already present."""
+        if not key:
+            raise ValueError("problem keys must be non-zero")
+        index = self._slot(key)
+        if self._slots[index] == key:
+            return False
+        self._slots[index] = key
+        self._count += 1
+        if self._count > self._limit:
+            self._grow()
+        return True
+    
+    def _grow(self):
+        old = self._slots
+        self._allocate(self._bits + 1)
+        for key in old:
+            if key:
+                self._slots[self._slot(key)] = key
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the key table."""
+        return self._slots.itemsize * len(self._slots)
+
 @dataclass
-class Game:
-    """Represents a game in the MathWorld platform."""
-    id: str
-    title: str
-    category: str
-    description: str
-    icon: str
-    difficulty: str = "medium"
-    languages: List[str] = None
-    
-    def __post_init__(self):
-        if self.languages is None:
-            self.languages = ["en", "ar", "fr"]
+class ProblemSet:
+    """Result of ProblemSetBuilder.build()."""
+    problems: Dict[str, List[Dict[str, Any]]]
+    exhausted: List[str] = field(default_factory=list)
+    draws: int = 0
+    duplicates: int = 0
+
+class ProblemSetBuilder:
+    """Build sets of unique problems per difficulty band.
+    
+    Problems are drawn from a seeded ProblemStream and deduplicated through a
+    ProblemKeyIndex, with `a + b`/`b + a` and `a * b`/`b * a` treated as the
+    same problem.  The index persists across build() calls, so successive
+    sets never repeat a problem.  When a band asks for more problems than its
+    space still holds, the band is filled completely and reported as
+    exhausted instead of looping forever.
+    """
+    
+    def __init__(self, seed: int, operations: Sequence[str] = OPERATIONS,
+                 ranges: Optional[Dict[str, Tuple[int, int]]] = None,
+                 index: Optional[ProblemKeyIndex] = None):
+        self.stream = ProblemStream(seed, operations=operations, ranges=ranges)
+        self.index = index if index is not None else ProblemKeyIndex()
+        self.band_counts = dict.fromkeys(DIFFICULTY_LEVELS, 0)
+    
+    def capacity(self) -> Dict[str, int]:
+        """Distinct problems available per band for the configured operations."""
+        totals = dict.fromkeys(DIFFICULTY_LEVELS, 0)
+        for operation in set(self.stream.operations):
+            low, high = self.stream.ranges[operation]
+            for band, count in problem_space(operation, low, high).items():
+                totals[band] += count
+        return totals
+    
+    def build(self, count: Any, max_draws: Optional[int] = None) -> ProblemSet:
+        """Draw unique problems until each band has `count` of them.
+        
+        `count` is a number for every band or a {band: number} dict.  Bands
+        whose remaining space is smaller than requested are filled and listed
+        in `exhausted`; so are bands still short when `max_draws` runs out.
+        """
+        wanted = count if isinstance(count, dict) else dict.fromkeys(DIFFICULTY_LEVELS, count)
+        capacity = self.capacity()
+        needed: Dict[str, int] = {}
+        exhausted = []
+        for band, requested in wanted.items():
+            remaining = capacity[band] - self.band_counts[band]
+            if requested > remaining:
+                exhausted.append(band)
+            if min(requested, remaining) > 0:
+                needed[band] = min(requested, remaining)
+        
+        result = ProblemSet(problems={band: [] for band in wanted}, exhausted=exhausted)
+        while needed:
+            if max_draws is not None and result.draws >= max_draws:
+                result.exhausted.extend(band for band in needed if band not in result.exhausted)
+                break
+            operation, a, b, answer = self.stream.operands_at(self.stream.cursor)
+            self.stream.cursor += 1
+            result.draws += 1
+            band = problem_difficulty(answer)
+            if band not in needed:
+                continue
+            if not self.index.add(problem_key(operation, a, b)):
+                result.duplicates += 1
+                continue
+            result.problems[band].append({
+                "question": f"{a} {operation} {b} = ?",
+                "answer": answer,
+                "operation": operation,
+                "difficulty": band
+            })
+            self.band_counts[band] += 1
+            needed[band] -= 1
+            if not needed[band]:
+                del needed[band]
+        
+        return result
+
+def _empty_statistics() -> Dict[str, Any]:
+    return {
+        "total_games": 0,
+        "categories": {},
+        "languages_supported": ["en", "ar", "fr"],
+        "games_by_category": {},
+        "difficulty_distribution": {"easy": 0, "medium": 0, "hard": 0}
+    }
+
+def _count_game(stats: Dict[str, Any], game: Dict[str, Any]):
+    """Add one game to statistics built by _empty_statistics()."""
+    category = game.get('category', 'unknown')
+    stats["total_games"] += 1
+    stats["categories"][category] = stats["categories"].get(category, 0) + 1
+    stats["games_by_category"].setdefault(category, []).append(game['title'])
+
+class ParseCache:
+    """Cache of parsed script.js contents, keyed by mtime, size and content hash.
+    
+    Entries are kept in memory and, when a cache directory is given, also on
+    disk so that separate CLI runs can reuse them.  A stat match (mtime and
+    size) is trusted without reading the file; otherwise the content hash
+    decides whether the previous parse is still valid.  The stat of a file
+    modified within RACY_WINDOW_NS of being parsed is not recorded, since a
+    second change in the same mtime tick would go unnoticed; such a file is
+    hashed again on its next lookup, which records the stat once the window
+    has passed.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+    
+    def clear(self):
+        """Drop in-memory entries and reset counters (the disk copy is kept)."""
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = 0
+    
+    def peek(self, path: Path) -> Optional[ParsedScript]:
+        """Return the in-memory parse of `path` if it is still current, else None."""
+        entry = self._entries.get(str(Path(path).resolve()))
+        if not entry:
+            return None
+        st = os.stat(path)
+        if entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return entry["parsed"]
+        return None
+    
+    def get(self, path: Path) -> ParsedScript:
+        """Return the parse of `path`, parsing only if its content changed."""
+        key = str(Path(path).resolve())
+        st = os.stat(path)
+        
+        entry = self._entries.get(key) or self._load_index_entry(key)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            parsed = entry.get("parsed") or self._load_parsed(entry["sha256"])
+            if parsed is not None:
+                self._remember(key, entry, parsed)
+                self.hits += 1
+                return parsed
+        
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        racy = time.time_ns() - st.st_mtime_ns <= RACY_WINDOW_NS
+        entry = {"mtime_ns": None if racy else st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+        
+        parsed = self._load_parsed(digest)
+        if parsed is not None:
+            self.hits += 1
+        else:
+            with instrumentation.stage('parse.source') as span:
+                span.add_bytes(len(data))
+                parsed = parse_script(data.decode('utf-8'))
+            self.misses += 1
+            self._store_parsed(digest, parsed)
+        
+        self._remember(key, entry, parsed)
+        self._store_index_entry(key, entry)
+        return parsed
+    
+    def _remember(self, key: str, entry: Dict[str, Any], parsed: ParsedScript):
+        self._entries[key] = dict(entry, parsed=parsed)
+    
+    def _load_parsed(self, digest: str) -> Optional[ParsedScript]:
+        """Find a parse for the given content hash in memory or on disk."""
+        for entry in self._entries.values():
+            if entry["sha256"] == digest:
+                return entry["parsed"]
+        
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self.cache_dir / f"parse-{digest}.json", 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != PARSE_CACHE_VERSION:
+                return None
+            parsed = ParsedScript(
+                games=[Game(**game) for game in data["games"]],
+                translations=data["translations"]
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        self.disk_hits += 1
+        return parsed
+    
+    def _store_parsed(self, digest: str, parsed: ParsedScript):
+        if not self.cache_dir:
+            return
+        self._write_json(self.cache_dir / f"parse-{digest}.json", {
+            "version": PARSE_CACHE_VERSION,
+            "games": [asdict(game) for game in parsed.games],
+            "translations": parsed.translations
+        })
+    
+    def _read_index(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_dir / "index.json", 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            return index if index.get("version") == PARSE_CACHE_VERSION else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _load_index_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.cache_dir:
+            return None
+        return self._read_index().get("files", {}).get(key)
+    
+    def _store_index_entry(self, key: str, entry: Dict[str, Any]):
+        if not self.cache_dir:
+            return
+        index = self._read_index()
+        files = index.get("files", {})
+        if files.get(key) == entry:
+            return
+        files[key] = entry
+        self._write_json(self.cache_dir / "index.json", {
+            "version": PARSE_CACHE_VERSION,
+            "files": files
+        })
+    
+    def _write_json(self, target: Path, data: Dict[str, Any]):
+        """Write JSON atomically; cache write failures are not fatal."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, target)
+        except OSError as e:
+            print(f"Warning: could not write parse cache {target}: {e}")
 
 class MathWorldManager:
     """Main manager class for MathWorld platform."""
     
-    def __init__(self, base_path: str = "."):
+    def __init__(self, base_path: str = ".", disk_cache: bool = False):
         self.base_path = Path(base_path)
         self.games_file = self.base_path / "script.js"
         self.html_file = self.base_path / "index.html"
         self.readme_file = self.base_path / "README.md"
+        self.parse_cache = ParseCache(self.base_path / CACHE_DIR_NAME if disk_cache else None)
         
+    @instrumentation.instrumented('parse')
+    def parse_script(self) -> ParsedScript:
+        """Parse the games array and translations object from script.js.
+        
+        Results are served from the parse cache while script.js is unchanged;
+        the returned object is shared and should not be modified.
+        """
+        return self.parse_cache.get(self.games_file)
+    
+    def extract_game_records(self) -> List[Game]:
+        """Extract games from the JavaScript file as typed Game records."""
+        return list(self.parse_script().games)
+    
+    def iter_game_records(self) -> Iterator[Game]:
+        """Yield games as they are parsed, without building the full list.
+        
+        A parse already held by the parse cache is reused instead.
+        """
+        parsed = self.parse_cache.peek(self.games_file)
+        if parsed is not None:
+            yield from parsed.games
+            return
+        with open(self.games_file, 'r', encoding='utf-8') as f:
+            text = f.read()
+        yield from ScriptParser(text).iter_games()
+    
+    def translation_index(self, reference: Optional[str] = None) -> TranslationIndex:
+        """Per-language index of the translations object in script.js."""
+        return TranslationIndex.from_parsed(self.parse_script(), reference)
+    
+    def export_translation_slices(self, output_dir: str = "translations",
+                                  fallback: bool = True) -> Dict[str, Any]:
+        """Write translations.<language>.json per language plus a manifest; returns the manifest."""
+        with instrumentation.stage('export.translations') as span:
+            manifest = self.translation_index().export_slices(output_dir, fallback=fallback)
+            span.add_bytes(sum(entry['bytes'] for entry in manifest['languages'].values()))
+        return manifest
+    
+    def catalog_path(self) -> Path:
+        """Default location of the compiled catalog."""
+        return self.base_path / CACHE_DIR_NAME / CATALOG_FILE_NAME
+    
+    def compile_catalog(self, path: Optional[str] = None) -> Path:
+        """Compile games and translations from script.js into a binary catalog."""
+        path = Path(path) if path else self.catalog_path()
+        # Stat before reading, so the recorded stat is never newer than the hashed content
+        st = os.stat(self.games_file)
+        with open(self.games_file, 'rb') as f:
+            data = f.read()
+        # A racy stat (see ParseCache) is recorded as 0 and the hash decides instead
+        mtime_ns = 0 if time.time_ns() - st.st_mtime_ns <= RACY_WINDOW_NS else st.st_mtime_ns
+        # Parse the bytes that were hashed; reading script.js again could see a newer version
+        with instrumentation.stage('catalog.compile') as span:
+            span.add_bytes(write_catalog(parse_script(data.decode('utf-8')), str(path), st.st_size, mtime_ns,
+                                         hashlib.sha256(data).digest()))
+        return path
+    
+    def open_catalog(self, path: Optional[str] = None, rebuild: bool = True) -> GameCatalog:
+        """Open the compiled catalog, recompiling it first if script.js changed.
+        
+        As with the parse cache, a matching mtime and size are trusted and
+        otherwise the content hash decides; a catalog compiled within the
+        racy window of a script.js change is recompiled once that has
+        settled, so its stat can be recorded.  Without script.js (e.g. a
+        deployment shipping only the catalog) the catalog is used as is.
+        Close the returned catalog when done.
+        """
+        path = Path(path) if path else self.catalog_path()
+        if rebuild and self.games_file.exists() and not self._catalog_is_current(path):
+            self.compile_catalog(str(path))
+        return GameCatalog.open(str(path))
+    
+    def _catalog_is_current(self, path: Path) -> bool:
+        try:
+            catalog = GameCatalog.open(str(path))
+        except (OSError, ValueError):
+            return False
+        with catalog:
+            st = os.stat(self.games_file)
+            if (catalog.source_mtime_ns and catalog.source_size == st.st_size
+                    and catalog.source_mtime_ns == st.st_mtime_ns):
+                return True
+            with open(self.games_file, 'rb') as f:
+                if catalog.source_sha256 != hashlib.sha256(f.read()).hexdigest():
+                    return False
+            # Same content, but a stat that was not recorded can be now
+            return bool(catalog.source_mtime_ns) or time.time_ns() - st.st_mtime_ns <= RACY_WINDOW_NS
+    
     def extract_games_from_js(self) -> List[Dict[str, Any]]:
         """Extract games data from JavaScript file."""
         try:
-            with open(self.games_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Find games array
-            games_match = re.search(r'const games = \[(.*?)\];', content, re.DOTALL)
-            if not games_match:
-                return []
-            
-            games_text = games_match.group(1)
-            games = []
-            
-            # Parse individual game objects
-            game_pattern = r'\{[^}]*id:\s*[\'"]([^\'"]+)[\'"][^}]*\}'
-            for match in re.finditer(game_pattern, games_text, re.DOTALL):
-                game_block = match.group(0)
-                
-                # Extract game properties
-                game_data = {}
-                for prop in ['id', 'title', 'category', 'description', 'icon']:
-                    prop_match = re.search(f'{prop}:\s*[\'"]([^\'"]+)[\'"]', game_block)
-                    if prop_match:
-                        game_data[prop] = prop_match.group(1)
-                
-                if game_data:
-                    games.append(game_data)
-            
-            return games
-            
+            return [game.to_dict() for game in self.extract_game_records()]
+        except ScriptParseError as e:
+            print(f"Error parsing {self.games_file}: {e}")
+            return []
         except Exception as e:
             print(f"Error extracting games: {e}")
             return []
     
     def generate_game_statistics(self) -> Dict[str, Any]:
         """Generate statistics about the games."""
-        games = self.extract_games_from_js()
-        
-        stats = {
-            "total_games": len(games),
-            "categories": {},
-            "languages_supported": ["en", "ar", "fr"],
-            "games_by_category": {},
-            "difficulty_distribution": {"easy": 0, "medium": 0, "hard": 0}
-        }
-        
-        for game in games:
-            category = game.get('category', 'unknown')
-            stats["categories"][category] = stats["categories"].get(category, 0) + 1
-            
-            if category not in stats["games_by_category"]:
-                stats["games_by_category"][category] = []
-            stats["games_by_category"][category].append(game['title'])
-        
+        stats = _empty_statistics()
+        for game in self.extract_games_from_js():
+            _count_game(stats, game)
         return stats
     
     def create_game_template(self, game_id: str, title: str, category: str, 
@@ -111,39 +765,126 @@ class MathWorldManager:
     }}"""
         return template
     
-    def generate_random_math_problems(self, count: int = 10) -> List[Dict[str, Any]]:
-        """Generate random math problems for testing."""
+    def generate_random_math_problems(self, count: int = 10, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Generate random math problems for testing.
+        
+        Uses a private RNG, so passing `seed` makes the result reproducible.
+        """
         problems = []
-        operations = ['+', '-', '*', '/']
+        rng = random.Random(seed)
         
         for _ in range(count):
-            operation = random.choice(operations)
+            operation = rng.choice(OPERATIONS)
+            low, high = PROBLEM_RANGES[operation]
             if operation == '+':
-                a = random.randint(1, 50)
-                b = random.randint(1, 50)
+                a = rng.randint(low, high)
+                b = rng.randint(low, high)
                 answer = a + b
             elif operation == '-':
-                a = random.randint(10, 50)
-                b = random.randint(1, a)
+                a = rng.randint(low, high)
+                b = rng.randint(1, a)
                 answer = a - b
             elif operation == '*':
-                a = random.randint(2, 12)
-                b = random.randint(2, 12)
+                a = rng.randint(low, high)
+                b = rng.randint(low, high)
                 answer = a * b
             else:  # division
-                answer = random.randint(2, 12)
-                b = random.randint(2, 12)
+                answer = rng.randint(low, high)
+                b = rng.randint(low, high)
                 a = answer * b
             
             problems.append({
                 "question": f"{a} {operation} {b} = ?",
                 "answer": answer,
                 "operation": operation,
-                "difficulty": "easy" if answer < 20 else "medium" if answer < 100 else "hard"
+                "difficulty": problem_difficulty(answer)
             })
         
         return problems
     
+    def export_problem_pack(self, output_file: str = "problem_pack.json", count_per_operation: int = 100,
+                            seed: Optional[int] = None, options: int = 4) -> bool:
+        """Export pre-generated problems with answer options for the front end."""
+        try:
+            if np is None:
+                raise ImportError("export_problem_pack requires NumPy: pip install numpy")
+            # Independent child streams, so the options never mirror the problems' draws
+            problem_seed, option_seed = np.random.SeedSequence(seed).spawn(2)
+            batch = self.generate_problem_batch(count_per_operation, seed=problem_seed)
+            option_rows = DistractorGenerator().batch_options(batch.answers, options, seed=option_seed).tolist()
+            
+            problems = []
+            for problem, row in zip(batch.to_dicts(), option_rows):
+                problem["options"] = row
+                problems.append(problem)
+            
+            with instrumentation.stage('export.problem_pack') as span:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump({"version": 1, "seed": seed, "problems": problems}, f, ensure_ascii=False)
+                span.add_bytes(os.path.getsize(output_file))
+            
+            print(f"Problem pack exported successfully to {output_file}")
+            return True
+            
+        except Exception as e:
+            print(f"Error exporting problem pack: {e}")
+            return False
+    
+    def problem_stream(self, seed: int, offset: int = 0) -> ProblemStream:
+        """Open a deterministic problem stream positioned at `offset`."""
+        return ProblemStream(seed, offset)
+    
+    def build_unique_problem_set(self, count_per_band: Any, seed: int) -> ProblemSet:
+        """Build a problem set with `count_per_band` unique problems per difficulty band."""
+        return ProblemSetBuilder(seed).build(count_per_band)
+    
+    def generate_problem_batch(self, count_per_operation: int,
+                               operations: Sequence[str] = OPERATIONS,
+                               seed: Optional[int] = None) -> ProblemBatch:
+        """Generate `count_per_operation` problems for each operation with vectorized RNG.
+        
+        Follows the same rules as generate_random_math_problems(); the same
+        seed always gives the same batch.
+        """
+        if np is None:
+            raise ImportError("generate_problem_batch requires NumPy: pip install numpy")
+        
+        rng = np.random.default_rng(seed)
+        n = count_per_operation
+        op_columns, a_columns, b_columns, answer_columns = [], [], [], []
+        
+        for operation in operations:
+            low, high = PROBLEM_RANGES[operation]
+            if operation == '+':
+                a = rng.integers(low, high, size=n, endpoint=True)
+                b = rng.integers(low, high, size=n, endpoint=True)
+                answers = a + b
+            elif operation == '-':
+                a = rng.integers(low, high, size=n, endpoint=True)
+                b = rng.integers(1, a, endpoint=True)
+                answers = a - b
+            elif operation == '*':
+                a = rng.integers(low, high, size=n, endpoint=True)
+                b = rng.integers(low, high, size=n, endpoint=True)
+                answers = a * b
+            elif operation == '/':
+                answers = rng.integers(low, high, size=n, endpoint=True)
+                b = rng.integers(low, high, size=n, endpoint=True)
+                a = answers * b
+            else:
+                raise ValueError(f"Unknown operation: {operation!r}")
+            
+            op_columns.append(np.full(n, OPERATIONS.index(operation), dtype=np.uint8))
+            a_columns.append(a)
+            b_columns.append(b)
+            answer_columns.append(answers)
+        
+        if not op_columns:
+            empty = np.zeros(0, dtype=np.int64)
+            return ProblemBatch(np.zeros(0, dtype=np.uint8), empty, empty, empty)
+        return ProblemBatch(np.concatenate(op_columns), np.concatenate(a_columns),
+                            np.concatenate(b_columns), np.concatenate(answer_columns))
+    
     def validate_platform_structure(self) -> Dict[str, bool]:
         """Validate the platform file structure."""
         validation = {
@@ -157,15 +898,13 @@ class MathWorldManager:
         try:
             # Check if files are readable
             if validation["index_html_exists"]:
-                with open(self.html_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    validation["html_has_games"] = "games" in content.lower()
+                html = self._scan(self.html_file)
+                validation["html_has_games"] = html.count('games_ref') > 0
             
             if validation["script_js_exists"]:
-                with open(self.games_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    validation["js_has_games_array"] = "const games" in content
-                    validation["js_has_translations"] = "translations" in content
+                script = self._scan(self.games_file)
+                validation["js_has_games_array"] = script.count('games_declaration') > 0
+                validation["js_has_translations"] = script.count('translations_ref') > 0
             
         except Exception as e:
             validation["files_readable"] = False
@@ -180,18 +919,15 @@ class MathWorldManager:
             stats = self.generate_game_statistics()
             
             export_data = {
-                "platform_info": {
-                    "name": "MathWorld",
-                    "version": "1.0",
-                    "author": "A.Cherifi",
-                    "year": "2025"
-                },
+                "platform_info": PLATFORM_INFO,
                 "statistics": stats,
                 "games": games
             }
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            with instrumentation.stage('export.games') as span:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                span.add_bytes(os.path.getsize(output_file))
             
             print(f"Games exported successfully to {output_file}")
             return True
@@ -200,64 +936,102 @@ class MathWorldManager:
             print(f"Error exporting games: {e}")
             return False
     
+    def export_games_stream(self, output_file: str = "games_export.ndjson", format: str = "ndjson",
+                            compression: Optional[str] = None,
+                            chunk_size: int = 1000) -> Optional[ExportResult]:
+        """Stream games from the parser to an NDJSON or compact JSON export.
+        
+        `compression` is 'none', 'gzip' or 'zstd'; by default it follows the
+        file name (.gz, .zst).  JSON exports end with the statistics, counted
+        while the games are written.  See game_export for the layout.
+        """
+        try:
+            stats = _empty_statistics()
+            
+            def games() -> Iterator[Dict[str, Any]]:
+                for record in self.iter_game_records():
+                    game = record.to_dict()
+                    _count_game(stats, game)
+                    yield game
+            
+            trailer = (lambda: {"statistics": stats}) if format == "json" else None
+            with instrumentation.stage('export.stream', format=format) as span:
+                result = export_records(games(), output_file, format=format, compression=compression,
+                                        header={"platform_info": PLATFORM_INFO}, trailer=trailer,
+                                        chunk_size=chunk_size)
+                span.add_bytes(result.bytes)
+            
+            print(f"Games exported successfully to {output_file} "
+                  f"({result.records} games, {result.bytes:,} bytes, {result.compression})")
+            return result
+            
+        except Exception as e:
+            print(f"Error exporting games: {e}")
+            return None
+    
+    def backup_store(self) -> BackupStore:
+        """The content-addressed store under backups/."""
+        return BackupStore(self.base_path / "backups")
+    
     def create_backup(self, backup_name: str = None) -> str:
-        """Create a backup of the platform files."""
+        """Create a backup of the platform files.
+        
+        Files are stored as deduplicated chunks plus a manifest, so only
+        changed content takes space; returns the manifest path.
+        """
         if not backup_name:
             from datetime import datetime
             backup_name = f"mathworld_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        backup_dir = self.base_path / "backups" / backup_name
-        backup_dir.mkdir(parents=True, exist_ok=True)
-        
         files_to_backup = [self.html_file, self.games_file, self.readme_file]
+        store = self.backup_store()
         
-        for file_path in files_to_backup:
-            if file_path.exists():
-                backup_file = backup_dir / file_path.name
-                with open(file_path, 'r', encoding='utf-8') as src:
-                    with open(backup_file, 'w', encoding='utf-8') as dst:
-                        dst.write(src.read())
+        with instrumentation.stage('backup') as span:
+            manifest = store.backup(files_to_backup, backup_name, base=self.base_path)
+            span.add_bytes(manifest['stats']['stored_bytes'])
         
-        print(f"Backup created in: {backup_dir}")
-        return str(backup_dir)
+        stats = manifest['stats']
+        print(f"Backup {backup_name}: {stats['files']} files, {stats['bytes']:,} bytes, "
+              f"{stats['stored_bytes']:,} new ({stats['seconds'] * 1000:.1f} ms)")
+        return str(store.manifest_path(backup_name))
+    
+    def restore_backup(self, backup_name: str, target_dir: str) -> List[Path]:
+        """Restore a backup made by create_backup() into `target_dir`."""
+        return self.backup_store().restore(backup_name, target_dir)
+    
+    def _scan(self, path: Path) -> ScanResult:
+        """One-pass scan of a platform file (see code_scanner)."""
+        with instrumentation.stage('scan', file=path.name) as span:
+            result = scan_file(str(path))
+            span.add_bytes(result.size)
+        return result
     
     def analyze_code_quality(self) -> Dict[str, Any]:
-        """Analyze the code quality of the platform."""
+        """Analyze the code quality of the platform.
+        
+        Everything comes from one pass over script.js; `issue_locations`
+        lists each issue hit with its line and column.
+        """
         analysis = {
             "total_lines": 0,
             "functions_count": 0,
             "games_count": 0,
             "translations_count": 0,
-            "potential_issues": []
+            "potential_issues": [],
+            "issue_locations": []
         }
         
         try:
-            with open(self.games_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
-                analysis["total_lines"] = len(lines)
-                
-                # Count functions
-                function_matches = re.findall(r'function\s+\w+', content)
-                analysis["functions_count"] = len(function_matches)
-                
-                # Count games
-                games = self.extract_games_from_js()
-                analysis["games_count"] = len(games)
-                
-                # Count translations
-                translation_matches = re.findall(r'[\'"][\w\s]+[\'"]:\s*[\'"][^\'"]+[\'"]', content)
-                analysis["translations_count"] = len(translation_matches)
-                
-                # Check for potential issues
-                if 'console.log' in content:
-                    analysis["potential_issues"].append("Found console.log statements")
-                
-                if 'alert(' in content:
-                    analysis["potential_issues"].append("Found alert() statements")
-                
-                if 'TODO' in content or 'FIXME' in content:
-                    analysis["potential_issues"].append("Found TODO/FIXME comments")
+            result = self._scan(self.games_file)
+            analysis["total_lines"] = result.lines
+            analysis["functions_count"] = result.count('function')
+            analysis["games_count"] = result.games_count
+            analysis["translations_count"] = result.count('translation')
+            analysis["potential_issues"] = result.issue_messages
+            analysis["issue_locations"] = [
+                {"kind": issue.kind, "line": issue.line, "column": issue.column}
+                for issue in result.issues
+            ]
         
         except Exception as e:
             analysis["error"] = str(e)
@@ -266,10 +1040,26 @@ class MathWorldManager:
 
 def main():
     """Main function to demonstrate the MathWorld Manager."""
+    import argparse
+    parser = argparse.ArgumentParser(description="MathWorld Platform Manager")
+    parser.add_argument('--instrument', nargs='?', const=instrumentation.DEFAULT_OUTPUT_PREFIX, metavar='PREFIX',
+                        help="time the parse/export/backup stages; writes PREFIX_trace.json "
+                             "and PREFIX_metrics.prom")
+    parser.add_argument('--export-format', choices=['pretty', 'json', 'ndjson'], default='pretty',
+                        help="games export: pretty (indented JSON), json (streamed, compact) or ndjson")
+    parser.add_argument('--compress', choices=['gzip', 'zstd'], help="compress streamed exports")
+    parser.add_argument('--export-translations', metavar='DIR',
+                        help="write one translations file per language to DIR")
+    parser.add_argument('--compile-catalog', nargs='?', const='', metavar='PATH',
+                        help=f"compile script.js into a binary catalog (default {CACHE_DIR_NAME}/{CATALOG_FILE_NAME})")
+    args = parser.parse_args()
+    if args.instrument:
+        instrumentation.enable()
+    
     print("🎮 MathWorld Platform Manager")
     print("=" * 40)
     
-    manager = MathWorldManager()
+    manager = MathWorldManager(disk_cache=True)
     
     # Generate statistics
     print("\n📊 Platform Statistics:")
@@ -299,6 +1089,29 @@ def main():
         print("\n⚠️  Potential Issues:")
         for issue in analysis['potential_issues']:
             print(f"  - {issue}")
+        lines_by_kind: Dict[str, List[int]] = {}
+        for location in analysis['issue_locations']:
+            lines_by_kind.setdefault(location['kind'], []).append(location['line'])
+        for kind, lines in lines_by_kind.items():
+            shown = ", ".join(str(line) for line in lines[:10])
+            more = f" (+{len(lines) - 10} more)" if len(lines) > 10 else ""
+            print(f"    {kind} at line {shown}{more}")
+    
+    # Translation coverage
+    print("\n🌐 Translations:")
+    try:
+        index = manager.translation_index()
+        for language, report in index.coverage().items():
+            status = "✅" if not (report['missing'] or report['extra']) else "⚠️ "
+            print(f"  {status} {language}: {report['keys']} keys, {len(report['missing'])} missing, "
+                  f"{len(report['extra'])} extra")
+        if args.export_translations:
+            manifest = manager.export_translation_slices(args.export_translations)
+            sizes = ", ".join(f"{language} {entry['bytes']:,} bytes"
+                              for language, entry in manifest['languages'].items())
+            print(f"  💾 Slices written to {args.export_translations}/: {sizes}")
+    except (OSError, ValueError) as e:
+        print(f"  ❌ Translations unavailable: {e}")
     
     # Generate sample math problems
     print("\n🧮 Sample Math Problems:")
@@ -308,7 +1121,13 @@ def main():
     
     # Export games data
     print("\n💾 Exporting games data...")
-    if manager.export_games_to_json():
+    if args.export_format == 'pretty':
+        exported = manager.export_games_to_json()
+    else:
+        suffix = {'gzip': '.gz', 'zstd': '.zst'}.get(args.compress, '')
+        exported = manager.export_games_stream(f"games_export.{args.export_format}{suffix}",
+                                               args.export_format, args.compress or 'none')
+    if exported:
         print("✅ Export completed successfully!")
     
     # Create backup
@@ -316,6 +1135,24 @@ def main():
     backup_path = manager.create_backup()
     print(f"✅ Backup created at: {backup_path}")
     
+    if args.compile_catalog is not None:
+        try:
+            catalog_path = manager.compile_catalog(args.compile_catalog or None)
+            with GameCatalog.open(str(catalog_path)) as catalog:
+                print(f"\n🗂️  Catalog compiled to {catalog_path}: {len(catalog)} games, "
+                      f"{catalog.category_count} categories, {catalog.language_count} languages")
+        except (OSError, ValueError) as e:
+            print(f"\n❌ Catalog not compiled: {e}")
+    
+    cache = manager.parse_cache.stats()
+    print(f"\n🗃️  Parse cache: {cache['hits']} hits, {cache['misses']} misses")
+    
+    if args.instrument:
+        print()
+        instrumentation.print_summary()
+        trace_path, metrics_path = instrumentation.write_outputs(args.instrument)
+        print(f"📁 Trace: {trace_path}, metrics: {metrics_path}")
+    
     print("\n🎉 MathWorld Manager completed successfully!")
 
 if __name__ == "__main__":
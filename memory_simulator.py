@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+MathWorld Memory Game Simulator
+===============================
+Monte Carlo simulation of memory-match games for tuning the memory levels.
+
+Games are played in batches with NumPy, one array row per game, by three
+player models:
+
+- random:  flips two different face-down cards each turn and remembers nothing
+- perfect: remembers every card it has seen
+- window:  remembers only the cards flipped in its last `window` flips
+
+As in script.js a move is one card flip, and efficiency is
+pairs / moves * 100 (50% is a perfect game).  Card positions play no part in
+any of the models, so cards 2k and 2k+1 are taken as the k-th pair.
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import time
+from typing import Dict, List, Any, Tuple, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is required for the simulations; the CLI reports it
+    np = None
+
+MODELS = ['random', 'perfect', 'window']
+GRID_SIZES = [(4, 4), (6, 6), (8, 8), (10, 10)]
+DEFAULT_WINDOW = 6
+DEFAULT_CHUNK_SIZE = 100000
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("memory_simulator requires NumPy: pip install numpy")
+
+def _pair_count(rows: int, cols: int) -> int:
+    if rows < 2 or cols < 2 or (rows * cols) % 2:
+        raise ValueError(f"A {rows}x{cols} grid cannot be filled with pairs")
+    return rows * cols // 2
+
+def _random_moves(pairs: int, games: int, gen) -> Any:
+    """Random model, sampled exactly.
+
+    With k pairs left, a turn matches with probability 1/(2k-1) whatever was
+    flipped before, so the turns spent at each k are geometric.
+    """
+    stages = np.arange(1, pairs + 1)
+    turns = gen.geometric(1.0 / (2 * stages - 1), size=(games, pairs)).sum(axis=1)
+    return 2 * turns
+
+def _perfect_moves(pairs: int, games: int, gen) -> Any:
+    """Perfect recall, as a Markov chain over (fresh pairs, known singles).
+
+    `fresh` counts pairs with neither card seen; `known` counts seen cards
+    whose partner is still face down.  A pair seen completely is matched
+    on the next turn, so it is charged two extra flips straight away.
+    """
+    fresh = np.full(games, pairs, dtype=np.int64)
+    known = np.zeros(games, dtype=np.int64)
+    moves = np.zeros(games, dtype=np.int64)
+    active = np.arange(games)
+    while len(active):
+        f, k = fresh[active], known[active]
+        unseen = 2 * f + k
+        first, second = gen.random(len(active)), gen.random(len(active))
+
+        # First card is the partner of a known card: flip the partner, match
+        partner_known = first * unseen < k
+        # Otherwise it opens a fresh pair; the second flip is another unseen card
+        others = np.maximum(unseen - 1, 1)
+        own_partner = ~partner_known & (second * others < 1)
+        other_known = ~partner_known & ~own_partner & (second * others < 1 + k)
+        new_single = ~partner_known & ~own_partner & ~other_known
+
+        k = k - partner_known + 2 * new_single
+        f = f - (~partner_known) - new_single
+        fresh[active], known[active] = f, k
+        moves[active] += 2 + 2 * other_known
+        active = active[(f + k) > 0]
+    return moves
+
+def _nth_true(mask, rank) -> Any:
+    """Column of the rank-th True in each row of `mask` (0 if there is none)."""
+    return np.argmax(np.cumsum(mask, axis=1) > rank[:, None], axis=1)
+
+def _window_moves(pairs: int, games: int, gen, window: int) -> Any:
+    """Window model: remembers the cards flipped in its last `window` flips.
+
+    Only the window is stored, as card keys 2 * pair + side.  Pairs nobody
+    remembers are interchangeable, so a pair is labelled when one of its
+    cards is first flipped, and the face-down cards the player does not
+    remember are counted rather than stored.  Each flip is drawn by rank
+    among them, so a turn costs O(window log window) per game instead of
+    O(cards).
+    """
+    keys = np.full((games, max(0, window)), -1, dtype=np.int64)
+    remaining = np.full(games, pairs, dtype=np.int64)
+    labels = np.zeros(games, dtype=np.int64)
+    moves = np.zeros(games, dtype=np.int64)
+    result = np.zeros(games, dtype=np.int64)
+    rows = np.arange(games)
+
+    # Arrays only hold unfinished games; they are compacted as games end
+    while len(rows):
+        idx = np.arange(len(rows))
+        # Distinct remembered cards, sorted so a pair's keys are neighbours;
+        # the leading empty slot keeps the lookups below valid for window 0
+        ordered = np.sort(keys, axis=1)
+        repeated = np.zeros(ordered.shape, dtype=bool)
+        repeated[:, 1:] = ordered[:, 1:] == ordered[:, :-1]
+        seen = np.sort(np.where(repeated, -1, ordered), axis=1)
+        seen = np.concatenate([np.full((len(rows), 1), -1, dtype=np.int64), seen], axis=1)
+        valid = seen >= 0
+        pair_start = np.zeros(seen.shape, dtype=bool)
+        pair_start[:, :-1] = valid[:, :-1] & (seen[:, :-1] % 2 == 0) & (seen[:, 1:] == seen[:, :-1] + 1)
+        single = valid & ~pair_start
+        single[:, 1:] &= ~pair_start[:, :-1]
+        singles = single.sum(axis=1)
+        known_pairs = pair_start.sum(axis=1)
+        unknown = 2 * remaining - valid.sum(axis=1)
+        draw, second_draw = gen.random(len(rows)), gen.random(len(rows))
+
+        # A remembered pair is matched first, picked at random
+        has_pair = known_pairs > 0
+        pair_key = seen[idx, _nth_true(pair_start, (draw * known_pairs).astype(np.int64))]
+
+        # Otherwise a random unknown card: either the partner of a remembered
+        # single (recalled and matched) or a card of a pair nobody remembers
+        rank = (draw * unknown).astype(np.int64)
+        recall = ~has_pair & (rank < singles)
+        single_key = seen[idx, _nth_true(single, np.minimum(rank, singles - 1))]
+        fresh = ~has_pair & ~recall
+        fresh_key = 2 * labels
+        labels += fresh
+
+        # After a fresh card the second flip is another random unknown card
+        second_rank = (second_draw * np.maximum(unknown - 1, 1)).astype(np.int64)
+        other_single = fresh & (second_rank < singles)
+        own_partner = fresh & (second_rank == singles)
+        other_key = seen[idx, _nth_true(single, np.minimum(second_rank, singles - 1))] ^ 1
+
+        first = np.select([has_pair, recall], [pair_key, single_key ^ 1], fresh_key)
+        second = np.select([has_pair | recall | own_partner, other_single], [first ^ 1, other_key], 2 * labels)
+        labels += fresh & (second_rank > singles)
+
+        keys = np.concatenate([keys, first[:, None], second[:, None]], axis=1)[:, 2:]
+        moves += 2
+        is_match = second == first ^ 1
+        remaining -= is_match
+        keys[is_match[:, None] & (keys // 2 == (first // 2)[:, None])] = -1
+
+        done = remaining == 0
+        if done.any():
+            result[rows[done]] = moves[done]
+            keep = ~done
+            rows, keys, remaining, labels, moves = rows[keep], keys[keep], remaining[keep], labels[keep], moves[keep]
+    return result
+
+def simulate(model: str, rows: int = 4, cols: int = 4, games: int = 100000, seed: Any = 0,
+             window: int = DEFAULT_WINDOW, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """Play `games` memory games on a rows x cols grid; returns moves (flips) per game."""
+    _require_numpy()
+    if model not in MODELS:
+        raise ValueError(f"Unknown player model: {model}")
+    pairs = _pair_count(rows, cols)
+    gen = np.random.default_rng(seed)
+    parts = []
+    for start in range(0, games, chunk_size):
+        count = min(chunk_size, games - start)
+        if model == 'random':
+            parts.append(_random_moves(pairs, count, gen))
+        elif model == 'perfect':
+            parts.append(_perfect_moves(pairs, count, gen))
+        else:
+            parts.append(_window_moves(pairs, count, gen, window))
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+def _distribution(values) -> Dict[str, float]:
+    p10, p50, p90 = np.percentile(values, [10, 50, 90])
+    return {
+        'mean': float(values.mean()), 'std': float(values.std()),
+        'min': float(values.min()), 'p10': float(p10), 'p50': float(p50), 'p90': float(p90),
+        'max': float(values.max())
+    }
+
+def summarize(moves, pairs: int) -> Dict[str, Any]:
+    """Distributions of moves and efficiency for simulate() output."""
+    efficiency = pairs / moves * 100
+    return {
+        'games': int(len(moves)),
+        'pairs': pairs,
+        'moves': _distribution(moves),
+        'efficiency': _distribution(efficiency),
+        'moves_histogram': {int(value): int(count) for value, count in zip(*np.unique(moves, return_counts=True))}
+    }
+
+def difficulty_curves(models: Sequence[str] = MODELS, sizes: Sequence[Tuple[int, int]] = GRID_SIZES,
+                      games: int = 100000, seed: int = 0, window: int = DEFAULT_WINDOW) -> List[Dict[str, Any]]:
+    """Summaries for every model and grid size, one row each."""
+    curves = []
+    for model in models:
+        for size_index, (rows, cols) in enumerate(sizes):
+            start_time = time.perf_counter()
+            moves = simulate(model, rows, cols, games, seed=[seed, MODELS.index(model), size_index], window=window)
+            summary = summarize(moves, _pair_count(rows, cols))
+            summary.update({'model': model, 'grid': f"{rows}x{cols}",
+                            'seconds': time.perf_counter() - start_time})
+            if model == 'window':
+                summary['window'] = window
+            curves.append(summary)
+    return curves
+
+def main():
+    """Print memory-game difficulty curves."""
+    import argparse
+    parser = argparse.ArgumentParser(description="MathWorld memory game simulator")
+    parser.add_argument('--games', type=int, default=100000)
+    parser.add_argument('--models', nargs='+', choices=MODELS, default=MODELS)
+    parser.add_argument('--sizes', nargs='+', type=int, default=[size for size, _ in GRID_SIZES],
+                        help="square grid sizes (rows * cols must be even)")
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW, help="recall window in flips")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="save the curves as JSON")
+    args = parser.parse_args()
+
+    if np is None:
+        print("❌ NumPy is required: pip install numpy")
+        return
+
+    print("🧠 MathWorld Memory Game Simulator")
+    print("=" * 40)
+    curves = difficulty_curves(args.models, [(size, size) for size in args.sizes], args.games, args.seed, args.window)
+    print(f"{'model':<8} {'grid':>6} {'moves p10/p50/p90':>20} {'mean':>8} {'efficiency':>11} {'games/s':>11}")
+    for row in curves:
+        moves = row['moves']
+        spread = f"{moves['p10']:.0f}/{moves['p50']:.0f}/{moves['p90']:.0f}"
+        print(f"{row['model']:<8} {row['grid']:>6} {spread:>20} {moves['mean']:>8.1f} "
+              f"{row['efficiency']['mean']:>10.1f}% {row['games'] / row['seconds']:>11,.0f}")
+
+    if args.output:
+        import json
+        with open(args.output, 'w') as f:
+            json.dump(curves, f, indent=2)
+        print(f"\n💾 Curves saved to '{args.output}'")
+
+if __name__ == "__main__":
+    main()
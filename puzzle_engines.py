@@ -0,0 +1,745 @@
+#!/usr/bin/env python3
+"""
+MathWorld Puzzle Engines
+========================
+Solvers and unique-puzzle generators for the KenKen, Kakuro and Magic
+Square games, built on one finite-domain constraint core.
+
+Cell domains are bitmasks (bit v set means value v is still possible).  The
+core knows two constraints: all-different groups (rows, columns, Kakuro
+runs) and cages, whose allowed value combinations come from precomputed
+cage-sum and cage-product tables.  Propagation runs to a fixpoint before
+each branch of a fewest-candidates search, and counting stops at two
+solutions when only uniqueness matters.
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import os
+import random
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Any, Sequence, Set
+
+Cell = Tuple[int, int]
+
+def _bits(mask: int) -> List[int]:
+    """Values whose bits are set in a domain mask."""
+    values = []
+    while mask:
+        bit = mask & -mask
+        values.append(bit.bit_length() - 1)
+        mask ^= bit
+    return values
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count('1')
+
+@lru_cache(maxsize=None)
+def cage_table(op: str, target: int, size: int, max_value: int,
+               distinct: bool = False) -> Tuple[Tuple[int, ...], ...]:
+    """All sorted value combinations for a cage.
+
+    Combinations use values 1..max_value, have `size` entries and give
+    `target` under `op` ('+', '*', '-', '/' or '=').  '-' and '/' cages
+    have two cells (larger minus / divided by smaller, as in the browser's
+    checkKenKenSolution).  With `distinct` every value appears at most once,
+    as in Kakuro runs and magic-square lines.
+    """
+    if op == '=':
+        return ((target,),) if size == 1 and 1 <= target <= max_value else ()
+    if op in ('-', '/'):
+        if size != 2:
+            return ()
+        pairs = []
+        for low in range(1, max_value + 1):
+            high = low + target if op == '-' else low * target
+            if high <= max_value and (high != low or not distinct):
+                pairs.append((low, high))
+        return tuple(pairs)
+    if op not in ('+', '*'):
+        raise ValueError(f"Unknown cage operation: {op}")
+
+    combos: List[Tuple[int, ...]] = []
+    prefix: List[int] = []
+
+    def extend(start: int, remaining: int, left: int):
+        if left == 0:
+            if remaining == (0 if op == '+' else 1):
+                combos.append(tuple(prefix))
+            return
+        for value in range(start, max_value + 1):
+            if op == '+':
+                # The remaining cells hold at least `value` each
+                if value * left > remaining:
+                    break
+                if remaining - value > max_value * (left - 1):
+                    continue
+                rest = remaining - value
+            else:
+                if value ** left > remaining:
+                    break
+                if remaining % value:
+                    continue
+                rest = remaining // value
+            prefix.append(value)
+            extend(value + 1 if distinct else value, rest, left - 1)
+            prefix.pop()
+
+    extend(1, target, size)
+    return tuple(combos)
+
+class ConstraintCore:
+    """Finite-domain model over `num_vars` cells with values min_value..max_value."""
+
+    def __init__(self, num_vars: int, max_value: int, min_value: int = 1):
+        self.num_vars = num_vars
+        self.max_value = max_value
+        self.full = ((1 << (max_value - min_value + 1)) - 1) << min_value
+        self.domains = [self.full] * num_vars
+        # ('alldiff', cells, None) or ('cage', cells, (table masks, combos, combo counts, combo set))
+        self.constraints: List[Tuple[str, Tuple[int, ...], Any]] = []
+        self.watchers: List[List[int]] = [[] for _ in range(num_vars)]
+
+    def fix(self, var: int, value: int):
+        self.domains[var] &= 1 << value
+
+    def add_all_different(self, cells: Sequence[int]):
+        self._add('alldiff', tuple(cells), None)
+
+    def add_cage(self, cells: Sequence[int], op: str, target: int, distinct: bool = False):
+        self.add_combinations(cells, cage_table(op, target, len(cells), self.max_value, distinct))
+
+    def add_combinations(self, cells: Sequence[int], combos: Sequence[Tuple[int, ...]]):
+        """Restrict cells to a permutation of one of the sorted value tuples in `combos`."""
+        masks = tuple(sum(1 << value for value in set(combo)) for combo in combos)
+        counts = tuple(Counter(combo) for combo in combos)
+        self._add('cage', tuple(cells), (masks, combos, counts, frozenset(combos)))
+
+    def _add(self, kind: str, cells: Tuple[int, ...], data: Any):
+        index = len(self.constraints)
+        self.constraints.append((kind, cells, data))
+        for var in set(cells):
+            self.watchers[var].append(index)
+
+    # -- propagation -------------------------------------------------------
+
+    @staticmethod
+    def _revise_all_different(domains: List[int], cells: Tuple[int, ...]) -> bool:
+        changed = True
+        while changed:
+            changed = False
+            fixed = 0
+            for var in cells:
+                mask = domains[var]
+                if not mask & (mask - 1):
+                    if fixed & mask:
+                        return False
+                    fixed |= mask
+            for var in cells:
+                mask = domains[var]
+                if mask & (mask - 1) and mask & fixed:
+                    mask &= ~fixed
+                    if not mask:
+                        return False
+                    domains[var] = mask
+                    changed = changed or not mask & (mask - 1)
+
+        union = 0
+        for var in cells:
+            union |= domains[var]
+        size = _popcount(union)
+        if size < len(cells):
+            return False
+        if size == len(cells):
+            # Every value must be used, so a value with one home goes there
+            for value in _bits(union):
+                bit = 1 << value
+                homes = [var for var in cells if domains[var] & bit]
+                if len(homes) == 1 and domains[homes[0]] != bit:
+                    domains[homes[0]] = bit
+        return True
+
+    @staticmethod
+    def _revise_cage(domains: List[int], cells: Tuple[int, ...], data: Any) -> bool:
+        masks, combos, counts, _ = data
+        union = 0
+        fixed_values = []
+        for var in cells:
+            mask = domains[var]
+            union |= mask
+            if not mask & (mask - 1):
+                fixed_values.append(mask.bit_length() - 1)
+        fixed_counts = Counter(fixed_values) if fixed_values else None
+
+        support = [0] * len(cells)
+        for mask, count in zip(masks, counts):
+            if union & mask != mask:
+                continue
+            if any(not domains[var] & mask for var in cells):
+                continue
+            if fixed_counts and any(count[value] < n for value, n in fixed_counts.items()):
+                continue
+            for i, var in enumerate(cells):
+                support[i] |= domains[var] & mask
+        for i, var in enumerate(cells):
+            if not support[i]:
+                return False
+            domains[var] &= support[i]
+        return True
+
+    def propagate(self, domains: List[int], queue: Optional[deque] = None) -> bool:
+        """Run constraints to a fixpoint; False on a contradiction."""
+        if queue is None:
+            queue = deque(range(len(self.constraints)))
+        queued = set(queue)
+        while queue:
+            index = queue.popleft()
+            queued.discard(index)
+            kind, cells, data = self.constraints[index]
+            before = [domains[var] for var in cells]
+            if kind == 'alldiff':
+                ok = self._revise_all_different(domains, cells)
+            else:
+                ok = self._revise_cage(domains, cells, data)
+            if not ok:
+                return False
+            for var, old in zip(cells, before):
+                if domains[var] != old:
+                    for other in self.watchers[var]:
+                        if other not in queued:
+                            queue.append(other)
+                            queued.add(other)
+        return True
+
+    def _consistent(self, values: List[int]) -> bool:
+        """Exact check of a full assignment (cage tables are checked as multisets)."""
+        for kind, cells, data in self.constraints:
+            chosen = [values[var] for var in cells]
+            if kind == 'alldiff':
+                if len(set(chosen)) != len(chosen):
+                    return False
+            elif tuple(sorted(chosen)) not in data[3]:
+                return False
+        return True
+
+    # -- search ------------------------------------------------------------
+
+    def solutions(self, limit: Optional[int] = None, rng: Optional[random.Random] = None) -> List[List[int]]:
+        """Up to `limit` solutions, as flat value lists; `rng` randomizes value order."""
+        found: List[List[int]] = []
+        domains = list(self.domains)
+        if not all(domains) or not self.propagate(domains):
+            return found
+        stack = [domains]
+        while stack:
+            domains = stack.pop()
+            branch = -1
+            best = 0
+            for var, mask in enumerate(domains):
+                if mask & (mask - 1):
+                    size = _popcount(mask)
+                    if branch < 0 or size < best:
+                        branch, best = var, size
+                        if size == 2:
+                            break
+            if branch < 0:
+                values = [mask.bit_length() - 1 for mask in domains]
+                if self._consistent(values):
+                    found.append(values)
+                    if limit is not None and len(found) >= limit:
+                        break
+                continue
+            values = _bits(domains[branch])
+            if rng is not None:
+                rng.shuffle(values)
+            # The stack pops the last child first, so push in reverse
+            for value in reversed(values):
+                child = list(domains)
+                child[branch] = 1 << value
+                if self.propagate(child, deque(self.watchers[branch])):
+                    stack.append(child)
+        return found
+
+    def solve(self, rng: Optional[random.Random] = None) -> Optional[List[int]]:
+        found = self.solutions(limit=1, rng=rng)
+        return found[0] if found else None
+
+    def count_solutions(self, limit: int = 2) -> int:
+        return len(self.solutions(limit=limit))
+
+# -- KenKen -------------------------------------------------------------------
+
+@dataclass
+class Cage:
+    """A KenKen cage: cells are (row, col); op is '+', '-', '*', '/' or '='."""
+    cells: List[Cell]
+    op: str
+    target: int
+
+@dataclass
+class KenKenPuzzle:
+    size: int
+    cages: List[Cage]
+    solution: Optional[List[List[int]]] = None
+
+def kenken_model(puzzle: KenKenPuzzle) -> ConstraintCore:
+    n = puzzle.size
+    core = ConstraintCore(n * n, n)
+    for r in range(n):
+        core.add_all_different([r * n + c for c in range(n)])
+        core.add_all_different([c * n + r for c in range(n)])
+    for cage in puzzle.cages:
+        core.add_cage([r * n + c for r, c in cage.cells], cage.op, cage.target)
+    return core
+
+def solve_kenken(puzzle: KenKenPuzzle, limit: Optional[int] = 1) -> List[List[List[int]]]:
+    """Solutions of a KenKen puzzle as grids (at most `limit`)."""
+    n = puzzle.size
+    return [[values[r * n:(r + 1) * n] for r in range(n)]
+            for values in kenken_model(puzzle).solutions(limit)]
+
+def check_kenken_solution(grid: List[List[int]], cages: Sequence[Cage]) -> bool:
+    """Server-side mirror of script.js `checkKenKenSolution`."""
+    n = len(grid)
+    if any(not 1 <= value <= n for row in grid for value in row):
+        return False
+    for i in range(n):
+        if len(set(grid[i])) != n or len({grid[r][i] for r in range(n)}) != n:
+            return False
+    return all(_cage_value([grid[r][c] for r, c in cage.cells], cage.op) == cage.target
+               for cage in cages)
+
+def _cage_value(values: List[int], op: str) -> Optional[int]:
+    if op == '+':
+        return sum(values)
+    if op == '*':
+        product = 1
+        for value in values:
+            product *= value
+        return product
+    if op == '-':
+        return abs(values[0] - values[1])
+    if op == '/':
+        high, low = max(values), min(values)
+        return high // low if high % low == 0 else None
+    return values[0]
+
+def _random_latin_square(n: int, rng: random.Random) -> List[List[int]]:
+    core = ConstraintCore(n * n, n)
+    for r in range(n):
+        core.add_all_different([r * n + c for c in range(n)])
+        core.add_all_different([c * n + r for c in range(n)])
+    values = core.solve(rng)
+    return [values[r * n:(r + 1) * n] for r in range(n)]
+
+def _neighbours(cell: Cell, height: int, width: int) -> List[Cell]:
+    r, c = cell
+    return [(r + dr, c + dc) for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))
+            if 0 <= r + dr < height and 0 <= c + dc < width]
+
+def _components(cells: Sequence[Cell]) -> List[List[Cell]]:
+    """Split cells into orthogonally connected groups."""
+    remaining = set(cells)
+    groups = []
+    while remaining:
+        start = remaining.pop()
+        group = [start]
+        frontier = [start]
+        while frontier:
+            r, c = frontier.pop()
+            for neighbour in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+                if neighbour in remaining:
+                    remaining.discard(neighbour)
+                    group.append(neighbour)
+                    frontier.append(neighbour)
+        groups.append(sorted(group))
+    return groups
+
+def _make_cage(cells: List[Cell], grid: List[List[int]], rng: random.Random) -> Cage:
+    values = [grid[r][c] for r, c in cells]
+    if len(cells) == 1:
+        return Cage(cells, '=', values[0])
+    if len(cells) == 2:
+        high, low = max(values), min(values)
+        ops = ['+', '-', '*']
+        if high % low == 0 and high != low:
+            ops.append('/')
+        op = rng.choice(ops)
+    else:
+        op = rng.choice(['+', '*'])
+    return Cage(cells, op, _cage_value(values, op))
+
+def generate_kenken(size: int = 4, rng: Optional[random.Random] = None, max_cage: int = 4) -> KenKenPuzzle:
+    """Generate a KenKen puzzle with exactly one solution.
+
+    A random Latin square is cut into random connected cages.  While a
+    second solution exists, a cell where the two solutions differ is split
+    off into a single-cell '=' cage, so the loop always terminates.
+    """
+    rng = rng or random.Random()
+    grid = _random_latin_square(size, rng)
+    unassigned = [(r, c) for r in range(size) for c in range(size)]
+    rng.shuffle(unassigned)
+    free = set(unassigned)
+    cages = []
+    for start in unassigned:
+        if start not in free:
+            continue
+        free.discard(start)
+        cells = [start]
+        target_size = rng.choice([s for s in (1, 2, 2, 3, 3, 4) if s <= max_cage] or [1])
+        while len(cells) < target_size:
+            options = [cell for member in cells for cell in _neighbours(member, size, size) if cell in free]
+            if not options:
+                break
+            cell = rng.choice(options)
+            free.discard(cell)
+            cells.append(cell)
+        cages.append(_make_cage(sorted(cells), grid, rng))
+
+    while True:
+        puzzle = KenKenPuzzle(size, cages, grid)
+        found = solve_kenken(puzzle, limit=2)
+        if len(found) == 1:
+            return puzzle
+        other = found[0] if found[0] != grid else found[1]
+        r, c = next((r, c) for r in range(size) for c in range(size) if other[r][c] != grid[r][c])
+        cage = next(cage for cage in cages if (r, c) in cage.cells)
+        cages.remove(cage)
+        rest = [cell for cell in cage.cells if cell != (r, c)]
+        cages.append(Cage([(r, c)], '=', grid[r][c]))
+        cages.extend(_make_cage(group, grid, rng) for group in _components(rest))
+
+# -- Kakuro -------------------------------------------------------------------
+
+@dataclass
+class KakuroRun:
+    """A horizontal or vertical run of white cells and its clue sum."""
+    cells: List[Cell]
+    total: int
+    direction: str
+
+@dataclass
+class KakuroPuzzle:
+    """Kakuro layout; `givens` are digits shown pre-filled, like KenKen '=' cages."""
+    height: int
+    width: int
+    runs: List[KakuroRun]
+    givens: Dict[Cell, int] = field(default_factory=dict)
+    solution: Optional[Dict[Cell, int]] = None
+
+    @property
+    def white_cells(self) -> List[Cell]:
+        return sorted({cell for run in self.runs for cell in run.cells})
+
+def kakuro_runs(white: Set[Cell], height: int, width: int) -> List[List[Cell]]:
+    """Maximal horizontal then vertical runs of white cells (length >= 2)."""
+    runs = []
+    for r in range(height):
+        run: List[Cell] = []
+        for c in range(width + 1):
+            if c < width and (r, c) in white:
+                run.append((r, c))
+            else:
+                if len(run) >= 2:
+                    runs.append(run)
+                run = []
+    for c in range(width):
+        run = []
+        for r in range(height + 1):
+            if r < height and (r, c) in white:
+                run.append((r, c))
+            else:
+                if len(run) >= 2:
+                    runs.append(run)
+                run = []
+    return runs
+
+def kakuro_model(puzzle: KakuroPuzzle) -> Tuple[ConstraintCore, List[Cell]]:
+    cells = puzzle.white_cells
+    index = {cell: i for i, cell in enumerate(cells)}
+    core = ConstraintCore(len(cells), 9)
+    for run in puzzle.runs:
+        members = [index[cell] for cell in run.cells]
+        core.add_all_different(members)
+        core.add_cage(members, '+', run.total, distinct=True)
+    for cell, value in puzzle.givens.items():
+        core.fix(index[cell], value)
+    return core, cells
+
+def solve_kakuro(puzzle: KakuroPuzzle, limit: Optional[int] = 1) -> List[Dict[Cell, int]]:
+    """Solutions of a Kakuro puzzle as {(row, col): digit} maps."""
+    core, cells = kakuro_model(puzzle)
+    return [dict(zip(cells, values)) for values in core.solutions(limit)]
+
+def _clean_layout(white: Set[Cell], height: int, width: int) -> Set[Cell]:
+    """Blacken cells until every white cell sits in across and down runs of 2-9 cells."""
+    white = set(white)
+    while True:
+        across: Dict[Cell, int] = {}
+        down: Dict[Cell, int] = {}
+        for run in kakuro_runs(white, height, width):
+            lookup = across if run[0][0] == run[-1][0] else down
+            for cell in run:
+                lookup[cell] = len(run)
+        bad = {cell for cell in white if cell not in across or cell not in down}
+        long_runs = [run for run in kakuro_runs(white, height, width) if len(run) > 9]
+        for run in long_runs:
+            bad.add(run[len(run) // 2])
+        if not bad:
+            return white
+        white -= bad
+
+def _kakuro_from_fill(fill: Dict[Cell, int], height: int, width: int) -> KakuroPuzzle:
+    runs = []
+    for run in kakuro_runs(set(fill), height, width):
+        direction = 'across' if run[0][0] == run[-1][0] else 'down'
+        runs.append(KakuroRun(run, sum(fill[cell] for cell in run), direction))
+    return KakuroPuzzle(height, width, runs, solution=dict(fill))
+
+def generate_kakuro(height: int = 6, width: int = 6, rng: Optional[random.Random] = None,
+                    density: float = 0.75) -> KakuroPuzzle:
+    """Generate a Kakuro puzzle with exactly one solution.
+
+    Row 0 and column 0 hold the clues.  White cells are drawn at `density`
+    and cleaned up so that every cell has across and down runs, then filled
+    with distinct digits per run.  Random fills are rarely unique, so while
+    a second solution exists a cell where the two differ becomes a given
+    digit; givens that later turn out to be redundant are dropped again.
+    """
+    rng = rng or random.Random()
+    while True:
+        white = {(r, c) for r in range(1, height) for c in range(1, width) if rng.random() < density}
+        white = _clean_layout(white, height, width)
+        if not white:
+            continue
+        cells = sorted(white)
+        index = {cell: i for i, cell in enumerate(cells)}
+        core = ConstraintCore(len(cells), 9)
+        for run in kakuro_runs(white, height, width):
+            core.add_all_different([index[cell] for cell in run])
+        values = core.solve(rng)
+        if values is not None:
+            break
+
+    puzzle = _kakuro_from_fill(dict(zip(cells, values)), height, width)
+    fill = puzzle.solution
+    while True:
+        found = solve_kakuro(puzzle, limit=2)
+        if len(found) == 1:
+            break
+        other = found[0] if found[0] != fill else found[1]
+        differing = [cell for cell in cells if other[cell] != fill[cell]]
+        cell = rng.choice(differing)
+        puzzle.givens[cell] = fill[cell]
+
+    for cell in list(puzzle.givens):
+        del puzzle.givens[cell]
+        if len(solve_kakuro(puzzle, limit=2)) != 1:
+            puzzle.givens[cell] = fill[cell]
+    return puzzle
+
+# -- Magic square ---------------------------------------------------------------
+
+def magic_constant(n: int) -> int:
+    return n * (n * n + 1) // 2
+
+def _siamese(n: int) -> List[List[int]]:
+    grid = [[0] * n for _ in range(n)]
+    r, c = 0, n // 2
+    for value in range(1, n * n + 1):
+        grid[r][c] = value
+        nr, nc = (r - 1) % n, (c + 1) % n
+        if grid[nr][nc]:
+            nr, nc = (r + 1) % n, c
+        r, c = nr, nc
+    return grid
+
+def magic_square(n: int) -> List[List[int]]:
+    """A normal magic square of order n (n >= 3): Siamese, doubly even or Strachey."""
+    if n < 3:
+        raise ValueError("Magic squares exist for n >= 3")
+    if n % 2:
+        return _siamese(n)
+    if n % 4 == 0:
+        return [[n * n - (r * n + c) if (r % 4 == c % 4 or r % 4 + c % 4 == 3) else r * n + c + 1
+                 for c in range(n)] for r in range(n)]
+    # Strachey's method for n = 4k + 2
+    m = n // 2
+    base = _siamese(m)
+    grid = [[0] * n for _ in range(n)]
+    for r in range(m):
+        for c in range(m):
+            grid[r][c] = base[r][c]
+            grid[r + m][c + m] = base[r][c] + m * m
+            grid[r][c + m] = base[r][c] + 2 * m * m
+            grid[r + m][c] = base[r][c] + 3 * m * m
+    k = (n - 2) // 4
+    for r in range(m):
+        columns = list(range(k))
+        if r == m // 2:
+            columns = list(range(1, k + 1))
+        columns += list(range(n - k + 1, n))
+        for c in columns:
+            grid[r][c], grid[r + m][c] = grid[r + m][c], grid[r][c]
+    return grid
+
+def is_magic(grid: List[List[int]]) -> bool:
+    """True if grid uses 1..n² once and every row, column and diagonal sums to the magic constant."""
+    n = len(grid)
+    target = magic_constant(n)
+    if sorted(value for row in grid for value in row) != list(range(1, n * n + 1)):
+        return False
+    lines = [row for row in grid] + [[grid[r][c] for r in range(n)] for c in range(n)]
+    lines.append([grid[i][i] for i in range(n)])
+    lines.append([grid[i][n - 1 - i] for i in range(n)])
+    return all(sum(line) == target for line in lines)
+
+def magic_model(givens: List[List[int]]) -> ConstraintCore:
+    n = len(givens)
+    core = ConstraintCore(n * n, n * n)
+    core.add_all_different(range(n * n))
+    target = magic_constant(n)
+    lines = [[r * n + c for c in range(n)] for r in range(n)]
+    lines += [[r * n + c for r in range(n)] for c in range(n)]
+    lines.append([i * n + i for i in range(n)])
+    lines.append([i * n + n - 1 - i for i in range(n)])
+    for line in lines:
+        core.add_cage(line, '+', target, distinct=True)
+    for r in range(n):
+        for c in range(n):
+            if givens[r][c]:
+                core.fix(r * n + c, givens[r][c])
+    return core
+
+def solve_magic_square(givens: List[List[int]], limit: Optional[int] = 1) -> List[List[List[int]]]:
+    """Completions of a partly filled magic square (0 = empty)."""
+    n = len(givens)
+    return [[values[r * n:(r + 1) * n] for r in range(n)]
+            for values in magic_model(givens).solutions(limit)]
+
+def generate_magic_square(n: int = 3, rng: Optional[random.Random] = None,
+                          min_givens: int = 0) -> Tuple[List[List[int]], List[List[int]]]:
+    """Return (puzzle, solution): a magic square with givens removed while unique.
+
+    The solution is a random symmetry (and possibly the complement) of the
+    constructed square of order n.
+    """
+    rng = rng or random.Random()
+    grid = magic_square(n)
+    for _ in range(rng.randrange(4)):
+        grid = [list(row) for row in zip(*grid[::-1])]
+    if rng.random() < 0.5:
+        grid = [row[::-1] for row in grid]
+    if rng.random() < 0.5:
+        grid = [[n * n + 1 - value for value in row] for row in grid]
+
+    puzzle = [row[:] for row in grid]
+    givens = n * n
+    cells = [(r, c) for r in range(n) for c in range(n)]
+    rng.shuffle(cells)
+    for r, c in cells:
+        if givens <= min_givens:
+            break
+        value = puzzle[r][c]
+        puzzle[r][c] = 0
+        if magic_model(puzzle).count_solutions(2) == 1:
+            givens -= 1
+        else:
+            puzzle[r][c] = value
+    return puzzle, grid
+
+# -- Browser puzzles and benchmark -------------------------------------------
+
+# The hard-coded puzzles from script.js
+BROWSER_KENKEN = KenKenPuzzle(3, [
+    Cage([(0, 0), (0, 1)], '+', 5),
+    Cage([(0, 2)], '=', 2),
+    Cage([(1, 0), (2, 0)], '+', 4),
+    Cage([(1, 1), (1, 2)], '+', 6),
+    Cage([(2, 1), (2, 2)], '+', 7)
+])
+BROWSER_MAGIC_SQUARE = [
+    [8, 0, 0],
+    [0, 5, 0],
+    [0, 0, 2]
+]
+
+def benchmark_engines(sizes: Dict[str, Sequence[int]], puzzles_per_size: int = 3,
+                      seed: int = 0) -> List[Dict[str, Any]]:
+    """Time generation and the uniqueness-proving solve for each game and size.
+
+    Kakuro sizes are square grid sides (clue row and column included).
+    """
+    rng = random.Random(seed)
+    results = []
+    for game, game_sizes in sizes.items():
+        for size in game_sizes:
+            generate_seconds = solve_seconds = 0.0
+            for _ in range(puzzles_per_size):
+                start = time.perf_counter()
+                if game == 'kenken':
+                    puzzle = generate_kenken(size, rng)
+                    generated = time.perf_counter()
+                    solved = len(solve_kenken(puzzle, limit=2))
+                elif game == 'kakuro':
+                    puzzle = generate_kakuro(size, size, rng)
+                    generated = time.perf_counter()
+                    solved = len(solve_kakuro(puzzle, limit=2))
+                elif game == 'magic-square':
+                    puzzle, _ = generate_magic_square(size, rng)
+                    generated = time.perf_counter()
+                    solved = len(solve_magic_square(puzzle, limit=2))
+                else:
+                    raise ValueError(f"Unknown game: {game}")
+                finished = time.perf_counter()
+                if solved != 1:
+                    raise RuntimeError(f"Generated {game} {size} puzzle is not unique")
+                generate_seconds += generated - start
+                solve_seconds += finished - generated
+            results.append({
+                'game': game,
+                'size': size,
+                'puzzles': puzzles_per_size,
+                'generate_ms': generate_seconds / puzzles_per_size * 1000,
+                'solve_ms': solve_seconds / puzzles_per_size * 1000
+            })
+    return results
+
+DEFAULT_BENCHMARK_SIZES = {
+    'kenken': [3, 4, 5, 6, 7],
+    'kakuro': [5, 7, 9, 11],
+    'magic-square': [3, 4]
+}
+
+def main():
+    """Solve the browser puzzles and optionally benchmark by grid size."""
+    import argparse
+    parser = argparse.ArgumentParser(description="MathWorld puzzle engines")
+    parser.add_argument('--benchmark', action='store_true', help="time generation and solving by grid size")
+    parser.add_argument('--puzzles', type=int, default=3, help="puzzles per size in the benchmark")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print("🧩 MathWorld Puzzle Engines")
+    print("=" * 40)
+
+    # Uniqueness of the puzzles the browser ships today
+    for name, found in (('KenKen', solve_kenken(BROWSER_KENKEN, limit=2)),
+                        ('Magic square', solve_magic_square(BROWSER_MAGIC_SQUARE, limit=2))):
+        status = {0: '❌ no solution', 1: '✅ unique'}.get(len(found), '⚠️  more than one solution')
+        print(f"{name} (script.js): {status}")
+
+    if args.benchmark:
+        print(f"\n⏱️  Benchmark ({args.puzzles} puzzles per size, cores: {os.cpu_count()})")
+        for row in benchmark_engines(DEFAULT_BENCHMARK_SIZES, args.puzzles, args.seed):
+            print(f"  {row['game']:<13} {row['size']:>3}  generate {row['generate_ms']:9.1f} ms"
+                  f"  solve {row['solve_ms']:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+MathWorld Sudoku Engine
+=======================
+Bitmask validator and constraint-propagation solver for 4x4, 9x9 and 16x16 Sudoku.
+
+Each row, column and box keeps a bitmask of the digits it already holds
+(bit d set means digit d is used), so candidate sets, conflict checks and
+unit checks are single integer operations.  The solver alternates naked
+and hidden singles with depth-first search on the cell that has the fewest
+candidates, and can count solutions to prove that a puzzle is unique.
+
+Grids are lists of rows; 0 marks an empty cell.
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import os
+import random
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any, Sequence
+
+Grid = List[List[int]]
+
+# The hard-coded puzzles from script.js `generateSudokuPuzzle`
+BROWSER_PUZZLES: Dict[str, Grid] = {
+    'easy': [
+        [5, 3, 0, 0, 7, 0, 0, 0, 0], [6, 0, 0, 1, 9, 5, 0, 0, 0], [0, 9, 8, 0, 0, 0, 0, 6, 0],
+        [8, 0, 0, 0, 6, 0, 0, 0, 3], [4, 0, 0, 8, 0, 3, 0, 0, 1], [7, 0, 0, 0, 2, 0, 0, 0, 6],
+        [0, 6, 0, 0, 0, 0, 2, 8, 0], [0, 0, 0, 4, 1, 9, 0, 0, 5], [0, 0, 0, 0, 8, 0, 0, 7, 9]
+    ],
+    'medium': [
+        [0, 0, 0, 2, 6, 0, 7, 0, 1], [6, 8, 0, 0, 7, 0, 0, 9, 0], [1, 9, 0, 0, 0, 4, 5, 0, 0],
+        [8, 2, 0, 1, 0, 0, 0, 4, 0], [0, 0, 4, 6, 0, 2, 9, 0, 0], [0, 5, 0, 0, 0, 3, 0, 2, 8],
+        [0, 0, 9, 3, 0, 0, 0, 7, 4], [0, 4, 0, 0, 5, 0, 0, 3, 6], [7, 0, 3, 0, 1, 8, 0, 0, 0]
+    ],
+    'hard': [
+        [0, 0, 0, 0, 0, 0, 0, 1, 2], [0, 0, 0, 0, 0, 7, 4, 0, 0], [0, 0, 0, 5, 0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 6, 0, 0, 0, 0], [0, 0, 0, 3, 0, 8, 0, 0, 0], [0, 0, 0, 0, 1, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0, 2, 0, 0, 0], [0, 0, 7, 0, 0, 0, 0, 0, 0], [9, 4, 0, 0, 0, 0, 0, 0, 0]
+    ]
+}
+
+def box_shape(n: int) -> Tuple[int, int]:
+    """Box height and width for an n x n grid (2x2 for 4, 3x3 for 9, 2x3 for 6...)."""
+    box_rows = int(n ** 0.5)
+    while n % box_rows:
+        box_rows -= 1
+    return box_rows, n // box_rows
+
+class _Geometry:
+    """Precomputed cell/unit tables for one grid size."""
+
+    def __init__(self, n: int):
+        self.n = n
+        self.box_rows, self.box_cols = box_shape(n)
+        self.full = ((1 << n) - 1) << 1
+        self.row_of = [i // n for i in range(n * n)]
+        self.col_of = [i % n for i in range(n * n)]
+        self.box_of = [
+            (r // self.box_rows) * (n // self.box_cols) + c // self.box_cols
+            for r, c in zip(self.row_of, self.col_of)
+        ]
+        # Units are numbered rows 0..n-1, columns n..2n-1, boxes 2n..3n-1
+        self.units: List[List[int]] = [[] for _ in range(3 * n)]
+        for i in range(n * n):
+            self.units[self.row_of[i]].append(i)
+            self.units[n + self.col_of[i]].append(i)
+            self.units[2 * n + self.box_of[i]].append(i)
+        self.popcount = [bin(mask).count('1') for mask in range(1 << (n + 1))]
+
+@lru_cache(maxsize=None)
+def _geometry(n: int) -> _Geometry:
+    if n < 1 or n > 25:
+        raise ValueError(f"Unsupported Sudoku size: {n}")
+    return _Geometry(n)
+
+def _digits(mask: int) -> List[int]:
+    """Digits whose bits are set in a candidate mask."""
+    digits = []
+    while mask:
+        bit = mask & -mask
+        digits.append(bit.bit_length() - 1)
+        mask ^= bit
+    return digits
+
+def _load(grid: Grid) -> Tuple[_Geometry, List[int], Optional[List[int]]]:
+    """Flatten a grid and build unit masks; masks are None if givens conflict."""
+    n = len(grid)
+    if any(len(row) != n for row in grid):
+        raise ValueError("Sudoku grid must be square")
+    geo = _geometry(n)
+    cells = [value for row in grid for value in row]
+    used = [0] * (3 * n)
+    for i, value in enumerate(cells):
+        if not value:
+            continue
+        if not 1 <= value <= n:
+            raise ValueError(f"Invalid value {value} at row {geo.row_of[i]}, column {geo.col_of[i]}")
+        bit = 1 << value
+        r, c, b = geo.row_of[i], n + geo.col_of[i], 2 * n + geo.box_of[i]
+        if (used[r] | used[c] | used[b]) & bit:
+            return geo, cells, None
+        used[r] |= bit
+        used[c] |= bit
+        used[b] |= bit
+    return geo, cells, used
+
+def _place(geo: _Geometry, cells: List[int], used: List[int], i: int, bit: int):
+    n = geo.n
+    cells[i] = bit.bit_length() - 1
+    used[geo.row_of[i]] |= bit
+    used[n + geo.col_of[i]] |= bit
+    used[2 * n + geo.box_of[i]] |= bit
+
+def _candidates(geo: _Geometry, used: List[int], i: int) -> int:
+    n = geo.n
+    return geo.full & ~(used[geo.row_of[i]] | used[n + geo.col_of[i]] | used[2 * n + geo.box_of[i]])
+
+def _propagate(geo: _Geometry, cells: List[int], used: List[int]) -> bool:
+    """Fill naked and hidden singles; return False on a contradiction."""
+    popcount = geo.popcount
+    changed = True
+    while changed:
+        changed = False
+        for i, value in enumerate(cells):
+            if value:
+                continue
+            cand = _candidates(geo, used, i)
+            if not cand:
+                return False
+            if popcount[cand] == 1:
+                _place(geo, cells, used, i, cand)
+                changed = True
+        if changed:
+            continue
+
+        for u, unit in enumerate(geo.units):
+            once = twice = 0
+            for i in unit:
+                if not cells[i]:
+                    cand = _candidates(geo, used, i)
+                    twice |= once & cand
+                    once |= cand
+            if (once | used[u]) != geo.full:
+                return False
+            hidden = once & ~twice
+            while hidden:
+                bit = hidden & -hidden
+                hidden ^= bit
+                for i in unit:
+                    if not cells[i] and _candidates(geo, used, i) & bit:
+                        _place(geo, cells, used, i, bit)
+                        changed = True
+                        break
+                else:
+                    return False
+    return True
+
+def _search(geo: _Geometry, cells: List[int], used: List[int], limit: int,
+            solutions: List[List[int]], rng: Optional[random.Random]):
+    if not _propagate(geo, cells, used):
+        return
+
+    best = -1
+    best_cand = 0
+    best_count = geo.n + 1
+    popcount = geo.popcount
+    for i, value in enumerate(cells):
+        if not value:
+            cand = _candidates(geo, used, i)
+            count = popcount[cand]
+            if count < best_count:
+                best, best_cand, best_count = i, cand, count
+                if count == 2:
+                    break
+    if best < 0:
+        solutions.append(cells)
+        return
+
+    digits = _digits(best_cand)
+    if rng is not None:
+        rng.shuffle(digits)
+    for digit in digits:
+        branch_cells = cells[:]
+        branch_used = used[:]
+        _place(geo, branch_cells, branch_used, best, 1 << digit)
+        _search(geo, branch_cells, branch_used, limit, solutions, rng)
+        if len(solutions) >= limit:
+            return
+
+def _to_grid(cells: List[int], n: int) -> Grid:
+    return [cells[r * n:(r + 1) * n] for r in range(n)]
+
+def find_conflicts(grid: Grid) -> List[Tuple[int, int]]:
+    """Cells whose value repeats in their row, column or box."""
+    n = len(grid)
+    geo = _geometry(n)
+    cells = [value for row in grid for value in row]
+    seen_once = [0] * (3 * n)
+    seen_twice = [0] * (3 * n)
+    for i, value in enumerate(cells):
+        if value:
+            bit = 1 << value
+            for u in (geo.row_of[i], n + geo.col_of[i], 2 * n + geo.box_of[i]):
+                seen_twice[u] |= seen_once[u] & bit
+                seen_once[u] |= bit
+    return [
+        (geo.row_of[i], geo.col_of[i]) for i, value in enumerate(cells)
+        if value and (seen_twice[geo.row_of[i]] | seen_twice[n + geo.col_of[i]]
+                      | seen_twice[2 * n + geo.box_of[i]]) & (1 << value)
+    ]
+
+def is_valid(grid: Grid) -> bool:
+    """True if no filled cell conflicts with another (empty cells allowed)."""
+    return _load(grid)[2] is not None
+
+def is_solved(grid: Grid) -> bool:
+    """True if the grid is completely and correctly filled."""
+    geo, cells, used = _load(grid)
+    return used is not None and all(cells) and all(mask == geo.full for mask in used)
+
+def check_cell_conflict(grid: Grid, value: int, row: int, col: int) -> List[Tuple[int, int]]:
+    """Server-side mirror of script.js `checkCellConflict`.
+
+    Returns the cells in the same row, column or box that already hold
+    `value` (the browser flashes these and the edited cell).
+    """
+    if not value:
+        return []
+    n = len(grid)
+    box_rows, box_cols = box_shape(n)
+    conflicts = [(row, cc) for cc in range(n) if cc != col and grid[row][cc] == value]
+    conflicts += [(rr, col) for rr in range(n) if rr != row and grid[rr][col] == value]
+    br = row // box_rows * box_rows
+    bc = col // box_cols * box_cols
+    for rr in range(br, br + box_rows):
+        for cc in range(bc, bc + box_cols):
+            if (rr, cc) != (row, col) and grid[rr][cc] == value and (rr, cc) not in conflicts:
+                conflicts.append((rr, cc))
+    return conflicts
+
+def check_sudoku_complete(grid: Grid) -> bool:
+    """Server-side mirror of script.js `checkSudokuComplete`.
+
+    Like the browser, this only checks that every cell is filled; use
+    is_solved() or check_submission() to also check the rules.
+    """
+    return all(value for row in grid for value in row)
+
+def check_submission(puzzle: Grid, answer: Grid) -> bool:
+    """True if `answer` is a correct solution that keeps every given of `puzzle`."""
+    if len(answer) != len(puzzle) or not is_solved(answer):
+        return False
+    return all(
+        given == 0 or given == value
+        for puzzle_row, answer_row in zip(puzzle, answer)
+        for given, value in zip(puzzle_row, answer_row)
+    )
+
+def solve(grid: Grid, rng: Optional[random.Random] = None) -> Optional[Grid]:
+    """Return a solution, or None if the puzzle has none.
+
+    With `rng`, candidates are tried in random order (used to generate
+    random full grids).
+    """
+    geo, cells, used = _load(grid)
+    if used is None:
+        return None
+    solutions: List[List[int]] = []
+    _search(geo, cells, used, 1, solutions, rng)
+    return _to_grid(solutions[0], geo.n) if solutions else None
+
+def count_solutions(grid: Grid, limit: int = 2) -> int:
+    """Count solutions, stopping at `limit` (2 is enough to test uniqueness)."""
+    geo, cells, used = _load(grid)
+    if used is None:
+        return 0
+    solutions: List[List[int]] = []
+    _search(geo, cells, used, limit, solutions, None)
+    return len(solutions)
+
+def has_unique_solution(grid: Grid) -> bool:
+    """True if the puzzle has exactly one solution."""
+    return count_solutions(grid, limit=2) == 1
+
+def analyze_puzzle(grid: Grid) -> Dict[str, Any]:
+    """Summary used by the tester and bulk checks."""
+    solutions = count_solutions(grid, limit=2)
+    return {
+        'size': len(grid),
+        'givens': sum(1 for row in grid for value in row if value),
+        'valid': is_valid(grid),
+        'solvable': solutions > 0,
+        'unique': solutions == 1
+    }
+
+# Target number of givens per difficulty for 9x9 puzzles
+DIFFICULTY_GIVENS: Dict[str, Tuple[int, int]] = {
+    'easy': (36, 40),
+    'medium': (30, 35),
+    'hard': (24, 29)
+}
+
+PACK_MAGIC = b'MWSP'
+PACK_VERSION = 1
+# magic, version, grid size, difficulty code, reserved, puzzle count
+PACK_HEADER = struct.Struct('<4sBBBBI')
+PACK_DIFFICULTIES = ['easy', 'medium', 'hard']
+
+def givens_range(difficulty: str, n: int = 9) -> Tuple[int, int]:
+    """Target givens for a difficulty, scaled from the 9x9 table to n x n."""
+    if difficulty not in DIFFICULTY_GIVENS:
+        raise ValueError(f"Unknown difficulty: {difficulty}")
+    lo, hi = DIFFICULTY_GIVENS[difficulty]
+    scale = (n * n) / 81
+    return max(1, round(lo * scale)), max(1, round(hi * scale))
+
+def generate_puzzle(rng: random.Random, difficulty: str = 'medium', n: int = 9,
+                    max_attempts: int = 20) -> Grid:
+    """Generate a puzzle with exactly one solution and a givens count in range.
+    
+    A random full grid is built with the solver, then cells are emptied in
+    random order, keeping each removal only if the puzzle stays unique,
+    until the target number of givens is reached.
+    """
+    lo, hi = givens_range(difficulty, n)
+    for _ in range(max_attempts):
+        target = rng.randint(lo, hi)
+        grid = solve([[0] * n for _ in range(n)], rng)
+        givens = n * n
+        order = list(range(n * n))
+        rng.shuffle(order)
+        for i in order:
+            if givens <= target:
+                break
+            row, col = divmod(i, n)
+            value = grid[row][col]
+            grid[row][col] = 0
+            if count_solutions(grid, limit=2) == 1:
+                givens -= 1
+            else:
+                grid[row][col] = value
+        if givens <= hi:
+            return grid
+    raise RuntimeError(f"Could not reach {hi} givens for a {difficulty} {n}x{n} puzzle")
+
+def puzzle_seed(seed: int, difficulty: str, n: int, index: int) -> str:
+    """Per-puzzle RNG seed, so a pack does not depend on how it was sharded."""
+    return f"{seed}:{difficulty}:{n}:{index}"
+
+def _generate_shard(seed: int, difficulty: str, n: int, start: int, stop: int) -> List[bytes]:
+    return [
+        pack_puzzle(generate_puzzle(random.Random(puzzle_seed(seed, difficulty, n, index)), difficulty, n))
+        for index in range(start, stop)
+    ]
+
+def generate_puzzles(count: int, difficulty: str = 'medium', n: int = 9, seed: int = 0,
+                     workers: int = 1, chunk_size: int = 16) -> List[bytes]:
+    """Generate `count` packed puzzles, sharded over `workers` processes.
+    
+    Output is identical for any worker count or chunk size.
+    """
+    shards = [(start, min(count, start + chunk_size)) for start in range(0, count, max(1, chunk_size))]
+    if workers <= 1:
+        return [puzzle for start, stop in shards for puzzle in _generate_shard(seed, difficulty, n, start, stop)]
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_generate_shard, seed, difficulty, n, start, stop) for start, stop in shards]
+        return [puzzle for future in futures for puzzle in future.result()]
+
+def pack_puzzle(grid: Grid) -> bytes:
+    """Pack a puzzle as one nibble per cell, high nibble first, row by row."""
+    cells = [value for row in grid for value in row]
+    if any(value > 15 for value in cells):
+        raise ValueError("Only grids up to 15x15 fit in a nibble pack")
+    if len(cells) % 2:
+        cells.append(0)
+    return bytes((cells[i] << 4) | cells[i + 1] for i in range(0, len(cells), 2))
+
+def unpack_puzzle(data: bytes, n: int = 9) -> Grid:
+    """Inverse of pack_puzzle()."""
+    cells = []
+    for byte in data:
+        cells.append(byte >> 4)
+        cells.append(byte & 0x0F)
+    return _to_grid(cells[:n * n], n)
+
+def write_puzzle_pack(path: str, puzzles: Sequence[bytes], difficulty: str, n: int = 9):
+    """Write packed puzzles to a binary pack file.
+    
+    Layout: a 12-byte little-endian header (b'MWSP', version, grid size,
+    difficulty code, reserved, puzzle count) followed by the puzzles, each
+    ceil(n*n/2) bytes (41 bytes for 9x9).
+    """
+    record_size = (n * n + 1) // 2
+    with open(path, 'wb') as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, n,
+                                 PACK_DIFFICULTIES.index(difficulty), 0, len(puzzles)))
+        for puzzle in puzzles:
+            if len(puzzle) != record_size:
+                raise ValueError(f"Packed puzzle must be {record_size} bytes")
+            f.write(puzzle)
+
+def read_puzzle_pack(path: str) -> Tuple[str, List[Grid]]:
+    """Read a pack written by write_puzzle_pack(); returns (difficulty, puzzles)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, n, difficulty, _, count = PACK_HEADER.unpack_from(data)
+    if magic != PACK_MAGIC or version != PACK_VERSION:
+        raise ValueError(f"{path} is not a MathWorld puzzle pack")
+    record_size = (n * n + 1) // 2
+    offset = PACK_HEADER.size
+    if len(data) != offset + count * record_size:
+        raise ValueError(f"{path} is truncated")
+    puzzles = [
+        unpack_puzzle(data[offset + i * record_size:offset + (i + 1) * record_size], n)
+        for i in range(count)
+    ]
+    return PACK_DIFFICULTIES[difficulty], puzzles
+
+def generate_puzzle_packs(output_dir: str, count: int, difficulties: Sequence[str] = PACK_DIFFICULTIES,
+                          n: int = 9, seed: int = 0, workers: int = 1) -> List[Dict[str, Any]]:
+    """Write one pack per difficulty and return throughput stats for each."""
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    results = []
+    for difficulty in difficulties:
+        start = time.perf_counter()
+        puzzles = generate_puzzles(count, difficulty, n, seed, workers)
+        elapsed = time.perf_counter() - start
+        path = Path(output_dir) / f"sudoku-{difficulty}.bin"
+        write_puzzle_pack(str(path), puzzles, difficulty, n)
+        results.append({
+            'difficulty': difficulty,
+            'path': str(path),
+            'puzzles': len(puzzles),
+            'seconds': elapsed,
+            'puzzles_per_second': len(puzzles) / elapsed if elapsed else 0.0
+        })
+    return results
+
+def main():
+    """Generate Sudoku puzzle packs from the command line."""
+    import argparse
+    parser = argparse.ArgumentParser(description="MathWorld Sudoku puzzle pack generator")
+    parser.add_argument('--count', type=int, default=100, help="puzzles per difficulty")
+    parser.add_argument('--difficulty', choices=PACK_DIFFICULTIES, action='append',
+                        help="difficulty to generate (repeatable, default: all)")
+    parser.add_argument('--size', type=int, default=9, choices=[4, 9])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--output-dir', default='puzzles')
+    args = parser.parse_args()
+    
+    print("🔢 MathWorld Sudoku Generator")
+    print("=" * 40)
+    print(f"Generating {args.count} {args.size}x{args.size} puzzles per difficulty "
+          f"with {args.workers} workers")
+    
+    results = generate_puzzle_packs(args.output_dir, args.count, args.difficulty or PACK_DIFFICULTIES,
+                                    args.size, args.seed, args.workers)
+    for row in results:
+        print(f"  {row['difficulty']:<7} {row['puzzles']:>6} puzzles {row['seconds']:7.2f}s "
+              f"{row['puzzles_per_second']:>8.1f} puzzles/s -> {row['path']}")
+
+if __name__ == "__main__":
+    main()
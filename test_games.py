@@ -9,15 +9,34 @@ Version: 1.0
 Date: 2025
 """
 
+import io
+import os
 import random
+import sys
 import time
-from typing import List, Dict, Any
+import traceback
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from typing import List, Dict, Any, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak RSS is then reported as None
+    resource = None
+
+import crossmath_solver
+import memory_simulator
+import sudoku_engine
 
 class MathWorldTester:
     """Test various mathematical concepts and game logic."""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.test_results = []
+        self.seed = seed
+        # Private RNG so runs are reproducible and never share global state
+        self.rng = random.Random(seed)
     
     def test_arithmetic_operations(self) -> Dict[str, Any]:
         """Test basic arithmetic operations."""
@@ -29,10 +48,11 @@ class MathWorldTester:
         for op in operations:
             results['operations'][op] = {'correct': 0, 'total': 0}
         
+        malformed = []
         for _ in range(20):  # Test 20 problems
-            a = random.randint(1, 50)
-            b = random.randint(1, 50)
-            op = random.choice(operations)
+            a = self.rng.randint(1, 50)
+            b = self.rng.randint(1, 50)
+            op = self.rng.choice(operations)
             
             if op == '+':
                 correct_answer = a + b
@@ -41,16 +61,20 @@ class MathWorldTester:
                     a, b = b, a  # Ensure positive result
                 correct_answer = a - b
             elif op == '*':
-                a = random.randint(2, 12)
-                b = random.randint(2, 12)
+                a = self.rng.randint(2, 12)
+                b = self.rng.randint(2, 12)
                 correct_answer = a * b
             else:  # division
-                correct_answer = random.randint(2, 12)
-                b = random.randint(2, 12)
+                correct_answer = self.rng.randint(2, 12)
+                b = self.rng.randint(2, 12)
                 a = correct_answer * b
             
+            # Players only ever get whole, non-negative answers
+            if correct_answer < 0 or (op == '/' and a % b):
+                malformed.append(f"{a} {op} {b}")
+            
             # Simulate user answer (random for testing)
-            user_answer = random.randint(1, 100)
+            user_answer = self.rng.randint(1, 100)
             
             results['total'] += 1
             results['operations'][op]['total'] += 1
@@ -66,6 +90,9 @@ class MathWorldTester:
             op_accuracy = (stats['correct'] / stats['total']) * 100
             print(f"   {op} Accuracy: {op_accuracy:.1f}%")
         
+        if malformed:
+            raise AssertionError(f"problems without a whole non-negative answer: {', '.join(malformed)}")
+        
         return results
     
     def test_sudoku_logic(self) -> Dict[str, Any]:
@@ -80,198 +107,153 @@ class MathWorldTester:
             [4, 3, 2, 1]
         ]
         
-        def is_valid_sudoku(grid):
-            """Check if a Sudoku grid is valid."""
-            n = len(grid)
-            
-            # Check rows
-            for row in grid:
-                if len(set(row)) != n:
-                    return False
-            
-            # Check columns
-            for col in range(n):
-                column = [grid[row][col] for row in range(n)]
-                if len(set(column)) != n:
-                    return False
-            
-            # Check subgrids (for 4x4, check 2x2 subgrids)
-            if n == 4:
-                for i in range(0, n, 2):
-                    for j in range(0, n, 2):
-                        subgrid = []
-                        for x in range(2):
-                            for y in range(2):
-                                subgrid.append(grid[i+x][j+y])
-                        if len(set(subgrid)) != 4:
-                            return False
-            
-            return True
-        
-        is_valid = is_valid_sudoku(grid)
+        failures = []
+        is_valid = sudoku_engine.is_solved(grid)
         print(f"   Valid Sudoku: {'✅' if is_valid else '❌'}")
+        if not is_valid:
+            failures.append("solved 4x4 grid rejected")
+        
+        # Check the browser puzzles server-side: solvable, unique, and the
+        # solver's answer must pass the same checks as a player submission
+        puzzles = {}
+        for difficulty, puzzle in sudoku_engine.BROWSER_PUZZLES.items():
+            start_time = time.perf_counter()
+            analysis = sudoku_engine.analyze_puzzle(puzzle)
+            solution = sudoku_engine.solve(puzzle)
+            analysis['solved'] = solution is not None and sudoku_engine.check_submission(puzzle, solution)
+            analysis['solve_ms'] = round((time.perf_counter() - start_time) * 1000, 2)
+            puzzles[difficulty] = analysis
+            unique_note = 'unique' if analysis['unique'] else 'multiple solutions'
+            print(f"   {difficulty.title()} puzzle: {'✅' if analysis['solved'] else '❌'} "
+                  f"{analysis['givens']} givens, {unique_note} ({analysis['solve_ms']} ms)")
+            if not analysis['solved']:
+                failures.append(f"{difficulty} puzzle not solved")
+        
+        # Larger boards: build a random full 16x16 grid from an empty one
+        start_time = time.perf_counter()
+        large_grid = sudoku_engine.solve([[0] * 16 for _ in range(16)], self.rng)
+        large_ok = large_grid is not None and sudoku_engine.is_solved(large_grid)
+        print(f"   16x16 Grid: {'✅' if large_ok else '❌'} "
+              f"({(time.perf_counter() - start_time) * 1000:.1f} ms)")
+        if not large_ok:
+            failures.append("no valid 16x16 grid built")
+        if failures:
+            raise AssertionError("; ".join(failures))
         
-        return {'valid': is_valid, 'grid_size': len(grid)}
+        return {
+            'valid': is_valid,
+            'grid_size': len(grid),
+            'puzzles': puzzles,
+            'large_grid_valid': large_ok
+        }
     
     def test_memory_game_logic(self) -> Dict[str, Any]:
         """Test memory game logic."""
         print("\n🧠 Testing Memory Game Logic...")
         
-        # Create a 4x4 memory grid
-        symbols = ['★', '●', '▲', '■', '♦', '♠', '♥', '♣']
-        memory_grid = (symbols + symbols)  # Create pairs
-        random.shuffle(memory_grid)
-        
-        # Simulate memory game
-        flipped_cards = []
-        matched_pairs = 0
-        moves = 0
-        
-        # Simulate random card flipping
-        for _ in range(16):  # Maximum possible moves
-            if len(flipped_cards) < 2:
-                # Flip a random card
-                card_index = random.randint(0, 15)
-                if card_index not in flipped_cards:
-                    flipped_cards.append(card_index)
-                    moves += 1
-            else:
-                # Check for match
-                card1, card2 = flipped_cards
-                if memory_grid[card1] == memory_grid[card2]:
-                    matched_pairs += 1
-                    if matched_pairs == 8:  # All pairs found
-                        break
-                flipped_cards = []
-        
-        efficiency = (matched_pairs / moves) * 100 if moves > 0 else 0
-        print(f"   Pairs Found: {matched_pairs}/8")
-        print(f"   Total Moves: {moves}")
-        print(f"   Efficiency: {efficiency:.1f}%")
+        # Simulate many 4x4 games (8 pairs, as in the browser) per player model
+        games = 20000
+        seed = self.rng.randrange(2 ** 32)
+        models = {}
+        for index, model in enumerate(memory_simulator.MODELS):
+            moves = memory_simulator.simulate(model, 4, 4, games, seed=[seed, index])
+            models[model] = memory_simulator.summarize(moves, 8)
+            moves_stats = models[model]['moves']
+            print(f"   {model.title():<8} Moves: mean {moves_stats['mean']:.1f} "
+                  f"(p10 {moves_stats['p10']:.0f}, p90 {moves_stats['p90']:.0f}), "
+                  f"Efficiency: {models[model]['efficiency']['mean']:.1f}%")
+        
+        # Headline numbers are the random player's averages
+        random_stats = models['random']
+        efficiency = random_stats['efficiency']['mean']
+        print(f"   Games Simulated: {games} per model")
+        
+        # Every game needs at least two flips per pair, and remembering more
+        # cards can only help on average
+        failures = [f"{model} game finished in {min(stats['moves_histogram'])} moves"
+                    for model, stats in models.items() if min(stats['moves_histogram']) < 16]
+        means = [models[model]['moves']['mean'] for model in ('perfect', 'window', 'random')]
+        if means != sorted(means):
+            failures.append(f"mean moves not ordered perfect <= window <= random: {means}")
+        if failures:
+            raise AssertionError("; ".join(failures))
         
         return {
-            'matched_pairs': matched_pairs,
-            'total_moves': moves,
-            'efficiency': efficiency
+            'matched_pairs': 8,
+            'total_moves': random_stats['moves']['mean'],
+            'efficiency': efficiency,
+            'games': games,
+            'models': models
         }
     
     def test_crossmath_logic(self) -> Dict[str, Any]:
         """Test CrossMath game logic."""
         print("\n🧮 Testing CrossMath Logic...")
         
-        # Test the CrossMath equations
-        # A + B = 15, C - D = 3, 12 + 8 = E
-        # A + C = 12, B - D = 8
-        
-        # Solve the system of equations
-        # From A + C = 12 and C - D = 3, we get C = 3 + D
-        # So A + (3 + D) = 12, which means A = 9 - D
-        # From A + B = 15, we get (9 - D) + B = 15, so B = 6 + D
-        # From B - D = 8, we get (6 + D) - D = 8, so 6 = 8 (impossible!)
-        
-        # Let's try a different approach
-        # Let's say D = 1, then C = 4, A = 8, B = 7, E = 20
-        # Check: A + B = 8 + 7 = 15 ✓
-        # Check: C - D = 4 - 1 = 3 ✓
-        # Check: 12 + 8 = 20 ✓
-        # Check: A + C = 8 + 4 = 12 ✓
-        # Check: B - D = 7 - 1 = 6 ≠ 8 ❌
-        
-        # Let's try D = 2, then C = 5, A = 7, B = 8, E = 20
-        # Check: A + B = 7 + 8 = 15 ✓
-        # Check: C - D = 5 - 2 = 3 ✓
-        # Check: 12 + 8 = 20 ✓
-        # Check: A + C = 7 + 5 = 12 ✓
-        # Check: B - D = 8 - 2 = 6 ≠ 8 ❌
-        
-        # Let's try D = 0, then C = 3, A = 9, B = 6, E = 20
-        # Check: A + B = 9 + 6 = 15 ✓
-        # Check: C - D = 3 - 0 = 3 ✓
-        # Check: 12 + 8 = 20 ✓
-        # Check: A + C = 9 + 3 = 12 ✓
-        # Check: B - D = 6 - 0 = 6 ≠ 8 ❌
-        
-        # The system seems to have no solution. Let me check the original equations again.
-        # Actually, let me try: A=7, B=8, C=5, D=2, E=20
-        # A + B = 7 + 8 = 15 ✓
-        # C - D = 5 - 2 = 3 ✓
-        # 12 + 8 = 20 ✓
-        # A + C = 7 + 5 = 12 ✓
-        # B - D = 8 - 2 = 6 ≠ 8 ❌
-        
-        # Let me try: A=6, B=9, C=6, D=3, E=20
-        # A + B = 6 + 9 = 15 ✓
-        # C - D = 6 - 3 = 3 ✓
-        # 12 + 8 = 20 ✓
-        # A + C = 6 + 6 = 12 ✓
-        # B - D = 9 - 3 = 6 ≠ 8 ❌
-        
-        # I think there might be an error in the original equations.
-        # Let me try: A=5, B=10, C=7, D=4, E=20
-        # A + B = 5 + 10 = 15 ✓
-        # C - D = 7 - 4 = 3 ✓
-        # 12 + 8 = 20 ✓
-        # A + C = 5 + 7 = 12 ✓
-        # B - D = 10 - 4 = 6 ≠ 8 ❌
-        
-        # Let me try: A=4, B=11, C=8, D=5, E=20
-        # A + B = 4 + 11 = 15 ✓
-        # C - D = 8 - 5 = 3 ✓
-        # 12 + 8 = 20 ✓
-        # A + C = 4 + 8 = 12 ✓
-        # B - D = 11 - 5 = 6 ≠ 8 ❌
-        
-        # I think the issue is with the last equation. Let me try: A=3, B=12, C=9, D=6, E=20
-        # A + B = 3 + 12 = 15 ✓
-        # C - D = 9 - 6 = 3 ✓
-        # 12 + 8 = 20 ✓
-        # A + C = 3 + 9 = 12 ✓
-        # B - D = 12 - 6 = 6 ≠ 8 ❌
-        
-        # Let me try: A=2, B=13, C=10, D=7, E=20
-        # A + B = 2 + 13 = 15 ✓
-        # C - D = 10 - 7 = 3 ✓
-        # 12 + 8 = 20 ✓
-        # A + C = 2 + 10 = 12 ✓
-        # B - D = 13 - 7 = 6 ≠ 8 ❌
-        
-        # Let me try: A=1, B=14, C=11, D=8, E=20
-        # A + B = 1 + 14 = 15 ✓
-        # C - D = 11 - 8 = 3 ✓
-        # 12 + 8 = 20 ✓
-        # A + C = 1 + 11 = 12 ✓
-        # B - D = 14 - 8 = 6 ≠ 8 ❌
-        
-        # I think there's an error in the original CrossMath equations.
-        # Let me create a corrected version:
-        # A + B = 15, C - D = 3, 12 + 8 = E
-        # A + C = 12, B - D = 6 (changed from 8 to 6)
-        
-        # Now: A=6, B=9, C=6, D=3, E=20
-        # A + B = 6 + 9 = 15 ✓
-        # C - D = 6 - 3 = 3 ✓
-        # 12 + 8 = 20 ✓
-        # A + C = 6 + 6 = 12 ✓
-        # B - D = 9 - 3 = 6 ✓
-        
-        solution = {'A': 6, 'B': 9, 'C': 6, 'D': 3, 'E': 20}
-        
-        # Verify solution
-        equations_valid = (
-            solution['A'] + solution['B'] == 15 and
-            solution['C'] - solution['D'] == 3 and
-            12 + 8 == solution['E'] and
-            solution['A'] + solution['C'] == 12 and
-            solution['B'] - solution['D'] == 6  # Corrected equation
-        )
-        
-        print(f"   Solution Found: {'✅' if equations_valid else '❌'}")
-        if equations_valid:
-            print(f"   A={solution['A']}, B={solution['B']}, C={solution['C']}, D={solution['D']}, E={solution['E']}")
+        # The original CrossMath system: from A + C = 12 and C - D = 3 we get
+        # A = 9 - D, then A + B = 15 gives B = 6 + D, so B - D = 8 can never hold.
+        # The solver must flag it as broken instead of us guessing assignments.
+        original = ["A + B = 15", "C - D = 3", "12 + 8 = E", "A + C = 12", "B - D = 8"]
+        failures = []
+        original_result = crossmath_solver.solve_equations(original)
+        flagged = not original_result.solvable
+        print(f"   Broken Puzzle Flagged: {'✅' if flagged else '❌'} ({original_result.status})")
+        if not flagged:
+            failures.append(f"broken puzzle reported as {original_result.status}")
+        
+        # Corrected system (B - D = 6): every solution over 0..99
+        corrected = original[:-1] + ["B - D = 6"]
+        result = crossmath_solver.solve_equations(corrected)
+        solution = result.solutions[0] if result.solutions else None
+        print(f"   Solution Found: {'✅' if solution else '❌'} "
+              f"({len(result.solutions)} solutions, {result.elapsed * 1000:.2f} ms)")
+        if solution:
+            print("   " + ", ".join(f"{name}={value}" for name, value in solution.items()))
+        else:
+            failures.append(f"corrected puzzle has no solution ({result.status})")
+        
+        # A full grid as the game lays it out ('?' cells are unknowns 1-9)
+        grid = [
+            ['?', '*', '5', '+', '3', '=', '28'],
+            ['+', '', '*', '', '*', '', ''],
+            ['?', '*', '?', '-', '?', '=', '8'],
+            ['+', '', '-', '', '+', '', ''],
+            ['?', '+', '3', '-', '?', '=', '4'],
+            ['=', '', '=', '', '=', '', ''],
+            ['12', '', '12', '', '14', '', '']
+        ]
+        grid_result = crossmath_solver.solve_grid(grid, min_value=1, max_value=9)
+        print(f"   Grid Puzzle: {'✅' if grid_result.unique else '❌'} {grid_result.status} "
+              f"({grid_result.elapsed * 1000:.2f} ms)")
+        if not grid_result.unique:
+            failures.append(f"grid puzzle is {grid_result.status}, expected a unique solution")
+        
+        # random_grid() hides numbers of a filled grid, so every grid it builds is
+        # solvable, including ones whose intermediates exceed the solver's max_span
+        # (size 8 seed 2 and size 15 seed 21)
+        cases = [(seed, 8) for seed in range(40)] + [(21, 15)]
+        unsolved = []
+        for seed, size in cases:
+            random_grid = crossmath_solver.random_grid(random.Random(seed), size=size)
+            found = crossmath_solver.solve_grid(random_grid, limit=2, min_value=1, max_value=9).solutions
+            equations = crossmath_solver.equations_from_grid(random_grid)
+            if not found or not all(_satisfies(equations, values) for values in found):
+                unsolved.append((seed, size))
+        print(f"   Random Grids: {'✅' if not unsolved else '❌'} "
+              f"{len(cases) - len(unsolved)}/{len(cases)} solved")
+        if unsolved:
+            failures.append(f"random_grid() puzzles without a valid solution (seed, size): {unsolved}")
+        if failures:
+            raise AssertionError("; ".join(failures))
         
         return {
-            'solution_found': equations_valid,
-            'solution': solution if equations_valid else None
+            'solution_found': solution is not None,
+            'solution': solution,
+            'solution_count': len(result.solutions),
+            'original_flagged': flagged,
+            'grid_unique': grid_result.unique,
+            'grid_solution': grid_result.solutions[0] if grid_result.solutions else None,
+            'random_grids_solved': len(cases)
         }
     
     def run_all_tests(self) -> Dict[str, Any]:
@@ -296,6 +278,7 @@ class MathWorldTester:
             'memory': memory_results,
             'crossmath': crossmath_results,
             'execution_time': end_time - start_time,
+            'seed': self.seed,
             'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
         }
         
@@ -310,10 +293,161 @@ class MathWorldTester:
         
         return all_results
 
+RESULTS_SCHEMA_VERSION = 1
+
+def _satisfies(equations: List[List[Any]], values: Dict[str, int]) -> bool:
+    """Whether a CrossMath solution makes every equation true."""
+    for tokens in equations:
+        tokens = [values.get(token, token) if isinstance(token, str) else token for token in tokens]
+        split = tokens.index('=')
+        if crossmath_solver.evaluate(tokens[:split]) != crossmath_solver.evaluate(tokens[split + 1:]):
+            return False
+    return True
+
+def _peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak  # macOS reports bytes
+
+def _time_stats(samples: List[float]) -> Dict[str, float]:
+    return {'min': min(samples), 'mean': sum(samples) / len(samples), 'max': max(samples)}
+
+def _run_test_case(method: str, seed: Optional[int], repeat: int, trace_memory: bool) -> Dict[str, Any]:
+    """Run one test method `repeat` times on fresh testers and measure it.
+    
+    Allocations are traced in an extra run so tracemalloc's overhead does not
+    leak into the timings.
+    """
+    output = io.StringIO()
+    wall_times, cpu_times = [], []
+    record: Dict[str, Any] = {'method': method, 'status': 'passed', 'error': None, 'runs': repeat}
+    try:
+        with redirect_stdout(output):
+            for _ in range(repeat):
+                tester = MathWorldTester(seed=seed)
+                wall_start, cpu_start = time.perf_counter(), time.process_time()
+                result = getattr(tester, method)()
+                cpu_times.append(time.process_time() - cpu_start)
+                wall_times.append(time.perf_counter() - wall_start)
+            record['peak_rss_kb'] = _peak_rss_kb()
+        if trace_memory:
+            # The traced run's output (and its inflated timings) is discarded
+            with redirect_stdout(io.StringIO()):
+                tracemalloc.start()
+                try:
+                    getattr(MathWorldTester(seed=seed), method)()
+                    record['traced_peak_bytes'] = tracemalloc.get_traced_memory()[1]
+                    record['allocated_blocks'] = sum(stat.count for stat in
+                                                     tracemalloc.take_snapshot().statistics('filename'))
+                finally:
+                    tracemalloc.stop()
+        record['result'] = result
+    except Exception:
+        record.update({'status': 'error', 'error': traceback.format_exc(), 'result': None})
+    record.setdefault('peak_rss_kb', _peak_rss_kb())
+    record.setdefault('traced_peak_bytes', None)
+    record.setdefault('allocated_blocks', None)
+    record['wall_time'] = _time_stats(wall_times) if wall_times else None
+    record['cpu_time'] = _time_stats(cpu_times) if cpu_times else None
+    record['output'] = output.getvalue()
+    return record
+
+class MathWorldTestRunner:
+    """Run every MathWorldTester.test_* method in parallel with per-test metrics.
+    
+    Each test runs in its own worker process on a fresh tester seeded with
+    `seed`, so results do not depend on test order or on the worker count.
+    """
+    
+    def __init__(self, seed: Optional[int] = None, workers: Optional[int] = None, repeat: int = 1,
+                 trace_memory: bool = True):
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.repeat = max(1, repeat)
+        self.trace_memory = trace_memory
+    
+    @staticmethod
+    def discover_tests() -> List[str]:
+        """Names of the test methods, in definition order."""
+        return [name for name, value in vars(MathWorldTester).items()
+                if name.startswith('test_') and callable(value)]
+    
+    def _pool(self) -> ProcessPoolExecutor:
+        try:
+            # A fresh process per test keeps peak RSS per test
+            return ProcessPoolExecutor(max_workers=self.workers, max_tasks_per_child=1)
+        except TypeError:  # Python < 3.11: workers are reused and RSS peaks carry over
+            return ProcessPoolExecutor(max_workers=self.workers)
+    
+    def run(self, tests: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Run the tests and return results in the test_results.json schema."""
+        tests = tests or self.discover_tests()
+        print(f"🚀 Running {len(tests)} MathWorld tests on {self.workers} workers "
+              f"({self.repeat} run{'s' if self.repeat > 1 else ''} each)...")
+        print("=" * 50)
+        
+        start_time = time.perf_counter()
+        records = {}
+        with self._pool() as pool:
+            futures = {pool.submit(_run_test_case, name, self.seed, self.repeat, self.trace_memory): name
+                       for name in tests}
+            for future in as_completed(futures):
+                record = future.result()
+                records[futures[future]] = record
+                print(record.pop('output'), end='')
+                if record['error']:
+                    print(f"   ❌ {record['method']} failed:\n{record['error']}")
+        
+        return {
+            'schema_version': RESULTS_SCHEMA_VERSION,
+            'seed': self.seed,
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'workers': self.workers,
+            'repeat': self.repeat,
+            'execution_time': time.perf_counter() - start_time,
+            'tests': {name[len('test_'):]: records[name] for name in tests}
+        }
+    
+    @staticmethod
+    def print_metrics(results: Dict[str, Any]):
+        """Print the per-test metrics table."""
+        print("\n📊 Test Metrics:")
+        print(f"{'test':<22} {'status':<7} {'wall ms':>9} {'cpu ms':>9} {'peak RSS MB':>12} {'traced KB':>10} {'blocks':>9}")
+        for name, record in results['tests'].items():
+            wall = f"{record['wall_time']['mean'] * 1000:.1f}" if record['wall_time'] else '-'
+            cpu = f"{record['cpu_time']['mean'] * 1000:.1f}" if record['cpu_time'] else '-'
+            rss = f"{record['peak_rss_kb'] / 1024:.1f}" if record['peak_rss_kb'] is not None else '-'
+            traced = f"{record['traced_peak_bytes'] / 1024:.0f}" if record['traced_peak_bytes'] is not None else '-'
+            blocks = record['allocated_blocks'] if record['allocated_blocks'] is not None else '-'
+            print(f"{name:<22} {record['status']:<7} {wall:>9} {cpu:>9} {rss:>12} {traced:>10} {blocks:>9}")
+        print(f"Total Execution Time: {results['execution_time']:.2f} seconds")
+
 def main():
     """Main function to run the tests."""
-    tester = MathWorldTester()
-    results = tester.run_all_tests()
+    import argparse
+    parser = argparse.ArgumentParser(description="MathWorld Games Tester")
+    parser.add_argument('--seed', type=int, help="seed for reproducible runs")
+    parser.add_argument('--workers', type=int, help="worker processes (default: CPU count)")
+    parser.add_argument('--repeat', type=int, default=1, help="timed runs per test")
+    parser.add_argument('--no-trace-memory', action='store_true', help="skip the tracemalloc run")
+    parser.add_argument('--sequential', action='store_true',
+                        help="run the tests in this process with run_all_tests() (no metrics)")
+    args = parser.parse_args()
+    
+    failed = []
+    if args.sequential:
+        try:
+            results = MathWorldTester(seed=args.seed).run_all_tests()
+        except AssertionError as e:
+            print(f"\n❌ Test failed: {e}")
+            sys.exit(1)
+    else:
+        runner = MathWorldTestRunner(seed=args.seed, workers=args.workers, repeat=args.repeat,
+                                     trace_memory=not args.no_trace_memory)
+        results = runner.run()
+        runner.print_metrics(results)
+        failed = [name for name, record in results['tests'].items() if record['status'] != 'passed']
     
     # Save results to file
     import json
@@ -321,6 +455,9 @@ def main():
         json.dump(results, f, indent=2)
     
     print(f"\n💾 Test results saved to 'test_results.json'")
+    if failed:
+        print(f"❌ {len(failed)} of {len(results['tests'])} tests failed: {', '.join(failed)}")
+        sys.exit(1)
     print("🎉 All tests completed successfully!")
 
 if __name__ == "__main__":
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+MathWorld Translations
+======================
+Loads the `translations` object of script.js into a per-language lookup
+index, checks every language against a reference language and exports
+one file per language so the front end can load only the active one.
+
+Keys and strings are interned: every language shares one key table and one
+pool of distinct strings, and each language is a column of string codes
+(-1 where the key is missing).  Missing and extra keys are set differences
+against the reference language (English by default).
+
+Author: A.Cherifi
+Version: 1.0
+Date: 2025
+"""
+
+import hashlib
+import json
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Set
+
+SLICE_SCHEMA_VERSION = 1
+DEFAULT_REFERENCE = 'en'
+MANIFEST_NAME = "translations.manifest.json"
+
+class TranslationIndex:
+    """Interned key -> string index for every language."""
+
+    def __init__(self, tables: Dict[str, Dict[str, Any]], reference: Optional[str] = None):
+        if not tables:
+            raise ValueError("No translations to index")
+        self.reference = reference or (DEFAULT_REFERENCE if DEFAULT_REFERENCE in tables else next(iter(tables)))
+        if self.reference not in tables:
+            raise ValueError(f"Reference language {self.reference!r} has no translations")
+        self.languages: List[str] = list(tables)
+        self.keys: List[str] = []
+        self.strings: List[str] = []
+        self._key_index: Dict[str, int] = {}
+        self._string_index: Dict[str, int] = {}
+        self._columns: Dict[str, array] = {}
+
+        # The reference language's keys come first, in source order
+        ordered = [self.reference] + [language for language in self.languages if language != self.reference]
+        for language in ordered:
+            table = tables[language]
+            if not isinstance(table, dict):
+                raise ValueError(f"Translations for {language!r} are not an object")
+            for key in table:
+                if key not in self._key_index:
+                    self._key_index[key] = len(self.keys)
+                    self.keys.append(sys.intern(key))
+        for language in ordered:
+            column = array('i', [-1]) * len(self.keys)
+            for key, value in tables[language].items():
+                if not isinstance(value, str):
+                    raise ValueError(f"Translation {language}.{key} is not a string")
+                column[self._key_index[key]] = self._intern(value)
+            self._columns[language] = column
+
+    def _intern(self, text: str) -> int:
+        code = self._string_index.get(text)
+        if code is None:
+            code = self._string_index[text] = len(self.strings)
+            self.strings.append(text)
+        return code
+
+    @classmethod
+    def from_parsed(cls, parsed: Any, reference: Optional[str] = None) -> 'TranslationIndex':
+        """Index the translations of a js_parser.ParsedScript."""
+        return cls(parsed.translations, reference)
+
+    @classmethod
+    def from_script(cls, path: str, reference: Optional[str] = None) -> 'TranslationIndex':
+        """Parse a script.js file and index its translations."""
+        from js_parser import parse_script_file
+        return cls.from_parsed(parse_script_file(path), reference)
+
+    @classmethod
+    def from_catalog(cls, catalog: Any, reference: Optional[str] = None) -> 'TranslationIndex':
+        """Index the translations of a compiled game_catalog.GameCatalog."""
+        return cls({language: catalog.translations(language) for language in catalog.languages()}, reference)
+
+    def __contains__(self, language: str) -> bool:
+        return language in self._columns
+
+    def get(self, language: str, key: str, fallback: bool = True) -> Optional[str]:
+        """String for a key; falls back to the reference language when missing."""
+        index = self._key_index.get(key)
+        if index is None or language not in self._columns:
+            return None
+        code = self._columns[language][index]
+        if code < 0 and fallback:
+            code = self._columns[self.reference][index]
+        return self.strings[code] if code >= 0 else None
+
+    def key_set(self, language: str) -> Set[str]:
+        """Keys present in a language."""
+        column = self._columns[language]
+        return {key for key, code in zip(self.keys, column) if code >= 0}
+
+    def missing_keys(self, language: str) -> Set[str]:
+        """Reference keys the language does not translate."""
+        return self.key_set(self.reference) - self.key_set(language)
+
+    def extra_keys(self, language: str) -> Set[str]:
+        """Keys of the language that the reference does not have."""
+        return self.key_set(language) - self.key_set(self.reference)
+
+    def coverage(self) -> Dict[str, Dict[str, Any]]:
+        """Key count and sorted missing/extra keys per language."""
+        reference_keys = self.key_set(self.reference)
+        report = {}
+        for language in self.languages:
+            keys = self.key_set(language)
+            report[language] = {
+                'keys': len(keys),
+                'missing': sorted(reference_keys - keys),
+                'extra': sorted(keys - reference_keys)
+            }
+        return report
+
+    def slice(self, language: str, fallback: bool = False) -> Dict[str, str]:
+        """All strings of one language, in key order.
+
+        With `fallback` the reference string fills in missing keys, so the
+        slice can be served on its own.
+        """
+        if language not in self._columns:
+            raise KeyError(language)
+        column = self._columns[language]
+        reference = self._columns[self.reference]
+        result = {}
+        for key, code, reference_code in zip(self.keys, column, reference):
+            if code < 0 and fallback:
+                code = reference_code
+            if code >= 0:
+                result[key] = self.strings[code]
+        return result
+
+    def export_slices(self, output_dir: str, languages: Optional[Iterable[str]] = None,
+                      fallback: bool = True) -> Dict[str, Any]:
+        """Write one compact JSON file per language plus a manifest.
+
+        The manifest lists each file with its size and SHA-256, so the front
+        end can fetch only the active language and cache it by hash.
+        """
+        output = Path(output_dir)
+        output.mkdir(parents=True, exist_ok=True)
+        manifest = {'schema_version': SLICE_SCHEMA_VERSION, 'reference': self.reference, 'languages': {}}
+        for language in (languages or self.languages):
+            data = json.dumps(self.slice(language, fallback), ensure_ascii=False,
+                              separators=(',', ':')).encode('utf-8')
+            name = f"translations.{language}.json"
+            _write_atomic(output / name, data)
+            manifest['languages'][language] = {
+                'file': name,
+                'keys': len(self.key_set(language)),
+                'bytes': len(data),
+                'sha256': hashlib.sha256(data).hexdigest()
+            }
+        _write_atomic(output / MANIFEST_NAME, json.dumps(manifest, indent=2).encode('utf-8'))
+        return manifest
+
+    def stats(self) -> Dict[str, int]:
+        """Sizes of the interned tables."""
+        entries = sum(sum(1 for code in column if code >= 0) for column in self._columns.values())
+        return {'languages': len(self.languages), 'keys': len(self.keys),
+                'entries': entries, 'distinct_strings': len(self.strings)}
+
+def _write_atomic(path: Path, data: bytes):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def main():
+    """Report translation coverage and export per-language slices."""
+    import argparse
+    parser = argparse.ArgumentParser(description="MathWorld translations")
+    parser.add_argument('--script', default="script.js")
+    parser.add_argument('--reference', help=f"language the others are checked against (default {DEFAULT_REFERENCE})")
+    parser.add_argument('--export', metavar='DIR', help="write translations.<language>.json files and a manifest")
+    parser.add_argument('--no-fallback', action='store_true',
+                        help="leave missing keys out of exported slices instead of using the reference string")
+    parser.add_argument('--strict', action='store_true', help="exit with code 1 if any key is missing or extra")
+    args = parser.parse_args()
+
+    index = TranslationIndex.from_script(args.script, args.reference)
+    stats = index.stats()
+    print("🌐 MathWorld Translations")
+    print("=" * 40)
+    print(f"{stats['languages']} languages, {stats['keys']} keys, {stats['entries']} strings "
+          f"({stats['distinct_strings']} distinct); reference: {index.reference}")
+
+    incomplete = False
+    for language, report in index.coverage().items():
+        status = "✅" if not (report['missing'] or report['extra']) else "⚠️ "
+        print(f"  {status} {language}: {report['keys']} keys, {len(report['missing'])} missing, "
+              f"{len(report['extra'])} extra")
+        for label in ('missing', 'extra'):
+            if report[label]:
+                incomplete = True
+                print(f"      {label}: {', '.join(report[label][:10])}"
+                      + (f" (+{len(report[label]) - 10} more)" if len(report[label]) > 10 else ""))
+
+    if args.export:
+        manifest = index.export_slices(args.export, fallback=not args.no_fallback)
+        for language, entry in manifest['languages'].items():
+            print(f"💾 {args.export}/{entry['file']}: {entry['bytes']:,} bytes")
+    if args.strict and incomplete:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()